@@ -628,6 +628,35 @@ Item {
                         spacing: 0
                         visible: false
 
+                        // Обновление кнопок реле (регистр 1021) на всех вкладках: одно событие на чтение (маска битов реле),
+                        // одиночные сигналы - оптимистичные обновления из set* и состояния PID/Water Chiller из групповых чтений
+                        Connections {
+                            target: modbusManager
+                            function relayButtons(bit) {
+                                // Биты младшего байта регистра 1021: реле 1-6 (реле 7 OP cell heating кнопок не имеет)
+                                return [[relayWaterChiller, waterChillerPower], [relayMagnetPSU, magnetPSUPower],
+                                        [relayLaserPSU, laserPSUPower], [relayVacuumPump], [relayVacuumGauge],
+                                        [relayPIDController, pidControllerPower]][bit] || []
+                            }
+                            function setRelayButtons(bit, state) {
+                                var buttons = relayButtons(bit)
+                                for (var j = 0; j < buttons.length; j++) {
+                                    if (buttons[j].checked !== state) buttons[j].checked = state
+                                }
+                            }
+                            function onRelayStatesChanged(mask, states) {
+                                for (var i = 0; mask >> i; i++) {
+                                    if (mask & (1 << i)) setRelayButtons(i, (states & (1 << i)) !== 0)
+                                }
+                            }
+                            function onWaterChillerStateChanged(state) { setRelayButtons(0, state) }
+                            function onMagnetPSUStateChanged(state) { setRelayButtons(1, state) }
+                            function onLaserPSUStateChanged(state) { setRelayButtons(2, state) }
+                            function onVacuumPumpStateChanged(state) { setRelayButtons(3, state) }
+                            function onVacuumGaugeStateChanged(state) { setRelayButtons(4, state) }
+                            function onPidControllerStateChanged(state) { setRelayButtons(5, state) }
+                        }
+
                         // Water Chiller
                         Row {
                             width: parent.width
@@ -653,12 +682,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setWaterChiller(relayWaterChiller.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onWaterChillerStateChanged(state) {
-                                            if (relayWaterChiller.checked !== state) relayWaterChiller.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -690,12 +713,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setMagnetPSU(relayMagnetPSU.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onMagnetPSUStateChanged(state) {
-                                            if (relayMagnetPSU.checked !== state) relayMagnetPSU.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -727,12 +744,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setLaserPSU(relayLaserPSU.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onLaserPSUStateChanged(state) {
-                                            if (relayLaserPSU.checked !== state) relayLaserPSU.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -764,12 +775,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setVacuumPump(relayVacuumPump.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onVacuumPumpStateChanged(state) {
-                                            if (relayVacuumPump.checked !== state) relayVacuumPump.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -801,12 +806,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setVacuumGauge(relayVacuumGauge.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onVacuumGaugeStateChanged(state) {
-                                            if (relayVacuumGauge.checked !== state) relayVacuumGauge.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -838,12 +837,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setPIDController(relayPIDController.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onPidControllerStateChanged(state) {
-                                            if (relayPIDController.checked !== state) relayPIDController.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -898,6 +891,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 5 && valveX6.checked !== state) valveX6.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 5))) return
+                                            var state = (states & (1 << 5)) !== 0
+                                            if (valveX6.checked !== state) valveX6.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -935,6 +933,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 6 && valveX7.checked !== state) valveX7.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 6))) return
+                                            var state = (states & (1 << 6)) !== 0
+                                            if (valveX7.checked !== state) valveX7.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -972,6 +975,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 7 && valveX8.checked !== state) valveX8.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 7))) return
+                                            var state = (states & (1 << 7)) !== 0
+                                            if (valveX8.checked !== state) valveX8.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -1009,6 +1017,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 8 && valveX9.checked !== state) valveX9.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 8))) return
+                                            var state = (states & (1 << 8)) !== 0
+                                            if (valveX9.checked !== state) valveX9.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -1046,6 +1059,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 9 && valveX10.checked !== state) valveX10.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 9))) return
+                                            var state = (states & (1 << 9)) !== 0
+                                            if (valveX10.checked !== state) valveX10.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -1083,6 +1101,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 10 && valveX11.checked !== state) valveX11.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 10))) return
+                                            var state = (states & (1 << 10)) !== 0
+                                            if (valveX11.checked !== state) valveX11.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -1120,6 +1143,11 @@ Item {
                                         function onValveStateChanged(valveIndex, state) {
                                             if (valveIndex === 11 && valveX12.checked !== state) valveX12.checked = state
                                         }
+                                        function onValveStatesChanged(mask, states) {
+                                            if (!(mask & (1 << 11))) return
+                                            var state = (states & (1 << 11)) !== 0
+                                            if (valveX12.checked !== state) valveX12.checked = state
+                                        }
                                     }
                                 }
                             }
@@ -1138,6 +1166,27 @@ Item {
                         }
                         Rectangle { width: parent.width; height: 1; color: "#d0d0d0" }
 
+                        // Обновление кнопок вентиляторов: одно событие на чтение регистра 1131 (маска fanIndex)
+                        Connections {
+                            target: modbusManager
+                            function fanButton(fanIndex) {
+                                return [fanInlet1, fanInlet2, fanInlet3, fanInlet4, fanOutlet1, fanOutlet2,
+                                        fanOpCell1, fanOpCell2, fanOpCell3, fanOpCell4, fanLaser][fanIndex]
+                            }
+                            function onFanStatesChanged(mask, states) {
+                                for (var i = 0; mask >> i; i++) {
+                                    if (!(mask & (1 << i))) continue
+                                    var button = fanButton(i)
+                                    var state = (states & (1 << i)) !== 0
+                                    if (button && button.checked !== state) button.checked = state
+                                }
+                            }
+                            function onFanStateChanged(fanIndex, state) {
+                                var button = fanButton(fanIndex)
+                                if (button && button.checked !== state) button.checked = state
+                            }
+                        }
+
                         // Inlet Fan 1
                         Row {
                             width: parent.width
@@ -1163,12 +1212,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(0, fanInlet1.checked)  // fanIndex 0 = Inlet Fan 1
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 0 && fanInlet1.checked !== state) fanInlet1.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1200,12 +1243,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(1, fanInlet2.checked)  // fanIndex 1 = Inlet Fan 2
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 1 && fanInlet2.checked !== state) fanInlet2.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1237,12 +1274,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(2, fanInlet3.checked)  // fanIndex 2 = Inlet Fan 3
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 2 && fanInlet3.checked !== state) fanInlet3.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1274,12 +1305,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(3, fanInlet4.checked)  // fanIndex 3 = Inlet Fan 4
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 3 && fanInlet4.checked !== state) fanInlet4.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1311,12 +1336,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(4, fanOutlet1.checked)  // fanIndex 4 = Outlet Fan 1
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 4 && fanOutlet1.checked !== state) fanOutlet1.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1348,12 +1367,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(5, fanOutlet2.checked)  // fanIndex 5 = Outlet Fan 2
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 5 && fanOutlet2.checked !== state) fanOutlet2.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1385,12 +1398,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(6, fanOpCell1.checked)  // fanIndex 6 = OpCell Fan 1
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 6 && fanOpCell1.checked !== state) fanOpCell1.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1422,12 +1429,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(7, fanOpCell2.checked)  // fanIndex 7 = OpCell Fan 2
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 7 && fanOpCell2.checked !== state) fanOpCell2.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1459,12 +1460,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(8, fanOpCell3.checked)  // fanIndex 8 = OpCell Fan 3
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 8 && fanOpCell3.checked !== state) fanOpCell3.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1496,12 +1491,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(9, fanOpCell4.checked)  // fanIndex 9 = OpCell Fan 4
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 9 && fanOpCell4.checked !== state) fanOpCell4.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1533,12 +1522,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setFan(10, fanLaser.checked)  // fanIndex 10 = Laser Fan
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onFanStateChanged(fanIndex, state) {
-                                            if (fanIndex === 10 && fanLaser.checked !== state) fanLaser.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1672,12 +1655,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setLaserPSUPower(laserPSUPower.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onLaserPSUStateChanged(state) {
-                                            if (laserPSUPower.checked !== state) laserPSUPower.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1804,12 +1781,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setMagnetPSUPower(magnetPSUPower.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onMagnetPSUStateChanged(state) {
-                                            if (magnetPSUPower.checked !== state) magnetPSUPower.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -1956,12 +1927,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setPIDControllerPower(pidControllerPower.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onPidControllerStateChanged(state) {
-                                            if (pidControllerPower.checked !== state) pidControllerPower.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -5899,12 +5864,6 @@ Item {
                                     onClicked: {
                                         if (modbusManager) modbusManager.setWaterChillerPower(waterChillerPower.checked)
                                     }
-                                    Connections {
-                                        target: modbusManager
-                                        function onWaterChillerStateChanged(state) {
-                                            if (waterChillerPower.checked !== state) waterChillerPower.checked = state
-                                        }
-                                    }
                                 }
                             }
                             Rectangle { width: parent.width - parent.padding * 2 - 120 - 80 - 16; height: 0 }
@@ -259,6 +259,26 @@ Rectangle {
     }
 }
 
+    // Обновление кнопок вентиляторов: одно событие на чтение регистра 1131 (маска fanIndex)
+    Connections {
+        target: modbusManager
+        function fanButton(fanIndex) {
+            return [button4, button3, button2, button7, button6, button5, button10, button9, button8, button13, button12][fanIndex]
+        }
+        function onFanStatesChanged(mask, states) {
+            for (var i = 0; mask >> i; i++) {
+                if (!(mask & (1 << i))) continue
+                var button = fanButton(i)
+                var state = (states & (1 << i)) !== 0
+                if (button && button.checked !== state) button.checked = state
+            }
+        }
+        function onFanStateChanged(fanIndex, state) {
+            var button = fanButton(fanIndex)
+            if (button && button.checked !== state) button.checked = state
+        }
+    }
+
     Button {
         id: button2
         anchors.right: parent.right
@@ -291,19 +311,6 @@ Rectangle {
                 modbusManager.setFan(2, button2.checked)  // InLet Fan - 3
             }
         }
-        
-        // Синхронизация состояния с Modbus (только для обратной связи с устройством)
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 2) {
-                    // Обновляем только если состояние отличается (для синхронизации)
-                    if (button2.checked !== state) {
-                        button2.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -338,17 +345,6 @@ Rectangle {
                 modbusManager.setFan(1, button3.checked)  // InLet Fan - 2
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 1) {
-                    if (button3.checked !== state) {
-                        button3.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -383,17 +379,6 @@ Rectangle {
                 modbusManager.setFan(0, button4.checked)  // InLet Fan - 1
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 0) {
-                    if (button4.checked !== state) {
-                        button4.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -426,16 +411,6 @@ Rectangle {
                 modbusManager.setFan(5, button5.checked)  // OutLet Fan - 2
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 5) {
-                    if (button5.checked !== state) {
-                        button5.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -469,16 +444,6 @@ Rectangle {
                 modbusManager.setFan(4, button6.checked)  // OutLet Fan - 1
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 4) {
-                    if (button6.checked !== state) {
-                        button6.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -511,16 +476,6 @@ Rectangle {
                 modbusManager.setFan(3, button7.checked)  // InLet Fan - 4
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 3) {
-                    if (button7.checked !== state) {
-                        button7.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -553,16 +508,6 @@ Rectangle {
                 modbusManager.setFan(8, button8.checked)  // OpCell Fan - 3
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 8) {
-                    if (button8.checked !== state) {
-                        button8.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -595,16 +540,6 @@ Rectangle {
                 modbusManager.setFan(7, button9.checked)  // OpCell Fan - 2
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 7) {
-                    if (button9.checked !== state) {
-                        button9.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -637,16 +572,30 @@ Rectangle {
                 modbusManager.setFan(6, button10.checked)  // OpCell Fan - 1
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 6) {
-                    if (button10.checked !== state) {
-                        button10.checked = state
-                    }
-                }
+    }
+
+    // Обновление кнопок реле (регистр 1021): одно событие на чтение (маска битов реле),
+    // одиночные сигналы - оптимистичные обновления из set* и состояния PID/Water Chiller из групповых чтений
+    Connections {
+        target: modbusManager
+        function relayButton(bit) {
+            // Биты младшего байта регистра 1021: реле 1-6 (реле 7 OP cell heating кнопки не имеет)
+            return [button16, button14, button11, button19, button18, button15][bit]
+        }
+        function setRelayButton(button, state) {
+            if (button && button.checked !== state) button.checked = state
+        }
+        function onRelayStatesChanged(mask, states) {
+            for (var i = 0; mask >> i; i++) {
+                if (mask & (1 << i)) setRelayButton(relayButton(i), (states & (1 << i)) !== 0)
             }
         }
+        function onWaterChillerStateChanged(state) { setRelayButton(button16, state) }
+        function onMagnetPSUStateChanged(state) { setRelayButton(button14, state) }
+        function onLaserPSUStateChanged(state) { setRelayButton(button11, state) }
+        function onVacuumPumpStateChanged(state) { setRelayButton(button19, state) }
+        function onVacuumGaugeStateChanged(state) { setRelayButton(button18, state) }
+        function onPidControllerStateChanged(state) { setRelayButton(button15, state) }
     }
 
     Button {
@@ -679,16 +628,6 @@ Rectangle {
                 modbusManager.setLaserPSU(button11.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onLaserPSUStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button11.checked !== state) {
-                    button11.checked = state
-                }
-            }
-        }
     }
 
     Button {
@@ -721,16 +660,6 @@ Rectangle {
                 modbusManager.setFan(10, button12.checked)  // Laser Fans
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 10) {
-                    if (button12.checked !== state) {
-                        button12.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -763,16 +692,6 @@ Rectangle {
                 modbusManager.setFan(9, button13.checked)  // OpCell Fan - 4
             }
         }
-        Connections {
-            target: modbusManager
-            function onFanStateChanged(fanIndex, state) {
-                if (fanIndex === 9) {
-                    if (button13.checked !== state) {
-                        button13.checked = state
-                    }
-                }
-            }
-        }
     }
 
     Button {
@@ -805,16 +724,6 @@ Rectangle {
                 modbusManager.setMagnetPSU(button14.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onMagnetPSUStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button14.checked !== state) {
-                    button14.checked = state
-                }
-            }
-        }
     }
 
     Button {
@@ -846,16 +755,6 @@ Rectangle {
                 modbusManager.setPIDController(button15.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onPidControllerStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button15.checked !== state) {
-                    button15.checked = state
-                }
-            }
-        }
     }
 
     Button {
@@ -888,16 +787,6 @@ Rectangle {
                 modbusManager.setWaterChiller(button16.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onWaterChillerStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button16.checked !== state) {
-                    button16.checked = state
-                }
-            }
-        }
     }
 
     Button {
@@ -955,16 +844,6 @@ Rectangle {
                 modbusManager.setVacuumGauge(button18.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onVacuumGaugeStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button18.checked !== state) {
-                    button18.checked = state
-                }
-            }
-        }
     }
 
     Button {
@@ -998,16 +877,6 @@ Rectangle {
                 modbusManager.setVacuumPump(button19.checked)
             }
         }
-        
-        Connections {
-            target: modbusManager
-            function onVacuumPumpStateChanged(state) {
-                // Обновляем только если состояние отличается (для синхронизации)
-                if (button19.checked !== state) {
-                    button19.checked = state
-                }
-            }
-        }
     }
 
     Rectangle {
@@ -3039,6 +2908,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 9)) {
+                    var state = (states & (1 << 9)) !== 0
+                    if (button20.checked !== state) {
+                        button20.checked = state
+                    }
+                }
+            }
         }
     }
 
@@ -3087,6 +2964,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 7)) {
+                    var state = (states & (1 << 7)) !== 0
+                    if (button21.checked !== state) {
+                        button21.checked = state
+                    }
+                }
+            }
         }
     }
 
@@ -3237,6 +3122,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 8)) {
+                    var state = (states & (1 << 8)) !== 0
+                    if (button26.checked !== state) {
+                        button26.checked = state
+                    }
+                }
+            }
         }
     }
 
@@ -3309,6 +3202,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 5)) {
+                    var state = (states & (1 << 5)) !== 0
+                    if (button22.checked !== state) {
+                        button22.checked = state
+                    }
+                }
+            }
         }
     }
     Rectangle {
@@ -3402,6 +3303,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 10)) {
+                    var state = (states & (1 << 10)) !== 0
+                    if (button23.checked !== state) {
+                        button23.checked = state
+                    }
+                }
+            }
         }
     }
 
@@ -3518,6 +3427,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 11)) {
+                    var state = (states & (1 << 11)) !== 0
+                    if (button24.checked !== state) {
+                        button24.checked = state
+                    }
+                }
+            }
         }
     }
 
@@ -3565,6 +3482,14 @@ Rectangle {
                     }
                 }
             }
+            function onValveStatesChanged(mask, states) {
+                if (mask & (1 << 6)) {
+                    var state = (states & (1 << 6)) !== 0
+                    if (button25.checked !== state) {
+                        button25.checked = state
+                    }
+                }
+            }
         }
     }
 
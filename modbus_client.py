@@ -31,6 +31,16 @@ class ModbusClient:
         self.framer = framer
         self.client: Optional[ModbusTcpClient] = None
         self._connected = False
+        # Кэш готовых фреймов чтения: unit_id фиксирован на время жизни клиента,
+        # поэтому фрейм (вместе с CRC) для пары адрес/количество не меняется
+        self._read_frame_cache: dict = {}
+        # Последнее известное значение регистра 1131 (fans): (значение, time.monotonic()).
+        # Обновляется чтениями и записями 1131 в потоке ввода-вывода; позволяет set_fans_1131
+        # не читать регистр перед записью, пока значение свежее
+        self._fans_1131_shadow: Optional[tuple] = None
+    
+    # Сколько секунд значение 1131 из последнего чтения/записи считается актуальным для read-modify-write
+    FANS_1131_SHADOW_MAX_AGE_S = 1.0
     
     def connect(self) -> bool:
         """
@@ -47,6 +57,7 @@ class ModbusClient:
                 except:
                     pass
                 self.client = None
+            self._fans_1131_shadow = None
             
             # Создаем новый клиент
             # Для RTU over TCP может использоваться "socket" фреймер
@@ -145,6 +156,11 @@ class ModbusClient:
                                         elif hasattr(socket, 'TCP_KEEPALIVE'):
                                             # Для macOS используем TCP_KEEPALIVE (если доступен)
                                             sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, 2)
+                                            # Интервал и количество проб на macOS доступны не во всех версиях Python
+                                            if hasattr(socket, 'TCP_KEEPINTVL'):
+                                                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 2)
+                                            if hasattr(socket, 'TCP_KEEPCNT'):
+                                                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
                                             logger.info("TCP keep-alive настроен (macOS): используем TCP_KEEPALIVE")
                                         else:
                                             # На macOS без специальных опций keep-alive управляется системой
@@ -167,7 +183,6 @@ class ModbusClient:
                             logger.info(f"Успешно подключено к Modbus устройству {self.host}:{self.port} с фреймером '{actual_framer}'")
                             # Добавляем небольшую задержку после подключения, чтобы устройство успело инициализироваться
                             # Первый пакет может теряться, если отправить его сразу после подключения
-                            import time
                             time.sleep(0.2)  # 200ms задержка после подключения
                             logger.debug("Задержка после подключения завершена, готовы к работе")
                             return True
@@ -226,6 +241,7 @@ class ModbusClient:
         finally:
             self.client = None
             self._connected = False
+            self._fans_1131_shadow = None
     
     def is_connected(self) -> bool:
         """Проверка состояния подключения БЕЗ синхронных операций (для мгновенной проверки)"""
@@ -312,18 +328,13 @@ class ModbusClient:
             return False
         
         try:
-            logger.info(f"Запись в регистр {address} значение {value}, unit_id={self.unit_id}, framer={self.framer}")
-            # Проверяем, что сокет открыт перед записью
-            if not self.client.is_socket_open():
-                logger.error(f"Сокет закрыт перед записью в регистр {address}, требуется переподключение")
-                self._connected = False
-                return False
+            logger.info("Запись в регистр %s значение %s, unit_id=%s, framer=%s", address, value, self.unit_id, self.framer)
             
             # Для socket framer (Modbus RTU over TCP) unit_id должен быть указан
             # В документации указан Slave ID = 1, поэтому используем unit_id=1
             # Функция 06 (Write Single Register) используется по умолчанию в write_register
-            logger.debug(f"Попытка записи: address={address} (0x{address:04X}), value={value} (0x{value:04X}), device_id={self.unit_id}")
-            logger.info(f"Используется функция 06 (Write Single Register) для записи в регистр {address}")
+            logger.debug("Попытка записи: address=%s (0x%04X), value=%s (0x%04X), device_id=%s", address, address, value, value, self.unit_id)
+            logger.info("Используется функция 06 (Write Single Register) для записи в регистр %s", address)
             result = self.client.write_register(
                 address, 
                 value, 
@@ -341,9 +352,9 @@ class ModbusClient:
             
             # Проверяем, что запись действительно успешна
             if hasattr(result, 'function_code'):
-                logger.info(f"Успешно записано в регистр {address} значение {value}, function_code={result.function_code}")
+                logger.info("Успешно записано в регистр %s значение %s, function_code=%s", address, value, result.function_code)
             else:
-                logger.info(f"Успешно записано в регистр {address} значение {value}")
+                logger.info("Успешно записано в регистр %s значение %s", address, value)
             return True
         except Exception as e:
             error_str = str(e)
@@ -613,9 +624,28 @@ class ModbusClient:
         Returns:
             True если успешно, False в противном случае
         """
-        if relay_num < 1 or relay_num > 8:
-            logger.error(f"Номер реле должен быть от 1 до 8, получен {relay_num}")
-            return False
+        return self.set_relays_1021({relay_num: state})
+    
+    def set_relays_1021(self, relays: dict) -> bool:
+        """Установка состояния нескольких реле в регистре 1021 одним чтением и одной записью
+        
+        Args:
+            relays: словарь номер реле (1-8) -> состояние (True - включить, False - выключить)
+        
+        Returns:
+            True если успешно, False в противном случае
+        """
+        set_mask = 0
+        clear_mask = 0
+        for relay_num, state in relays.items():
+            if relay_num < 1 or relay_num > 8:
+                logger.error(f"Номер реле должен быть от 1 до 8, получен {relay_num}")
+                return False
+            bit_position = relay_num - 1  # Реле 1 -> бит 0
+            if state:
+                set_mask |= 1 << bit_position
+            else:
+                clear_mask |= 1 << bit_position
         
         # Читаем текущее состояние
         current_value = self.read_register_1021_direct()
@@ -623,17 +653,8 @@ class ModbusClient:
             logger.error("Не удалось прочитать текущее состояние регистра 1021")
             return False
         
-        current_low_byte = current_value & 0xFF
-        bit_position = relay_num - 1  # Реле 1 -> бит 0
-        
-        if state:
-            # Включаем реле - устанавливаем бит
-            new_low_byte = current_low_byte | (1 << bit_position)
-        else:
-            # Выключаем реле - сбрасываем бит
-            new_low_byte = current_low_byte & ~(1 << bit_position)
-        
-        # Формируем новое значение (старший байт оставляем как есть)
+        # Включаем/выключаем реле в младшем байте (старший байт оставляем как есть)
+        new_low_byte = ((current_value & 0xFF) | set_mask) & ~clear_mask
         new_value = (current_value & 0xFF00) | new_low_byte
         
         # Записываем новое значение
@@ -923,9 +944,8 @@ class ModbusClient:
             logger.error(f"Ошибка при чтении регистра 1511 через прямой сокет: {e}")
             return None
     
-    def _build_write_frame_1531(self, value: int) -> bytes:
-        """Формирование Modbus RTU фрейма для записи в регистр 1531 (функция 06)"""
-        address = 1531
+    def _build_write_frame(self, address: int, value: int) -> bytes:
+        """Формирование Modbus RTU фрейма для записи в регистр address (функция 06)"""
         addr_high = (address >> 8) & 0xFF
         addr_low = address & 0xFF
         value_high = (value >> 8) & 0xFF
@@ -937,11 +957,12 @@ class ModbusClient:
         crc_high = (crc >> 8) & 0xFF
         return frame + bytes([crc_low, crc_high])
     
-    def write_register_1531_direct(self, value: int) -> bool:
-        """Запись в регистр 1531 (установка температуры Water Chiller) через прямой сокет (функция 06)
+    def write_register_direct(self, address: int, value: int) -> bool:
+        """Запись в holding register через прямой сокет (функция 06), две попытки с проверкой эха ответа
         
         Args:
-            value: Значение для записи (температура * 100, например 2300 для 23.00°C)
+            address: Адрес регистра (например, 1241)
+            value: Значение для записи (setpoint * 100, например 2300 для 23.00)
         """
         if self.client is None or not self.client.is_socket_open():
             return False
@@ -963,12 +984,12 @@ class ModbusClient:
                     sock = transport._sock
             
             if sock is None:
-                logger.warning("Не удалось получить сокет для прямой записи в регистр 1531")
+                logger.warning("Не удалось получить сокет для прямой записи в регистр %s", address)
                 return False
             
             # Отправляем запрос дважды
-            write_frame = self._build_write_frame_1531(value)
-            logger.debug(f"Запись в регистр 1531: отправляем фрейм {write_frame.hex().upper()}")
+            write_frame = self._build_write_frame(address, value)
+            logger.debug(f"Запись в регистр {address}: отправляем фрейм {write_frame.hex().upper()}")
             success = False
             
             for i in range(2):
@@ -977,55 +998,49 @@ class ModbusClient:
                     time.sleep(0.01)  # Минимальная задержка для быстрой записи для избежания блокировки UI
                     resp = sock.recv(256)
                     if resp:
-                        logger.debug(f"Ответ на запись в регистр 1531 (попытка {i+1}): {resp.hex().upper()}")
+                        logger.debug(f"Ответ на запись в регистр {address} (попытка {i+1}): {resp.hex().upper()}")
                         if len(resp) >= 8:
                             # Проверяем, что ответ соответствует запросу
                             if resp[0] == self.unit_id and resp[1] == 6:
                                 # Проверяем, что адрес и значение совпадают
                                 resp_addr = (resp[2] << 8) | resp[3]
                                 resp_value = (resp[4] << 8) | resp[5]
-                                if resp_addr == 1531 and resp_value == value:
-                                    logger.debug(f"✅ Запись в регистр 1531 подтверждена: адрес={resp_addr}, значение={resp_value}")
+                                if resp_addr == address and resp_value == value:
+                                    logger.debug(f"✅ Запись в регистр {address} подтверждена: адрес={resp_addr}, значение={resp_value}")
                                     success = True
                                     break
                                 else:
-                                    logger.warning(f"Ответ не соответствует запросу: адрес={resp_addr} (ожидался 1531), значение={resp_value} (ожидалось {value})")
+                                    logger.warning(f"Ответ не соответствует запросу: адрес={resp_addr} (ожидался {address}), значение={resp_value} (ожидалось {value})")
                             else:
                                 logger.warning(f"Неожиданный ответ: unit_id={resp[0]}, функция={resp[1]}")
                         else:
                             logger.warning(f"Ответ слишком короткий: {len(resp)} байт")
                     else:
-                        logger.warning(f"Пустой ответ на запись в регистр 1531 (попытка {i+1})")
+                        logger.warning(f"Пустой ответ на запись в регистр {address} (попытка {i+1})")
                 except (ConnectionError, OSError) as e:
                     if i == 0:
-                        logger.debug(f"Первая попытка записи в регистр 1531 не удалась (это нормально): {e}")
+                        logger.debug(f"Первая попытка записи в регистр {address} не удалась (это нормально): {e}")
                     else:
-                        logger.error(f"Ошибка при записи в регистр 1531: {e}")
+                        logger.error(f"Ошибка при записи в регистр {address}: {e}")
                         raise
                 if i < 1:
                     time.sleep(0.05)  # Минимальная задержка между попытками для быстрой записи
             
             if not success:
-                logger.error(f"❌ Не удалось записать в регистр 1531 после 2 попыток")
+                logger.error(f"❌ Не удалось записать в регистр {address} после 2 попыток")
             
             return success
         except Exception as e:
-            logger.error(f"Ошибка при записи в регистр 1531 через прямой сокет: {e}")
+            logger.error(f"Ошибка при записи в регистр {address} через прямой сокет: {e}")
             return False
     
-    def _build_write_frame_1331(self, value: int) -> bytes:
-        """Формирование Modbus RTU фрейма для записи в регистр 1331 (функция 06)"""
-        address = 1331
-        addr_high = (address >> 8) & 0xFF
-        addr_low = address & 0xFF
-        value_high = (value >> 8) & 0xFF
-        value_low = value & 0xFF
+    def write_register_1531_direct(self, value: int) -> bool:
+        """Запись в регистр 1531 (установка температуры Water Chiller) через прямой сокет (функция 06)
         
-        frame = bytes([self.unit_id, 6, addr_high, addr_low, value_high, value_low])
-        crc = self._crc16_modbus(frame)
-        crc_low = crc & 0xFF
-        crc_high = (crc >> 8) & 0xFF
-        return frame + bytes([crc_low, crc_high])
+        Args:
+            value: Значение для записи (температура * 100, например 2300 для 23.00°C)
+        """
+        return self.write_register_direct(1531, value)
     
     def write_register_1331_direct(self, value: int) -> bool:
         """Запись в регистр 1331 (установка температуры Magnet PSU) через прямой сокет (функция 06)
@@ -1033,89 +1048,7 @@ class ModbusClient:
         Args:
             value: Значение для записи (температура * 100, например 2300 для 23.00°C)
         """
-        if self.client is None or not self.client.is_socket_open():
-            return False
-        
-        try:
-            # Получаем сокет из pymodbus клиента
-            sock = None
-            if hasattr(self.client, 'socket') and self.client.socket:
-                sock = self.client.socket
-            elif hasattr(self.client, 'transport'):
-                transport = self.client.transport
-                if hasattr(transport, 'socket') and transport.socket:
-                    sock = transport.socket
-                elif hasattr(transport, '_socket') and transport._socket:
-                    sock = transport._socket
-                elif hasattr(transport, 'sock') and transport.sock:
-                    sock = transport.sock
-                elif hasattr(transport, '_sock') and transport._sock:
-                    sock = transport._sock
-            
-            if sock is None:
-                logger.warning("Не удалось получить сокет для прямой записи в регистр 1331")
-                return False
-            
-            # Отправляем запрос дважды
-            write_frame = self._build_write_frame_1331(value)
-            logger.debug(f"Запись в регистр 1331: отправляем фрейм {write_frame.hex().upper()}")
-            success = False
-            
-            for i in range(2):
-                try:
-                    sock.sendall(write_frame)
-                    time.sleep(0.01)  # Минимальная задержка для быстрой записи для избежания блокировки UI
-                    resp = sock.recv(256)
-                    if resp:
-                        logger.debug(f"Ответ на запись в регистр 1331 (попытка {i+1}): {resp.hex().upper()}")
-                        if len(resp) >= 8:
-                            # Проверяем, что ответ соответствует запросу
-                            if resp[0] == self.unit_id and resp[1] == 6:
-                                # Проверяем, что адрес и значение совпадают
-                                resp_addr = (resp[2] << 8) | resp[3]
-                                resp_value = (resp[4] << 8) | resp[5]
-                                if resp_addr == 1331 and resp_value == value:
-                                    logger.debug(f"✅ Запись в регистр 1331 подтверждена: адрес={resp_addr}, значение={resp_value}")
-                                    success = True
-                                    break
-                                else:
-                                    logger.warning(f"Ответ не соответствует запросу: адрес={resp_addr} (ожидался 1331), значение={resp_value} (ожидалось {value})")
-                            else:
-                                logger.warning(f"Неожиданный ответ: unit_id={resp[0]}, функция={resp[1]}")
-                        else:
-                            logger.warning(f"Ответ слишком короткий: {len(resp)} байт")
-                    else:
-                        logger.warning(f"Пустой ответ на запись в регистр 1331 (попытка {i+1})")
-                except (ConnectionError, OSError) as e:
-                    if i == 0:
-                        logger.debug(f"Первая попытка записи в регистр 1331 не удалась (это нормально): {e}")
-                    else:
-                        logger.error(f"Ошибка при записи в регистр 1331: {e}")
-                        raise
-                if i < 1:
-                    time.sleep(0.05)  # Минимальная задержка между попытками для быстрой записи
-            
-            if not success:
-                logger.error(f"❌ Не удалось записать в регистр 1331 после 2 попыток")
-            
-            return success
-        except Exception as e:
-            logger.error(f"Ошибка при записи в регистр 1331 через прямой сокет: {e}")
-            return False
-    
-    def _build_write_frame_1241(self, value: int) -> bytes:
-        """Формирование Modbus RTU фрейма для записи в регистр 1241 (функция 06)"""
-        address = 1241
-        addr_high = (address >> 8) & 0xFF
-        addr_low = address & 0xFF
-        value_high = (value >> 8) & 0xFF
-        value_low = value & 0xFF
-        
-        frame = bytes([self.unit_id, 6, addr_high, addr_low, value_high, value_low])
-        crc = self._crc16_modbus(frame)
-        crc_low = crc & 0xFF
-        crc_high = (crc >> 8) & 0xFF
-        return frame + bytes([crc_low, crc_high])
+        return self.write_register_direct(1331, value)
     
     def write_register_1241_direct(self, value: int) -> bool:
         """Запись в регистр 1241 (установка температуры Laser PSU) через прямой сокет (функция 06)
@@ -1123,75 +1056,7 @@ class ModbusClient:
         Args:
             value: Значение для записи (температура * 100, например 2300 для 23.00°C)
         """
-        if self.client is None or not self.client.is_socket_open():
-            return False
-        
-        try:
-            # Получаем сокет из pymodbus клиента
-            sock = None
-            if hasattr(self.client, 'socket') and self.client.socket:
-                sock = self.client.socket
-            elif hasattr(self.client, 'transport'):
-                transport = self.client.transport
-                if hasattr(transport, 'socket') and transport.socket:
-                    sock = transport.socket
-                elif hasattr(transport, '_socket') and transport._socket:
-                    sock = transport._socket
-                elif hasattr(transport, 'sock') and transport.sock:
-                    sock = transport.sock
-                elif hasattr(transport, '_sock') and transport._sock:
-                    sock = transport._sock
-            
-            if sock is None:
-                logger.warning("Не удалось получить сокет для прямой записи в регистр 1241")
-                return False
-            
-            # Отправляем запрос дважды
-            write_frame = self._build_write_frame_1241(value)
-            logger.debug(f"Запись в регистр 1241: отправляем фрейм {write_frame.hex().upper()}")
-            success = False
-            
-            for i in range(2):
-                try:
-                    sock.sendall(write_frame)
-                    time.sleep(0.01)  # Минимальная задержка для быстрой записи для избежания блокировки UI
-                    resp = sock.recv(256)
-                    if resp:
-                        logger.debug(f"Ответ на запись в регистр 1241 (попытка {i+1}): {resp.hex().upper()}")
-                        if len(resp) >= 8:
-                            # Проверяем, что ответ соответствует запросу
-                            if resp[0] == self.unit_id and resp[1] == 6:
-                                # Проверяем, что адрес и значение совпадают
-                                resp_addr = (resp[2] << 8) | resp[3]
-                                resp_value = (resp[4] << 8) | resp[5]
-                                if resp_addr == 1241 and resp_value == value:
-                                    logger.debug(f"✅ Запись в регистр 1241 подтверждена: адрес={resp_addr}, значение={resp_value}")
-                                    success = True
-                                    break
-                                else:
-                                    logger.warning(f"Ответ не соответствует запросу: адрес={resp_addr} (ожидался 1241), значение={resp_value} (ожидалось {value})")
-                            else:
-                                logger.warning(f"Неожиданный ответ: unit_id={resp[0]}, функция={resp[1]}")
-                        else:
-                            logger.warning(f"Ответ слишком короткий: {len(resp)} байт")
-                    else:
-                        logger.warning(f"Пустой ответ на запись в регистр 1241 (попытка {i+1})")
-                except (ConnectionError, OSError) as e:
-                    if i == 0:
-                        logger.debug(f"Первая попытка записи в регистр 1241 не удалась (это нормально): {e}")
-                    else:
-                        logger.error(f"Ошибка при записи в регистр 1241: {e}")
-                        raise
-                if i < 1:
-                    time.sleep(0.05)  # Минимальная задержка между попытками для быстрой записи
-            
-            if not success:
-                logger.error(f"❌ Не удалось записать в регистр 1241 после 2 попыток")
-            
-            return success
-        except Exception as e:
-            logger.error(f"Ошибка при записи в регистр 1241 через прямой сокет: {e}")
-            return False
+        return self.write_register_direct(1241, value)
     
     def _build_write_frame_1421(self, value: int) -> bytes:
         """Формирование Modbus RTU фрейма для записи в регистр 1421 (функция 06)"""
@@ -1831,95 +1696,13 @@ class ModbusClient:
             logger.error(f"Ошибка при записи в регистр 1621 через прямой сокет: {e}")
             return False
     
-    def _build_write_frame_1661(self, value: int) -> bytes:
-        """Формирование Modbus RTU фрейма для записи в регистр 1661 (функция 06)"""
-        address = 1661
-        addr_high = (address >> 8) & 0xFF
-        addr_low = address & 0xFF
-        value_high = (value >> 8) & 0xFF
-        value_low = value & 0xFF
-        
-        frame = bytes([self.unit_id, 6, addr_high, addr_low, value_high, value_low])
-        crc = self._crc16_modbus(frame)
-        crc_low = crc & 0xFF
-        crc_high = (crc >> 8) & 0xFF
-        return frame + bytes([crc_low, crc_high])
-    
     def write_register_1661_direct(self, value: int) -> bool:
         """Запись в регистр 1661 (установка давления N2) через прямой сокет (функция 06)
         
         Args:
             value: Значение для записи (давление * 100, например 2300 для 23.00 Torr)
         """
-        if self.client is None or not self.client.is_socket_open():
-            return False
-        
-        try:
-            # Получаем сокет из pymodbus клиента
-            sock = None
-            if hasattr(self.client, 'socket') and self.client.socket:
-                sock = self.client.socket
-            elif hasattr(self.client, 'transport'):
-                transport = self.client.transport
-                if hasattr(transport, 'socket') and transport.socket:
-                    sock = transport.socket
-                elif hasattr(transport, '_socket') and transport._socket:
-                    sock = transport._socket
-                elif hasattr(transport, 'sock') and transport.sock:
-                    sock = transport.sock
-                elif hasattr(transport, '_sock') and transport._sock:
-                    sock = transport._sock
-            
-            if sock is None:
-                logger.warning("Не удалось получить сокет для прямой записи в регистр 1661")
-                return False
-            
-            # Отправляем запрос дважды
-            write_frame = self._build_write_frame_1661(value)
-            logger.debug(f"Запись в регистр 1661: отправляем фрейм {write_frame.hex().upper()}")
-            success = False
-            
-            for i in range(2):
-                try:
-                    sock.sendall(write_frame)
-                    time.sleep(0.01)  # Минимальная задержка для быстрой записи для избежания блокировки UI
-                    resp = sock.recv(256)
-                    if resp:
-                        logger.debug(f"Ответ на запись в регистр 1661 (попытка {i+1}): {resp.hex().upper()}")
-                        if len(resp) >= 8:
-                            # Проверяем, что ответ соответствует запросу
-                            if resp[0] == self.unit_id and resp[1] == 6:
-                                # Проверяем, что адрес и значение совпадают
-                                resp_addr = (resp[2] << 8) | resp[3]
-                                resp_value = (resp[4] << 8) | resp[5]
-                                if resp_addr == 1661 and resp_value == value:
-                                    logger.debug(f"✅ Запись в регистр 1661 подтверждена: адрес={resp_addr}, значение={resp_value}")
-                                    success = True
-                                    break
-                                else:
-                                    logger.warning(f"Ответ не соответствует запросу: адрес={resp_addr} (ожидался 1661), значение={resp_value} (ожидалось {value})")
-                            else:
-                                logger.warning(f"Неожиданный ответ: unit_id={resp[0]}, функция={resp[1]}")
-                        else:
-                            logger.warning(f"Ответ слишком короткий: {len(resp)} байт")
-                    else:
-                        logger.warning(f"Пустой ответ на запись в регистр 1661 (попытка {i+1})")
-                except (ConnectionError, OSError) as e:
-                    if i == 0:
-                        logger.debug(f"Первая попытка записи в регистр 1661 не удалась (это нормально): {e}")
-                    else:
-                        logger.error(f"Ошибка при записи в регистр 1661: {e}")
-                        raise
-                if i < 1:
-                    time.sleep(0.05)  # Минимальная задержка между попытками для быстрой записи
-            
-            if not success:
-                logger.error(f"❌ Не удалось записать в регистр 1661 после 2 попыток")
-            
-            return success
-        except Exception as e:
-            logger.error(f"Ошибка при записи в регистр 1661 через прямой сокет: {e}")
-            return False
+        return self.write_register_direct(1661, value)
     
     def _build_read_frame_1651(self) -> bytes:
         """Формирование Modbus RTU фрейма для чтения регистра 1651 (функция 04)"""
@@ -2198,6 +1981,7 @@ class ModbusClient:
                     if resp:
                         parsed = self._parse_read_response_1131(resp)
                         if parsed is not None:
+                            self._fans_1131_shadow = (parsed, time.monotonic())
                             break
                 except (ConnectionError, OSError, socket.timeout) as e:
                     if i == 0:
@@ -2278,10 +2062,35 @@ class ModbusClient:
         Returns:
             True если успешно, False в противном случае
         """
-        # Пробуем сначала использовать стандартный метод pymodbus
+        return self.set_fans_1131({fan_bit: state})
+
+    def set_fans_1131(self, bits: dict) -> bool:
+        """Установка состояния нескольких вентиляторов в регистре 1131 одной записью
+        (чтение перед записью - только если значение 1131 старше FANS_1131_SHADOW_MAX_AGE_S)
+        
+        Args:
+            bits: словарь бит -> состояние (True - включить, False - выключить)
+        
+        Returns:
+            True если успешно, False в противном случае
+        """
+        set_mask = 0
+        clear_mask = 0
+        for fan_bit, state in bits.items():
+            if state:
+                set_mask |= 1 << fan_bit
+            else:
+                clear_mask |= 1 << fan_bit
+
+        # Значение из недавнего чтения/записи 1131 - без лишней транзакции чтения
         current_value = None
+        shadow = self._fans_1131_shadow
+        if shadow is not None and time.monotonic() - shadow[1] <= self.FANS_1131_SHADOW_MAX_AGE_S:
+            current_value = shadow[0]
+        
+        # Пробуем стандартный метод pymodbus
         try:
-            if self.client is not None and self.client.is_socket_open():
+            if current_value is None and self.client is not None and self.client.is_socket_open():
                 result = self.client.read_input_registers(1131, count=1, device_id=self.unit_id)
                 if not result.isError() and result.registers:
                     current_value = result.registers[0]
@@ -2297,15 +2106,16 @@ class ModbusClient:
             logger.error("Не удалось прочитать текущее состояние регистра 1131")
             return False
         
-        if state:
-            # Включаем вентилятор - устанавливаем бит
-            new_value = current_value | (1 << fan_bit)
-        else:
-            # Выключаем вентилятор - сбрасываем бит
-            new_value = current_value & ~(1 << fan_bit)
+        # Включаем/выключаем вентиляторы - устанавливаем и сбрасываем биты
+        new_value = (current_value | set_mask) & ~clear_mask
         
         # Записываем новое значение
-        return self.write_register_1131_direct(new_value)
+        if self.write_register_1131_direct(new_value):
+            self._fans_1131_shadow = (new_value, time.monotonic())
+            return True
+        # Состояние регистра после неудачной записи неизвестно - следующая запись перечитает его
+        self._fans_1131_shadow = None
+        return False
 
     # ===== Generic direct multi-read (IR/NMR) =====
     def _get_underlying_socket(self):
@@ -2332,6 +2142,10 @@ class ModbusClient:
 
     def _build_read_frame_generic(self, function: int, address: int, quantity: int) -> bytes:
         """Формирование Modbus RTU фрейма для чтения (обычно функция 04)"""
+        key = (function, address, quantity)
+        cached = self._read_frame_cache.get(key)
+        if cached is not None:
+            return cached
         addr_high = (address >> 8) & 0xFF
         addr_low = address & 0xFF
         qty_high = (quantity >> 8) & 0xFF
@@ -2340,7 +2154,9 @@ class ModbusClient:
         crc = self._crc16_modbus(frame)
         crc_low = crc & 0xFF
         crc_high = (crc >> 8) & 0xFF
-        return frame + bytes([crc_low, crc_high])
+        frame = frame + bytes([crc_low, crc_high])
+        self._read_frame_cache[key] = frame
+        return frame
 
     def _find_frame_start(self, data: bytes, function: int) -> int:
         """
@@ -2452,8 +2268,8 @@ class ModbusClient:
 
                         resp = b""
                         # Собираем ответ до полного фрейма
-                        deadline = time.time() + 0.3  # Уменьшаем deadline с 0.5 до 0.3 секунды
-                        while time.time() < deadline:
+                        deadline = time.monotonic() + 0.3  # Уменьшаем deadline с 0.5 до 0.3 секунды
+                        while time.monotonic() < deadline:
                             try:
                                 part = sock.recv(512)
                             except socket.timeout:
@@ -2499,3 +2315,40 @@ class ModbusClient:
                 except Exception:
                     pass
 
+    def read_input_registers_bulk(self, ranges, *, max_gap: int = 0, max_span: int = 125, max_chunk: int = 10) -> Optional[dict]:
+        """
+        Групповое чтение нескольких диапазонов input registers (function 04) за один проход.
+
+        Соседние диапазоны (с разрывом не более max_gap регистров) объединяются в один запрос,
+        чтобы сократить число фреймов (Modbus допускает до 125 регистров в одном ответе).
+
+        Args:
+            ranges: последовательность (address, quantity)
+            max_gap: максимальный разрыв между диапазонами, который еще читаем одним запросом
+            max_span: максимальная длина объединенного диапазона
+            max_chunk: размер чанка для read_input_registers_direct
+
+        Returns:
+            dict address -> value для успешно прочитанных регистров, None если ничего не прочитано
+        """
+        spans = []
+        for address, quantity in sorted(ranges):
+            end = address + quantity
+            if spans:
+                start, prev_end = spans[-1]
+                if address - prev_end <= max_gap and max(end, prev_end) - start <= max_span:
+                    spans[-1] = (start, max(end, prev_end))
+                    continue
+            spans.append((address, end))
+
+        out = {}
+        for start, end in spans:
+            regs = self.read_input_registers_direct(start, end - start, max_chunk=max_chunk)
+            if regs is None:
+                # Скорее всего проблема со связью — не ждем таймауты на остальных диапазонах
+                break
+            for offset, value in enumerate(regs):
+                out[start + offset] = value
+        if 1131 in out:
+            self._fans_1131_shadow = (out[1131], time.monotonic())
+        return out or None
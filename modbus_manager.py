@@ -1,20 +1,343 @@
 """
 QML-модель для управления Modbus подключением
 """
-from PySide6.QtCore import QObject, Signal, Property, QTimer, Slot, QThread
+from PySide6.QtCore import QObject, Signal, Property, QTimer, Slot, QThread, Qt
 from modbus_client import ModbusClient
 import logging
+import heapq
+import itertools
+import json
+import math
+import operator
+import struct
+import threading
 from collections import deque
+from datetime import datetime
+from functools import partial
 from typing import Callable, Optional, Any
 import time
 
 logger = logging.getLogger(__name__)
 
+# Статичные параметры подключения к XeUS driver
+DEFAULT_HOST = "192.168.4.1"
+DEFAULT_PORT = 503
+DEFAULT_UNIT_ID = 1
+# Окно объединения записей setpoint (мс) при частых нажатиях стрелок
+WRITE_COALESCE_DELAY_MS = 20
+# Задержка отправки setpoint температур (мс): при автоповторе стрелок на устройство уходит только последнее значение
+SETPOINT_WRITE_DEBOUNCE_MS = 150
+# Поля IR спектра, которые читает QML (updateIrGraph/updateIrGraphMain); остальное - диагностика в _ir_last
+_IR_QML_KEYS = ("status", "x_min", "x_max", "y_min", "y_max", "res_freq", "freq", "data", "data_json")
+# Бинарные строки для байта 0..255 (вместо format(x, '08b') на каждом чтении)
+_BIN8 = tuple(f"{i:08b}" for i in range(256))
+
+# Вентиляторы (регистр 1131): fanIndex (из QML) -> бит в регистре
+_FAN_BIT_MAPPING = {
+    0: 0,   # inlet fan 1 (button4) -> бит 0 (бит 1 считая с 1)
+    1: 1,   # inlet fan 2 (button3) -> бит 1 (бит 2 считая с 1)
+    2: 2,   # inlet fan 3 (button2) -> бит 2 (бит 3 считая с 1)
+    3: 3,   # inlet fan 4 (button7) -> бит 3 (бит 4 считая с 1)
+    6: 4,   # opcell fan 1 (button10) -> бит 4 (бит 5 считая с 1)
+    7: 5,   # opcell fan 2 (button9) -> бит 5 (бит 6 считая с 1)
+    8: 6,   # opcell fan 3 (button8) -> бит 6 (бит 7 считая с 1)
+    9: 7,   # opcell fan 4 (button13) -> бит 7 (бит 8 считая с 1)
+    4: 8,   # outlet fan 1 (button6) -> бит 8 (бит 9 считая с 1)
+    5: 9,   # outlet fan 2 (button5) -> бит 9 (бит 10 считая с 1)
+}
+
+# Маппинг fanIndex -> название вентилятора для статуса
+_FAN_NAME_MAPPING = {
+    0: "inlet fan 1",
+    1: "inlet fan 2",
+    2: "inlet fan 3",
+    3: "inlet fan 4",
+    4: "outlet fan 1",
+    5: "outlet fan 2",
+    6: "opcell fan 1",
+    7: "opcell fan 2",
+    8: "opcell fan 3",
+    9: "opcell fan 4",
+    10: "laser fan",
+}
+# Готовые строки статуса действия для setFan / setValve (без форматирования на каждый клик)
+_FAN_STATUS_TEXT = {index: f"set {name}" for index, name in _FAN_NAME_MAPPING.items()}
+# Ключи - допустимые valveIndex для регистра 1111 (5-11): поиск в словаре одновременно проверяет индекс
+_VALVE_STATUS_TEXT = {valve_index: f"set X{valve_index - 4}" for valve_index in range(5, 12)}
+
+# Laser fan: fanIndex 10, бит 15 (считая с 0)
+_LASER_FAN_INDEX = 10
+_LASER_FAN_BIT = 15
+_LASER_FAN_MASK = 1 << _LASER_FAN_BIT
+# Все биты вентиляторов в регистре 1131 и обратная таблица бит -> fanIndex (None - бит не используется)
+_FAN_BITS_MASK = sum(1 << bit_pos for bit_pos in _FAN_BIT_MAPPING.values()) | _LASER_FAN_MASK
+_FAN_INDEX_BY_BIT = tuple(
+    _LASER_FAN_INDEX if bit_pos == _LASER_FAN_BIT
+    else next((fan_index for fan_index, b in _FAN_BIT_MAPPING.items() if b == bit_pos), None)
+    for bit_pos in range(16)
+)
+# Реле 1-7 (биты 0-6 младшего байта регистра 1021) - все реле в маске сигнала relayStatesChanged
+_RELAY_BITS_MASK = 0x7F
+# Все fanIndex в маске сигнала fanStatesChanged (бит i - fanIndex i)
+_FAN_INDEX_MASK = (1 << (_LASER_FAN_INDEX + 1)) - 1
+
+
+def _decode_int16_block(regs, scale: float):
+    """
+    Декодирование блока регистров за один проход: uint16 -> int16 (дополнительный код)
+    и масштабирование. Возвращает (сырые int16, масштабированные float).
+    """
+    n = len(regs)
+    try:
+        # uint16 -> int16 целым блоком: pack как беззнаковые, unpack как знаковые
+        raw_i16 = list(struct.unpack(f"{n}h", struct.pack(f"{n}H", *regs)))
+    except struct.error:
+        # Значение вне uint16 - поэлементно, как раньше
+        raw_i16 = []
+        for v in regs:
+            v = int(v) & 0xFFFF
+            raw_i16.append(v - 0x10000 if v >= 0x8000 else v)
+    return raw_i16, [v / scale for v in raw_i16]
+
+
+# float из двух регистров IR с перестановкой байт в каждом слове (BADC): "<HH" дает byte2, byte1, byte4, byte3
+_IR_FLOAT_WORDS = struct.Struct("<HH")
+_WORDS_BE = struct.Struct(">HH")
+_FLOAT_BE = struct.Struct(">f")
+_FLOAT_LE = struct.Struct("<f")
+
+
+# Декодеры float из двух uint16 по порядку байт (A,B - байты reg1, C,D - reg2): слова упаковываются целиком
+# предвычисленными struct.Struct, без поразрядной арифметики. Аргументы - уже маскированные uint16
+_FLOAT_ORDER_DECODERS = {
+    "ABCD": lambda reg1, reg2: _FLOAT_BE.unpack(_WORDS_BE.pack(reg1, reg2))[0],
+    "BADC": lambda reg1, reg2: _FLOAT_BE.unpack(_IR_FLOAT_WORDS.pack(reg1, reg2))[0],
+    "CDAB": lambda reg1, reg2: _FLOAT_BE.unpack(_WORDS_BE.pack(reg2, reg1))[0],
+    "DCBA": lambda reg1, reg2: _FLOAT_LE.unpack(_WORDS_BE.pack(reg1, reg2))[0],
+}
+
+
+def _float_byte_order_variants(reg1: int, reg2: int):
+    """
+    float из двух uint16 во всех популярных Modbus byte/word order.
+    Возвращает ((порядок, значение), ...) в порядке ABCD, BADC, CDAB, DCBA.
+    """
+    reg1 &= 0xFFFF
+    reg2 &= 0xFFFF
+    return tuple((order, decode(reg1, reg2)) for order, decode in _FLOAT_ORDER_DECODERS.items())
+
+
+def _write_temperature_setpoint(write: Callable[[int], bool], label: str, register_value: int, temperature: float) -> bool:
+    """Задача worker-потока: запись setpoint температуры (x100) в регистр; связывается через partial."""
+    result = write(register_value)
+    if result:
+        logger.info("✅ Заданная температура %s успешно установлена: %s°C", label, temperature)
+    else:
+        logger.error("❌ Не удалось установить заданную температуру %s: %s°C", label, temperature)
+    return bool(result)
+
+
+def _write_pressure_setpoint(write: Callable[[int], bool], label: str, register_value: int, pressure: float) -> bool:
+    """Задача worker-потока: запись setpoint давления (x100) в регистр; связывается через partial."""
+    result = write(register_value)
+    if result:
+        logger.info("✅ Заданное давление %s успешно установлено: %s Torr", label, pressure)
+    else:
+        logger.error("❌ Не удалось установить заданное давление %s: %s Torr", label, pressure)
+    return bool(result)
+
+
+def _read_holding_then_input(client: ModbusClient, address: int) -> Optional[int]:
+    """Задача worker-потока: чтение регистра как holding (03), при неудаче - как input (04)."""
+    value = client.read_holding_register(address)
+    if value is None:
+        value = client.read_input_register(address)
+    return value
+
+
+class _RelaySubsystem:
+    """Буфер состояний реле (регистр 1021)"""
+    __slots__ = ("states", "last_bits")
+
+    def __init__(self):
+        self.states = {
+            'water_chiller': False,
+            'magnet_psu': False,
+            'laser_psu': False,
+            'vacuum_pump': False,
+            'vacuum_gauge': False,
+            'pid_controller': False,
+            'op_cell_heating': False
+        }
+        # Биты реле из последнего примененного чтения 1021; None - буфер изменен вне чтения
+        self.last_bits = None
+
+
+class _ValveSubsystem:
+    """Буфер состояний клапанов (регистр 1111) - индексы 5-11 для X6-X12"""
+    __slots__ = ("states", "last_bits")
+
+    # Биты клапанов X6-X12 в регистре 1111
+    BITS_MASK = 0xFE0
+
+    def __init__(self):
+        self.states = {i: False for i in range(5, 12)}
+        # Биты клапанов из последнего примененного чтения 1111; None - буфер изменен вне чтения
+        self.last_bits = None
+
+
+class _FanSubsystem:
+    """Буфер состояний вентиляторов (регистр 1131) - индексы 0-10"""
+    __slots__ = ("states", "optimistic_deadline", "last_bits")
+
+    # Окно оптимистичного обновления (с): столько чтение 1131 не перетирает только что нажатую кнопку
+    OPTIMISTIC_WINDOW_S = 0.5
+
+    def __init__(self):
+        self.states = {i: False for i in range(11)}
+        # Конец окна оптимистичного обновления по fanIndex (time.monotonic())
+        self.optimistic_deadline = [0.0] * 11
+        # Биты вентиляторов из последнего примененного чтения 1131; None - буфер изменен вне чтения
+        self.last_bits = None
+
+
+class _ScheduledTask:
+    """
+    Периодическая задача планировщика опросов.
+
+    Повторяет интерфейс QTimer, которым пользуется менеджер (start/stop/isActive/setInterval),
+    поэтому места включения/выключения опросов не зависят от реализации таймеров.
+    """
+    __slots__ = ("_scheduler", "_callback", "_interval", "_active", "_gen")
+
+    def __init__(self, scheduler: "_PollScheduler", callback: Callable[[], Any], interval_ms: int):
+        self._scheduler = scheduler
+        self._callback = callback
+        self._interval = interval_ms
+        self._active = False
+        self._gen = 0  # Поколение: записи кучи от предыдущих start() считаются устаревшими
+
+    def start(self, interval_ms: Optional[int] = None):
+        """Запуск или перезапуск (как QTimer.start): предварительный stop() не нужен"""
+        if interval_ms is not None:
+            self._interval = interval_ms
+        self._gen += 1
+        self._active = True
+        self._scheduler._push(self, time.monotonic() * 1000.0 + self._interval)
+
+    def stop(self):
+        if self._active:
+            self._active = False
+            self._gen += 1
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def setInterval(self, interval_ms: int):
+        self._interval = interval_ms
+
+    def interval(self) -> int:
+        return self._interval
+
+
+class _PollScheduler:
+    """
+    Планировщик периодических опросов: min-heap (срок в мс, счетчик, поколение, задача)
+    и один single-shot QTimer, взведенный на ближайший срок.
+    """
+
+    def __init__(self, parent: QObject):
+        self._heap = []
+        self._seq = itertools.count()
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        self._armed_due = None  # Срок, на который взведен QTimer
+
+    def add(self, callback: Callable[[], Any], interval_ms: int) -> _ScheduledTask:
+        """Зарегистрировать периодическую задачу (не запущена, как новый QTimer)"""
+        return _ScheduledTask(self, callback, interval_ms)
+
+    def _push(self, task: _ScheduledTask, due_ms: float):
+        heapq.heappush(self._heap, (due_ms, next(self._seq), task._gen, task))
+        self._rearm()
+
+    def _rearm(self):
+        heap = self._heap
+        # Выбрасываем устаревшие записи остановленных/перезапущенных задач
+        while heap and heap[0][2] != heap[0][3]._gen:
+            heapq.heappop(heap)
+        if not heap:
+            self._armed_due = None
+            self._timer.stop()
+            return
+        due = heap[0][0]
+        if due == self._armed_due and self._timer.isActive():
+            # Ближайший срок не изменился - QTimer уже взведен на него, не перезапускаем
+            return
+        self._armed_due = due
+        self._timer.start(max(0, math.ceil(due - time.monotonic() * 1000.0)))
+
+    def _tick(self):
+        heap = self._heap
+        now = time.monotonic() * 1000.0
+        while heap and heap[0][0] <= now:
+            due, _, gen, task = heapq.heappop(heap)
+            if gen != task._gen:
+                continue
+            interval = task._interval
+            next_due = due + interval
+            if next_due <= now:
+                # Пропущенные тики не навёрстываем пачкой
+                next_due = now + interval
+            # Перепланируем до вызова: stop()/start() внутри callback делает запись устаревшей
+            heapq.heappush(heap, (next_due, next(self._seq), gen, task))
+            try:
+                task._callback()
+            except Exception:
+                logger.exception("Polling task failed")
+        self._rearm()
+
+
+# Приоритеты задач worker-потока (меньше - раньше)
+PRIORITY_CONTROL = -10  # setClient/connect/disconnect
+PRIORITY_WRITE = 0  # команды пользователя
+PRIORITY_READ = 10  # опрос состояния устройства
+PRIORITY_BACKGROUND = 100  # тяжелые чтения экранов параметров и IR спектра
+
+# Задача с низким приоритетом, ждущая дольше этого (с), выполняется вне очереди, чтобы не голодать
+STARVATION_LIMIT_S = 1.0
+
+# Предельная длина очереди worker-потока: при переполнении выбрасывается самая старая задача с наименьшим приоритетом
+MAX_QUEUED_IO_TASKS = 64
+# Задачи, которые при переполнении очереди не выбрасываются: менеджер ждет их результата, чтобы сбросить свое состояние
+# (накопленные биты записей-накопителей 1131/1021, флаг _syncing групповой синхронизации)
+_UNSHEDDABLE_TASK_KEYS = frozenset(("fan1131", "relay1021", "sync"))
+
+# Групповое чтение, не завершившееся за столько тиков опроса, удваивает интервал своего опроса
+GROUP_READ_STALL_TICKS = 5
+# Верхняя граница интервала опроса группы при затянувшемся чтении (мс)
+GROUP_READ_MAX_INTERVAL_MS = 2000
+
+# Виды задач в очереди worker-потока
+_TASK_CONTROL, _TASK_WRITE, _TASK_READ = range(3)
+
 
 class _ModbusIoWorker(QObject):
     """
     Выполняет блокирующие Modbus операции в отдельном потоке.
 
+    Поток спит на threading.Condition и просыпается только при появлении задач,
+    без лишнего прохода event loop между задачами. Методы постановки задач
+    потокобезопасны и вызываются из GUI-потока напрямую: enqueue* - обычным вызовом,
+    управляющие слоты - через сигналы с DirectConnection.
+    Все задачи лежат в одной heapq-очереди [приоритет, порядковый номер, вид, ключ, функция, meta, время постановки].
+
+    Запросы выполняются строго по одному: устройство работает по Modbus RTU поверх TCP, в RTU-фрейме
+    нет transaction id, поэтому ответы на несколько одновременно отправленных запросов нельзя надежно
+    сопоставить (asyncio/конвейерная отправка здесь не дает выигрыша). Сокращаем число фреймов
+    (групповая синхронизация, объединение записей), а не их последовательность.
+
     Важно: никаких обращений к QML/GUI здесь быть не должно.
     """
 
@@ -27,20 +350,182 @@ class _ModbusIoWorker(QObject):
         super().__init__(parent)
         self._client: Optional[ModbusClient] = None
 
-        self._read_queue: deque = deque()
-        self._write_queue: deque = deque()  # приоритетные задачи (записи)
-        self._processing = False
-
-        self._task_timer = QTimer(self)
-        self._task_timer.setSingleShot(True)
-        self._task_timer.timeout.connect(self._process_one)
+        self._cond = threading.Condition()
+        self._queue = []  # heapq
+        self._seq = itertools.count()  # FIFO внутри одного приоритета
+        self._queued_read_keys = set()  # ключи чтений, уже стоящих в очереди (одно ожидающее чтение на ключ)
+        self._pending_coalesced = {}  # ключ -> запись очереди для объединяемых записей, еще не взятых в работу
+        self._busy = False  # выполняется задача
+        self._running_read_key = None  # ключ выполняемого чтения
+        self._hold_until = 0.0  # time.monotonic(): окно объединения записей, до него задачи (кроме управляющих) не берем
+        self._stopping = False
+
+    def _push(self, priority: int, kind: int, key: str, func: Callable, meta: object = None) -> list:
+        entry = [priority, next(self._seq), kind, key, func, meta, time.monotonic()]
+        heapq.heappush(self._queue, entry)
+        if kind != _TASK_CONTROL and len(self._queue) > MAX_QUEUED_IO_TASKS:
+            self._shed_oldest()
+        self._cond.notify()
+        return entry
+
+    def _shed_oldest(self):
+        """Выбросить самую старую задачу с наименьшим приоритетом (чтения раньше записей, управляющие и _UNSHEDDABLE_TASK_KEYS не трогаем)."""
+        victim = None
+        for entry in self._queue:
+            if entry[2] == _TASK_CONTROL or entry[3] in _UNSHEDDABLE_TASK_KEYS:
+                continue
+            if victim is None or (entry[0], -entry[1]) > (victim[0], -victim[1]):
+                victim = entry
+        if victim is None:
+            return
+        self._queue.remove(victim)
+        heapq.heapify(self._queue)
+        _, _, kind, key, _, meta, _ = victim
+        if kind == _TASK_READ:
+            self._queued_read_keys.discard(key)
+            logger.debug("Очередь Modbus переполнена, отброшено чтение %s", key)
+        else:
+            if self._pending_coalesced.get(key) is victim:
+                del self._pending_coalesced[key]
+            logger.warning("Очередь Modbus переполнена, отброшена запись %s meta=%s", key, meta)
+
+    def _drop_io_tasks(self):
+        """Выбросить из очереди все чтения и записи, оставив управляющие задачи."""
+        self._queue = [entry for entry in self._queue if entry[2] == _TASK_CONTROL]
+        heapq.heapify(self._queue)
+        self._queued_read_keys.clear()
+        self._pending_coalesced.clear()
+        self._hold_until = 0.0
 
     @Slot(object)
     def setClient(self, client: Optional[ModbusClient]):
-        self._client = client
+        with self._cond:
+            self._push(PRIORITY_CONTROL, _TASK_CONTROL, "set_client", self._doSetClient, client)
 
     @Slot()
     def connectClient(self):
+        with self._cond:
+            self._push(PRIORITY_CONTROL, _TASK_CONTROL, "connect", self._doConnect)
+
+    @Slot()
+    def disconnectClient(self):
+        with self._cond:
+            # На отключение очищаем очередь, чтобы не выполнять старые задачи.
+            self._drop_io_tasks()
+            self._push(PRIORITY_CONTROL, _TASK_CONTROL, "disconnect", self._doDisconnect)
+
+    @Slot(str, object, int)
+    def enqueueRead(self, key: str, func: Callable[[], Any], priority: int = PRIORITY_READ):
+        with self._cond:
+            # Чтение по ключу идемпотентно: если такое же уже ждет выполнения, второе не добавляем
+            if key in self._queued_read_keys:
+                return
+            self._queued_read_keys.add(key)
+            self._push(priority, _TASK_READ, key, func)
+
+    @Slot(str, object, object)
+    def enqueueWrite(self, key: str, func: Callable[[], bool], meta: object = None):
+        with self._cond:
+            self._push(PRIORITY_WRITE, _TASK_WRITE, key, func, meta)
+
+    @Slot(str, object, object)
+    def enqueueWriteCoalesced(self, key: str, func: Callable[[], bool], meta: object = None):
+        """
+        Запись абсолютного значения в регистр: если запись с тем же ключом еще ждет
+        в очереди, она заменяется новой на своем месте (важно только последнее значение).
+        """
+        with self._cond:
+            entry = self._pending_coalesced.get(key)
+            if entry is not None:
+                entry[4] = func
+                entry[5] = meta
+                return
+            if not self._busy and not self._queue:
+                # Небольшая задержка дает окно для объединения частых нажатий стрелок
+                self._hold_until = time.monotonic() + WRITE_COALESCE_DELAY_MS / 1000.0
+            self._pending_coalesced[key] = self._push(PRIORITY_WRITE, _TASK_WRITE, key, func, meta)
+
+    def stop(self):
+        """Завершить цикл worker'а (после уже поставленных setClient/connect/disconnect)."""
+        with self._cond:
+            self._stopping = True
+            self._drop_io_tasks()
+            self._cond.notify()
+
+    def _pop_next(self) -> list:
+        """Взять следующую задачу (под блокировкой): по приоритету, но без голодания фоновых чтений."""
+        queue = self._queue
+        head = queue[0]
+        if head[2] != _TASK_CONTROL and len(queue) > 1:
+            # Очередь короткая (чтения дедуплицируются по ключу), линейный просмотр дешевле Modbus запроса
+            oldest = None
+            limit = time.monotonic() - STARVATION_LIMIT_S
+            for entry in queue:
+                if entry[0] > head[0] and entry[6] < limit and (oldest is None or entry[1] < oldest[1]):
+                    oldest = entry
+            if oldest is not None:
+                queue.remove(oldest)
+                heapq.heapify(queue)
+                return oldest
+        return heapq.heappop(queue)
+
+    @Slot()
+    def run(self):
+        """Цикл worker-потока: ждет задачи на condition variable и выполняет их в порядке приоритета."""
+        cond = self._cond
+        while True:
+            with cond:
+                while True:
+                    queue = self._queue
+                    if queue and queue[0][2] == _TASK_CONTROL:
+                        break
+                    if self._stopping:
+                        return
+                    if not queue:
+                        cond.wait()
+                        continue
+                    delay = self._hold_until - time.monotonic()
+                    if delay <= 0:
+                        break
+                    cond.wait(delay)
+                entry = self._pop_next()
+                _, _, kind, key, func, meta, _ = entry
+                if kind == _TASK_READ:
+                    self._queued_read_keys.discard(key)
+                elif kind == _TASK_WRITE and self._pending_coalesced.get(key) is entry:
+                    del self._pending_coalesced[key]
+                self._busy = True
+                self._running_read_key = key if kind == _TASK_READ else None
+            try:
+                if kind == _TASK_CONTROL:
+                    func(meta)
+                elif kind == _TASK_WRITE:
+                    try:
+                        ok = bool(func())
+                    except Exception:
+                        logger.exception("Modbus write task failed")
+                        ok = False
+                    self.writeFinished.emit(key, ok, meta)
+                else:
+                    try:
+                        value = func()
+                    except Exception:
+                        logger.exception("Modbus read task failed")
+                        value = None
+                    self.readFinished.emit(key, value)
+            finally:
+                self._busy = False
+                self._running_read_key = None
+
+    def isReadPending(self, key: str) -> bool:
+        """Чтение с этим ключом ждет в очереди или выполняется (вызывается из GUI-потока)."""
+        with self._cond:
+            return key in self._queued_read_keys or self._running_read_key == key
+
+    def _doSetClient(self, client: Optional[ModbusClient]):
+        self._client = client
+
+    def _doConnect(self, _arg=None):
         """Подключение в worker-потоке (может блокировать)."""
         if self._client is None:
             self.connectFinished.emit(False, "Modbus client is not initialized")
@@ -54,65 +539,14 @@ class _ModbusIoWorker(QObject):
         except Exception as e:
             self.connectFinished.emit(False, str(e))
 
-    @Slot()
-    def disconnectClient(self):
+    def _doDisconnect(self, _arg=None):
         """Отключение в worker-потоке."""
         try:
-            # На отключение очищаем очереди, чтобы не выполнять старые задачи.
-            self._read_queue.clear()
-            self._write_queue.clear()
             if self._client is not None:
                 self._client.disconnect()
         finally:
             self.disconnected.emit()
 
-    @Slot(str, object)
-    def enqueueRead(self, key: str, func: Callable[[], Any]):
-        self._read_queue.append((key, func))
-        if not self._task_timer.isActive() and not self._processing:
-            self._task_timer.start(0)
-
-    @Slot(str, object, object)
-    def enqueueWrite(self, key: str, func: Callable[[], bool], meta: object = None):
-        # Записи имеют приоритет
-        self._write_queue.append((key, func, meta))
-        if not self._task_timer.isActive() and not self._processing:
-            self._task_timer.start(0)
-
-    @Slot()
-    def _process_one(self):
-        if self._processing:
-            # на всякий случай
-            self._task_timer.start(1)
-            return
-
-        if not self._write_queue and not self._read_queue:
-            return
-
-        self._processing = True
-        try:
-            if self._write_queue:
-                key, func, meta = self._write_queue.popleft()
-                try:
-                    ok = bool(func())
-                except Exception:
-                    logger.exception("Modbus write task failed")
-                    ok = False
-                self.writeFinished.emit(key, ok, meta)
-            else:
-                key, func = self._read_queue.popleft()
-                try:
-                    value = func()
-                except Exception:
-                    logger.exception("Modbus read task failed")
-                    value = None
-                self.readFinished.emit(key, value)
-        finally:
-            self._processing = False
-            # Быстро вычерпываем очередь, но даем event loop шанс обработать события.
-            if self._write_queue or self._read_queue:
-                self._task_timer.start(0)
-
 
 class ModbusManager(QObject):
     """Менеджер для управления Modbus подключением, доступный из QML"""
@@ -124,8 +558,13 @@ class ModbusManager(QObject):
     errorOccurred = Signal(str)
     
     # Сигналы для синхронизации состояний устройств
-    fanStateChanged = Signal(int, bool)  # fanIndex, state
-    valveStateChanged = Signal(int, bool)  # valveIndex, state
+    fanStateChanged = Signal(int, bool)  # fanIndex, state (одиночное изменение из setFan)
+    fanStatesChanged = Signal(int, int)  # маска изменившихся fanIndex, состояния (бит i - fanIndex i)
+    # Маска изменившихся реле, состояния (биты как в младшем байте регистра 1021): чтение 1021, повтор из буфера и
+    # отключение. Одиночное изменение из set* (и состояния PID/Water Chiller из групповых чтений) - сигналом своего реле
+    relayStatesChanged = Signal(int, int)
+    valveStateChanged = Signal(int, bool)  # valveIndex, state (одиночное изменение из setValve)
+    valveStatesChanged = Signal(int, int)  # маска изменившихся valveIndex, состояния (бит i - valveIndex i, как в регистре 1111)
     laserPSUStateChanged = Signal(bool)
     magnetPSUStateChanged = Signal(bool)
     pidControllerStateChanged = Signal(bool)  # Состояние PID Controller (вкл/выкл, регистр 1431)
@@ -231,12 +670,13 @@ class ModbusManager(QObject):
     manualModeCenterFrequencyChanged = Signal(float)  # Center frequency в kHz (регистр 6371) - чтение и запись
     manualModeFrequencySpanChanged = Signal(float)  # Frequency span в kHz (регистр 6381) - чтение и запись
     externalRelaysChanged = Signal(int, str)  # value, binary_string - для регистра 1020
+    registerWriteCompleted = Signal(int, bool)  # address, ok - результат записи writeRegister (из QML)
     opCellHeatingStateChanged = Signal(bool)  # OP cell heating (реле 7)
     # Сигналы для паузы/возобновления опросов (используется при переключении экранов)
     pollingPausedChanged = Signal(bool)
     # IR spectrum (Clinicalmode/Screen01 IR graph)
     # Важно: используем QVariantMap, чтобы QML видел обычный JS object/array, а не PyObjectWrapper.
-    irSpectrumChanged = Signal('QVariantMap')  # payload map: {x_min,x_max,y_min,y_max,points,data,...}
+    irSpectrumChanged = Signal('QVariantMap')  # payload map: поля _IR_QML_KEYS {status,x_min,x_max,y_min,y_max,data,data_json,...}
     # Logging signal for Clinicalmode screen
     logMessageChanged = Signal(str)  # log message to display in logs TextArea
 
@@ -244,15 +684,46 @@ class ModbusManager(QObject):
     _workerSetClient = Signal(object)
     _workerConnect = Signal()
     _workerDisconnect = Signal()
-    _workerEnqueueRead = Signal(str, object)
-    _workerEnqueueWrite = Signal(str, object, object)
     
+    # Числовые поля, сбрасываемые при отключении: (атрибут, значение по умолчанию, сигнал)
+    _DISCONNECT_RESET_FIELDS = (
+        ('_water_chiller_temperature', 0.0, 'waterChillerTemperatureChanged'),
+        ('_water_chiller_setpoint', 0.0, 'waterChillerSetpointChanged'),
+        ('_seop_cell_temperature', 0.0, 'seopCellTemperatureChanged'),
+        ('_seop_cell_setpoint', 0.0, 'seopCellSetpointChanged'),
+        ('_magnet_psu_current', 0.0, 'magnetPSUCurrentChanged'),
+        ('_magnet_psu_setpoint', 0.0, 'magnetPSUSetpointChanged'),
+        ('_laser_psu_current', 0.0, 'laserPSUCurrentChanged'),
+        ('_laser_psu_setpoint', 0.0, 'laserPSUSetpointChanged'),
+        ('_xenon_pressure', 0.0, 'xenonPressureChanged'),
+        ('_xenon_setpoint', 0.0, 'xenonSetpointChanged'),
+        ('_n2_pressure', 0.0, 'n2PressureChanged'),
+        ('_n2_setpoint', 0.0, 'n2SetpointChanged'),
+        ('_vacuum_pressure', 0.0, 'vacuumPressureChanged'),
+    )
+
+    # Минимальное значимое изменение setpoint при взаимодействии пользователя с полем
+    # Температуры на главном экране отображаются с точностью 0.1°C (toFixed(1) в QML): значение,
+    # округляющееся так же, как последнее отправленное (шум датчика ±0.01°C), не эмитируется
+    _TEMP_DISPLAY_DIGITS = 1
+
+    _SETPOINT_EPS = {'seop_cell': 0.01, 'xenon': 0.001, 'n2': 0.001, 'water_chiller': 0.01}
+
+    # Медленно меняющиеся регистры групповой синхронизации (температуры, токи PSU): за один проход
+    # читается только один из них по кругу, остальные (реле, клапаны, вентиляторы, давления) - каждый проход
+    _BULK_SYNC_SLOW = (1251, 1341, 1411, 1511)
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Все периодические опросы обслуживаются одним QTimer (см. _PollScheduler)
+        self._poll_scheduler = _PollScheduler(self)
         self._modbus_client: ModbusClient = None
+        # Задачи чтения, связанные с текущим клиентом: {адрес | ключ | набор адресов: callable};
+        # сбрасывается при создании нового клиента
+        self._read_funcs = {}
         self._is_connected = False
         self._connection_in_progress = False
-        self._last_modbus_ok_time = 0.0
+        self._last_modbus_ok_time = 0.0  # time.monotonic() последнего успешного ответа
         self._last_reconnect_attempt_time = 0.0
         self._status_text = "Disconnected"
         self._connection_button_text = "Connect"  # Текст кнопки подключения: "Connect" или "Disconnect"
@@ -263,51 +734,55 @@ class ModbusManager(QObject):
         # Старая переменная для обратной совместимости
         self._water_chiller_temperature = 0.0  # Текущая температура Water Chiller (регистр 1511) - использует inlet temp
         self._water_chiller_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._water_chiller_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._water_chiller_setpoint_auto_update_timer.timeout.connect(self._autoUpdateWaterChillerSetpoint)
-        self._water_chiller_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._seop_cell_temperature = 0.0  # Температура SEOP Cell (регистр 1411)
         self._seop_cell_setpoint = 0.0  # Заданная температура SEOP Cell (регистр 1421)
         self._pid_controller_temperature = 0.0  # Температура PID Controller (регистр 1411)
         self._pid_controller_setpoint = 0.0  # Заданная температура PID Controller (регистр 1421)
         self._pid_controller_state = False  # Состояние PID Controller (вкл/выкл, регистр 1431)
         self._pid_controller_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._pid_controller_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._pid_controller_setpoint_auto_update_timer.timeout.connect(self._autoUpdatePIDControllerSetpoint)
-        self._pid_controller_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._reading_water_chiller = False  # Флаг для предотвращения параллельного чтения Water Chiller
         self._seop_cell_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._seop_cell_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._seop_cell_setpoint_auto_update_timer.timeout.connect(self._autoUpdateSeopCellSetpoint)
-        self._seop_cell_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
-        self._seop_cell_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._seop_cell_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._seop_cell_setpoint_auto_update_timer.timeout.connect(self._autoUpdateSeopCellSetpoint)
-        self._seop_cell_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._magnet_psu_current = 0.0  # Ток Magnet PSU в амперах (регистр 1341)
         self._magnet_psu_setpoint = 0.0  # Заданная температура Magnet PSU (регистр 1331)
         self._magnet_psu_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._magnet_psu_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._magnet_psu_setpoint_auto_update_timer.timeout.connect(self._autoUpdateMagnetPSUSetpoint)
-        self._magnet_psu_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._laser_psu_current = 0.0  # Ток Laser PSU в амперах (регистр 1251)
         self._laser_psu_setpoint = 0.0  # Заданная температура Laser PSU (регистр 1241)
         self._laser_psu_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._laser_psu_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._laser_psu_setpoint_auto_update_timer.timeout.connect(self._autoUpdateLaserPSUSetpoint)
-        self._laser_psu_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._xenon_pressure = 0.0  # Давление Xenon в Torr (регистр 1611)
         self._xenon_setpoint = 0.0  # Заданное давление Xenon в Torr (регистр 1621)
         self._xenon_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._xenon_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._xenon_setpoint_auto_update_timer.timeout.connect(self._autoUpdateXenonSetpoint)
-        self._xenon_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
         self._n2_pressure = 0.0  # Давление N2 в Torr (регистр 1651)
         self._n2_setpoint = 0.0  # Заданное давление N2 (регистр 1661)
         self._n2_setpoint_user_interaction = False  # Флаг: пользователь взаимодействует с полем ввода
-        self._n2_setpoint_auto_update_timer = QTimer(self)  # Таймер для автообновления setpoint
-        self._n2_setpoint_auto_update_timer.timeout.connect(self._autoUpdateN2Setpoint)
-        self._n2_setpoint_auto_update_timer.setInterval(20000)  # 20 секунд
+        # Автообновление setpoint из текущего значения: (текущее, setpoint, флаг взаимодействия, сигнал, порог, мин. валидное).
+        # Для Magnet/Laser PSU текущего значения нет (только ток) — сбрасывается только флаг взаимодействия
+        self._auto_update_specs = (
+            ("_water_chiller_temperature", "_water_chiller_setpoint", "_water_chiller_setpoint_user_interaction", "waterChillerSetpointChanged", 0.1, 0.1),
+            (None, None, "_magnet_psu_setpoint_user_interaction", None, 0.0, 0.0),
+            (None, None, "_laser_psu_setpoint_user_interaction", None, 0.0, 0.0),
+            ("_seop_cell_temperature", "_seop_cell_setpoint", "_seop_cell_setpoint_user_interaction", "seopCellSetpointChanged", 0.1, 0.1),
+            ("_pid_controller_temperature", "_pid_controller_setpoint", "_pid_controller_setpoint_user_interaction", "pidControllerSetpointChanged", 0.1, 0.1),
+            ("_xenon_pressure", "_xenon_setpoint", "_xenon_setpoint_user_interaction", "xenonSetpointChanged", 0.01, 0.01),
+            ("_n2_pressure", "_n2_setpoint", "_n2_setpoint_user_interaction", "n2SetpointChanged", 0.01, 0.01),
+        )
+        # Setpoint температур, записываемые в один регистр (x100):
+        # имя -> (подпись, регистр, setpoint, флаг взаимодействия, сигнал UI, шаг стрелок в единицах регистра - 0.01°C);
+        # запись - client.write_register_direct
+        self._temperature_setpoint_specs = {
+            'water_chiller': ("Water Chiller", 1531, "_water_chiller_setpoint", "_water_chiller_setpoint_user_interaction", self.waterChillerSetpointChanged, 100),
+            'magnet_psu': ("Magnet PSU", 1331, "_magnet_psu_setpoint", "_magnet_psu_setpoint_user_interaction", self.magnetPSUSetpointChanged, 100),
+            'laser_psu': ("Laser PSU", 1241, "_laser_psu_setpoint", "_laser_psu_setpoint_user_interaction", self.laserPSUSetpointChanged, 1),
+        }
+        self._last_emitted_temperatures = {}  # Последние отправленные в UI температуры: имя сигнала -> значение
+        self._last_raw_values = {}  # Последние сырые значения одиночных регистров: адрес -> (raw, value/100)
+        # Ожидающие записи биты вентиляторов (регистр 1131): бит -> состояние. Доступ из GUI и worker потоков
+        self._pending_fan_bits = {}
+        self._pending_fan_lock = threading.Lock()
+        # Ожидающие записи реле (регистр 1021): номер реле -> (состояние, название). Доступ из GUI и worker потоков
+        self._pending_relay_bits = {}
+        self._pending_relay_lock = threading.Lock()
+        self._last_sent_setpoints = {}  # Последние поставленные в очередь записи setpoint: имя -> значение
+        self._setpoint_auto_update_timer = self._poll_scheduler.add(self._autoUpdateSetpoints, 20000)  # Один таймер автообновления для всех setpoint
         self._vacuum_pressure = 0.0  # Давление Vacuum в Torr (регистр 1701)
         self._vacuum_controller_pressure = 0.0  # Давление Vacuum Controller в mTorr (регистр 1701)
         self._laser_beam_state = False  # Состояние Beam Laser (вкл/выкл, регистр 1811)
@@ -373,6 +848,16 @@ class ModbusManager(QObject):
         self._additional_1h_current_sweep_n_scans = 0.0  # 1H Current Sweep N Scans (регистр 6181) - чтение и запись
         self._additional_baseline_correction_min_frequency = 0.0  # Baseline correction min frequency в kHz (регистр 6191) - чтение и запись
         self._additional_baseline_correction_max_frequency = 0.0  # Baseline correction max frequency в kHz (регистр 6201) - чтение и запись
+        # Manual mode settings (регистры 6301-6381)
+        self._manual_mode_rf_pulse_frequency = 0.0  # RF pulse frequency в kHz (регистр 6301) - чтение и запись
+        self._manual_mode_rf_pulse_power = 0.0  # RF pulse power в % (регистр 6311) - чтение и запись
+        self._manual_mode_rf_pulse_duration = 0.0  # RF pulse duration в T/2 (регистр 6321) - чтение и запись
+        self._manual_mode_pre_acquisition = 0.0  # Pre acquisition в ms (регистр 6331) - чтение и запись
+        self._manual_mode_nmr_gain = 0.0  # NMR gain в dB (регистр 6341) - чтение и запись
+        self._manual_mode_nmr_number_of_scans = 0.0  # NMR number of scans (регистр 6351) - чтение и запись
+        self._manual_mode_nmr_recovery = 0.0  # NMR recovery в ms (регистр 6361) - чтение и запись
+        self._manual_mode_center_frequency = 0.0  # Center frequency в kHz (регистр 6371) - чтение и запись
+        self._manual_mode_frequency_span = 0.0  # Frequency span в kHz (регистр 6381) - чтение и запись
         # Флаги взаимодействия пользователя для автообновления
         self._additional_magnet_psu_current_proton_nmr_user_interaction = False
         self._additional_magnet_psu_current_129xe_nmr_user_interaction = False
@@ -434,191 +919,134 @@ class ModbusManager(QObject):
         self._ir_request_in_flight = False
         
         # Буфер состояний устройств для мгновенного отображения при переключении страниц
-        # Реле (регистр 1021)
-        self._relay_states = {
-            'water_chiller': False,
-            'magnet_psu': False,
-            'laser_psu': False,
-            'vacuum_pump': False,
-            'vacuum_gauge': False,
-            'pid_controller': False,
-            'op_cell_heating': False
-        }
-        # Клапаны (регистр 1111) - индексы 5-11 для X6-X12
-        self._valve_states = {i: False for i in range(5, 12)}
-        # Вентиляторы (регистр 1131) - индексы 0-10
-        self._fan_states = {i: False for i in range(11)}
-        self._fan_optimistic_updates = {}  # Флаги оптимистичных обновлений вентиляторов: fanIndex -> timestamp
+        self._relays = _RelaySubsystem()  # Реле (регистр 1021)
+        self._valves = _ValveSubsystem()  # Клапаны (регистр 1111)
+        self._fans = _FanSubsystem()  # Вентиляторы (регистр 1131)
         # Буфер для регистров (для быстрого доступа без блокировки UI)
         self._register_cache = {}  # address -> value
         # Флаг паузы опросов (чтобы при переключении экранов не блокировать UI)
         self._polling_paused = False
         
-        # Статичные параметры подключения к XeUS driver
-        self._host = "192.168.4.1"
-        self._port = 503
-        self._unit_id = 1
-        
-        # Таймер для периодической проверки подключения и keep-alive
-        self._connection_check_timer = QTimer(self)
-        self._connection_check_timer.timeout.connect(self._check_connection)
-        self._connection_check_timer.setInterval(500)  # Проверка каждые 0.5 секунды + keep-alive
-        self._connection_fail_count = 0  # Счетчик неудачных проверок
-        
-        # Таймер для синхронизации состояний устройств
-        self._sync_timer = QTimer(self)
-        self._sync_timer.timeout.connect(self._syncDeviceStates)
-        self._sync_timer.setInterval(1000)  # Интервал 1 секунда для быстрого обновления
+        # Параметры подключения (по умолчанию — статичные параметры XeUS driver)
+        self._host = DEFAULT_HOST
+        self._port = DEFAULT_PORT
+        self._unit_id = DEFAULT_UNIT_ID
+        
+        # "Живость" соединения определяется по ответам на регулярные чтения опроса,
+        # отдельного keep-alive таймера нет
+        self._connection_fail_count = 0  # Счетчик неудачных чтений подряд
+        self._connection_fail_threshold = 5  # После скольких неудачных чтений подряд переподключаемся
+        self._auto_reconnect = False  # Идет автоматическое переподключение после потери связи
+        # Экспоненциальная задержка между попытками автоматического переподключения
+        self._reconnect_attempt = 0  # Номер неудачной попытки подряд (сбрасывается только при успешном подключении)
+        self._reconnect_base_ms = 500
+        self._reconnect_max_ms = 60_000
+        self._reconnect_next_attempt_ts = 0.0  # time.monotonic(), раньше которого не пробуем
+        
+        # Таймер групповой синхронизации: одним заданием читает все одиночные регистры
+        # (реле, клапаны, вентиляторы, температуры, токи, давления) вместо отдельного таймера на каждый
+        self._sync_timer = self._poll_scheduler.add(self._bulkSync, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._syncing = False  # Флаг для предотвращения параллельных синхронизаций
         self._sync_fail_count = 0  # Счетчик неудачных синхронизаций
         self._last_sync_time = 0  # Время последней синхронизации
         
-        # Флаги для предотвращения параллельных чтений
-        self._reading_1021 = False
-        self._reading_1111 = False
-        self._reading_1511 = False
-        self._reading_1411 = False
-        self._reading_1341 = False
+        # Флаги для предотвращения параллельных групповых чтений
+        # (одиночные регистры защищены от дублей очередью worker'а: одно ожидающее чтение на ключ)
         self._reading_power_supply = False
-        self._reading_1251 = False
-        self._reading_1611 = False
-        self._reading_1651 = False
-        self._reading_1701 = False
-        self._reading_1131 = False
         self._reading_pid_controller = False
-        # Флаги оптимистичных обновлений
-        self._fan_optimistic_updates = {}  # Флаги оптимистичных обновлений вентиляторов: fanIndex -> timestamp
+        # Задания, тик которых был пропущен из-за незавершенного предыдущего выполнения
+        # (медленный канал). Повторяем их сразу после завершения текущего,
+        # не дожидаясь следующего тика таймера: не более одного отложенного запроса на ключ
+        self._dirty_reads = set()
+        self._dirty_readers = {
+            "sync": self._bulkSync,
+        }
+        # Регистры групповой синхронизации: адрес -> apply-метод
+        self._bulk_sync_table = {
+            1021: self._applyRelay1021Value,
+            1111: self._applyValve1111Value,
+            1131: self._applyFan1131Value,
+            1251: self._applyLaserPSUCurrentValue,
+            1341: self._applyMagnetPSUCurrentValue,
+            1411: self._applySeopCellTemperatureValue,
+            1511: self._applyWaterChillerTemperatureValue,
+            1611: self._applyXenonPressureValue,
+            1651: self._applyN2PressureValue,
+            1701: self._applyVacuumPressureValue,
+        }
+        # Диспетчер результатов чтения worker: ключ задачи -> apply-метод (GUI поток).
+        # Одиночные регистры ("1411") - из таблицы синхронизации, групповые чтения - по своему ключу
+        self._read_appliers = {
+            str(address): apply for address, apply in self._bulk_sync_table.items()
+        }
+        self._read_appliers.update({
+            "power_supply": self._applyPowerSupplyValue,
+            "pid_controller": self._applyPIDControllerValue,
+            "water_chiller": self._applyWaterChillerValue,
+            "alicats": self._applyAlicatsValue,
+            "vacuum_controller": self._applyVacuumControllerValue,
+            "laser": self._applyLaserValue,
+            "seop_parameters": self._applySEOPParametersValue,
+            "calculated_parameters": self._applyCalculatedParametersValue,
+            "measured_parameters": self._applyMeasuredParametersValue,
+            "additional_parameters": self._applyAdditionalParametersValue,
+            "manual_mode_settings": self._applyManualModeSettingsValue,
+            "sync": self._applyBulkSyncValue,
+            "1020": self._applyExternalRelays1020Value,
+            "ir": self._applyIrSpectrum,
+        })
+        # Какие регистры сейчас включены в групповую синхронизацию (enable/disable*Polling)
+        self._bulk_sync_addresses = set(self._bulk_sync_table)
+        self._bulk_sync_pending = ()  # Адреса, запрошенные текущим заданием синхронизации
+        self._bulk_sync_slow = deque(self._BULK_SYNC_SLOW)  # Очередь медленных регистров (round-robin)
         # Список таймеров, которые можно приостанавливать (для быстрой смены экранов)
         self._polling_timers = []
         
-        # Таймер для чтения регистра 1021 (реле) - быстрое обновление
-        self._relay_1021_timer = QTimer(self)
-        self._relay_1021_timer.timeout.connect(self._readRelay1021)
-        self._relay_1021_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1111 (клапаны X6-X12) - быстрое обновление
-        self._valve_1111_timer = QTimer(self)
-        self._valve_1111_timer.timeout.connect(self._readValve1111)
-        self._valve_1111_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1511 (температура Water Chiller) - быстрое обновление (старый, для обратной совместимости)
-        self._water_chiller_temp_timer = QTimer(self)
-        self._water_chiller_temp_timer.timeout.connect(self._readWaterChillerTemperature)
-        self._water_chiller_temp_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
         # Таймер для чтения регистров Water Chiller (1511, 1521, 1531, 1541) - быстрое обновление
-        self._water_chiller_timer = QTimer(self)
-        self._water_chiller_timer.timeout.connect(self._readWaterChiller)
-        self._water_chiller_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1411 (температура SEOP Cell) - быстрое обновление
-        self._seop_cell_temp_timer = QTimer(self)
-        self._seop_cell_temp_timer.timeout.connect(self._readSeopCellTemperature)
-        self._seop_cell_temp_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1341 (ток Magnet PSU) - быстрое обновление
-        self._magnet_psu_current_timer = QTimer(self)
-        self._magnet_psu_current_timer.timeout.connect(self._readMagnetPSUCurrent)
-        self._magnet_psu_current_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._water_chiller_timer = self._poll_scheduler.add(self._readWaterChiller, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         
-        # Таймер для чтения регистра 1251 (ток Laser PSU) - быстрое обновление
-        self._laser_psu_current_timer = QTimer(self)
-        self._laser_psu_current_timer.timeout.connect(self._readLaserPSUCurrent)
-        self._laser_psu_current_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1611 (давление Xenon) - быстрое обновление
-        self._xenon_pressure_timer = QTimer(self)
-        self._xenon_pressure_timer.timeout.connect(self._readXenonPressure)
-        self._xenon_pressure_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1651 (давление N2) - быстрое обновление
-        self._n2_pressure_timer = QTimer(self)
-        self._n2_pressure_timer.timeout.connect(self._readN2Pressure)
-        self._n2_pressure_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1701 (давление Vacuum) - быстрое обновление
-        self._vacuum_pressure_timer = QTimer(self)
-        self._vacuum_pressure_timer.timeout.connect(self._readVacuumPressure)
-        self._vacuum_pressure_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-        
-        # Таймер для чтения регистра 1131 (fans) - быстрое обновление
-        self._fan_1131_timer = QTimer(self)
-        self._fan_1131_timer.timeout.connect(self._readFan1131)
-        self._fan_1131_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
-
         # Таймер для чтения регистров Power Supply (Laser PSU и Magnet PSU) - быстрое обновление
-        self._power_supply_timer = QTimer(self)
-        self._power_supply_timer.timeout.connect(self._readPowerSupply)
-        self._power_supply_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._power_supply_timer = self._poll_scheduler.add(self._readPowerSupply, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
 
         # Таймер для чтения регистров PID Controller (1411, 1421, 1431) - быстрое обновление
-        self._pid_controller_timer = QTimer(self)
-        self._pid_controller_timer.timeout.connect(self._readPIDController)
-        self._pid_controller_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._pid_controller_timer = self._poll_scheduler.add(self._readPIDController, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
 
         # Таймер для чтения регистров Alicats (1611, 1621, 1651, 1661) - быстрое обновление
-        self._alicats_timer = QTimer(self)
-        self._alicats_timer.timeout.connect(self._readAlicats)
-        self._alicats_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._alicats_timer = self._poll_scheduler.add(self._readAlicats, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_alicats = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистра Vacuum Controller (1701) - быстрое обновление
-        self._vacuum_controller_timer = QTimer(self)
-        self._vacuum_controller_timer.timeout.connect(self._readVacuumController)
-        self._vacuum_controller_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._vacuum_controller_timer = self._poll_scheduler.add(self._readVacuumController, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_vacuum_controller = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистров Laser (1811, 1821, 1831, 1841) - быстрое обновление
-        self._laser_timer = QTimer(self)
-        self._laser_timer.timeout.connect(self._readLaser)
-        self._laser_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._laser_timer = self._poll_scheduler.add(self._readLaser, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_laser = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистров SEOP Parameters (3011-3081) - быстрое обновление
-        self._seop_parameters_timer = QTimer(self)
-        self._seop_parameters_timer.timeout.connect(self._readSEOPParameters)
-        self._seop_parameters_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._seop_parameters_timer = self._poll_scheduler.add(self._readSEOPParameters, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_seop_parameters = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистров Calculated Parameters (4011-4101) - быстрое обновление
-        self._calculated_parameters_timer = QTimer(self)
-        self._calculated_parameters_timer.timeout.connect(self._readCalculatedParameters)
-        self._calculated_parameters_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._calculated_parameters_timer = self._poll_scheduler.add(self._readCalculatedParameters, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_calculated_parameters = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистров Measured Parameters (5011-5081) - быстрое обновление
-        self._measured_parameters_timer = QTimer(self)
-        self._measured_parameters_timer.timeout.connect(self._readMeasuredParameters)
-        self._measured_parameters_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._measured_parameters_timer = self._poll_scheduler.add(self._readMeasuredParameters, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_measured_parameters = False  # Флаг для предотвращения параллельных чтений
 
         # Таймер для чтения регистров Additional Parameters (6011-6201) - быстрое обновление
-        self._additional_parameters_timer = QTimer(self)
-        self._additional_parameters_timer.timeout.connect(self._readAdditionalParameters)
-        self._additional_parameters_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._additional_parameters_timer = self._poll_scheduler.add(self._readAdditionalParameters, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_additional_parameters = False  # Флаг для предотвращения параллельных чтений
         
         # Таймер для чтения регистров Manual mode settings (6301-6381) - быстрое обновление
-        self._manual_mode_settings_timer = QTimer(self)
-        self._manual_mode_settings_timer.timeout.connect(self._readManualModeSettings)
-        self._manual_mode_settings_timer.setInterval(300)  # Чтение каждые 300 мс для максимально быстрого обновления
+        self._manual_mode_settings_timer = self._poll_scheduler.add(self._readManualModeSettings, 300)  # Чтение каждые 300 мс для максимально быстрого обновления
         self._reading_manual_mode_settings = False  # Флаг для предотвращения параллельных чтений
 
         # Список таймеров для паузы/возобновления опросов
         self._polling_timers = [
-            self._connection_check_timer,
             self._sync_timer,
-            self._relay_1021_timer,
-            self._valve_1111_timer,
-            self._water_chiller_temp_timer,
             self._water_chiller_timer,
-            self._seop_cell_temp_timer,
-            self._magnet_psu_current_timer,
-            self._laser_psu_current_timer,
-            self._xenon_pressure_timer,
-            self._n2_pressure_timer,
-            self._vacuum_pressure_timer,
-            self._fan_1131_timer,
             self._power_supply_timer,
             self._pid_controller_timer,
             self._alicats_timer,
@@ -630,18 +1058,147 @@ class ModbusManager(QObject):
             self._additional_parameters_timer,
             self._manual_mode_settings_timer,
         ]
+        # Групповые чтения: ключ задачи worker -> (флаг незавершенного чтения, таймер опроса, штатный интервал)
+        self._group_read_polls = {
+            key: (f"_reading_{key}", timer, timer.interval())
+            for key, timer in (
+                ("water_chiller", self._water_chiller_timer),
+                ("power_supply", self._power_supply_timer),
+                ("pid_controller", self._pid_controller_timer),
+                ("alicats", self._alicats_timer),
+                ("vacuum_controller", self._vacuum_controller_timer),
+                ("laser", self._laser_timer),
+                ("seop_parameters", self._seop_parameters_timer),
+                ("calculated_parameters", self._calculated_parameters_timer),
+                ("measured_parameters", self._measured_parameters_timer),
+                ("additional_parameters", self._additional_parameters_timer),
+                ("manual_mode_settings", self._manual_mode_settings_timer),
+            )
+        }
+        self._group_read_stalls = {}  # ключ -> тиков опроса, пропущенных из-за незавершенного чтения
+
+        # Отложенные записи setpoint температур: ключ -> (задача, meta); перезапуск таймера сдвигает отправку
+        self._debounced_writes = {}
+        self._setpoint_write_timer = QTimer(self)
+        self._setpoint_write_timer.setSingleShot(True)
+        self._setpoint_write_timer.setInterval(SETPOINT_WRITE_DEBOUNCE_MS)
+        self._setpoint_write_timer.timeout.connect(self._flushDebouncedWrites)
+
+        # Битовые маски реле в регистре 1021 (младший байт): (ключ, маска). Чтение 1021, повтор из буфера
+        # и сброс при отключении уходят в QML одним relayStatesChanged, а не сигналом на каждое реле
+        self._relay_bit_table = tuple(
+            (key, 1 << bit) for bit, key in enumerate((
+                'water_chiller', 'magnet_psu', 'laser_psu', 'vacuum_pump',
+                'vacuum_gauge', 'pid_controller', 'op_cell_heating',
+            ))
+        )
+        # Битовые маски клапанов X6-X12 в регистре 1111: (индекс клапана, маска)
+        self._valve_bit_table = tuple((valve_index, 1 << valve_index) for valve_index in range(5, 12))
+        # Предвычисленные таблицы (bound emit сигнала, источник значения) для _emitCachedStates:
+        # emit связывается один раз, а не на каждом переключении страницы
+        self._value_emit_table = (
+            (self.waterChillerTemperatureChanged.emit, operator.attrgetter('_water_chiller_temperature')),
+            (self.waterChillerSetpointChanged.emit, operator.attrgetter('_water_chiller_setpoint')),
+            (self.seopCellTemperatureChanged.emit, operator.attrgetter('_seop_cell_temperature')),
+            (self.seopCellSetpointChanged.emit, operator.attrgetter('_seop_cell_setpoint')),
+            (self.magnetPSUCurrentChanged.emit, operator.attrgetter('_magnet_psu_current')),
+            (self.magnetPSUSetpointChanged.emit, operator.attrgetter('_magnet_psu_setpoint')),
+            (self.laserPSUCurrentChanged.emit, operator.attrgetter('_laser_psu_current')),
+            (self.laserPSUSetpointChanged.emit, operator.attrgetter('_laser_psu_setpoint')),
+            (self.xenonPressureChanged.emit, operator.attrgetter('_xenon_pressure')),
+            (self.xenonSetpointChanged.emit, operator.attrgetter('_xenon_setpoint')),
+            (self.n2PressureChanged.emit, operator.attrgetter('_n2_pressure')),
+            (self.n2SetpointChanged.emit, operator.attrgetter('_n2_setpoint')),
+            (self.vacuumPressureChanged.emit, operator.attrgetter('_vacuum_pressure')),
+            # Значения групповых чтений эмитируются только при изменении - повторяем их для новых страниц.
+            # Состояния PID/Water Chiller не повторяем: их кнопки показывают реле 1021 (повторяются из буфера реле)
+            (self.pidControllerTemperatureChanged.emit, operator.attrgetter('_pid_controller_temperature')),
+            (self.pidControllerSetpointChanged.emit, operator.attrgetter('_pid_controller_setpoint')),
+            (self.waterChillerInletTemperatureChanged.emit, operator.attrgetter('_water_chiller_inlet_temperature')),
+            (self.waterChillerOutletTemperatureChanged.emit, operator.attrgetter('_water_chiller_outlet_temperature')),
+            (self.vacuumControllerPressureChanged.emit, operator.attrgetter('_vacuum_controller_pressure')),
+            (self.laserBeamStateChanged.emit, operator.attrgetter('_laser_beam_state')),
+            (self.laserMPDChanged.emit, operator.attrgetter('_laser_mpd')),
+            (self.laserOutputPowerChanged.emit, operator.attrgetter('_laser_output_power')),
+            (self.laserTempChanged.emit, operator.attrgetter('_laser_temp')),
+            (self.seopLaserMaxTempChanged.emit, operator.attrgetter('_seop_laser_max_temp')),
+            (self.seopLaserMinTempChanged.emit, operator.attrgetter('_seop_laser_min_temp')),
+            (self.seopCellMaxTempChanged.emit, operator.attrgetter('_seop_cell_max_temp')),
+            (self.seopCellMinTempChanged.emit, operator.attrgetter('_seop_cell_min_temp')),
+            (self.seopRampTempChanged.emit, operator.attrgetter('_seop_ramp_temp')),
+            (self.seopTempChanged.emit, operator.attrgetter('_seop_temp')),
+            (self.seopCellRefillTempChanged.emit, operator.attrgetter('_seop_cell_refill_temp')),
+            (self.seopLoopTimeChanged.emit, operator.attrgetter('_seop_loop_time')),
+            (self.seopProcessDurationChanged.emit, operator.attrgetter('_seop_process_duration')),
+            (self.seopLaserMaxOutputPowerChanged.emit, operator.attrgetter('_seop_laser_max_output_power')),
+            (self.seopLaserPSUMaxCurrentChanged.emit, operator.attrgetter('_seop_laser_psu_max_current')),
+            (self.seopWaterChillerMaxTempChanged.emit, operator.attrgetter('_seop_water_chiller_max_temp')),
+            (self.seopWaterChillerMinTempChanged.emit, operator.attrgetter('_seop_water_chiller_min_temp')),
+            (self.seopXeConcentrationChanged.emit, operator.attrgetter('_seop_xe_concentration')),
+            (self.seopWaterProtonConcentrationChanged.emit, operator.attrgetter('_seop_water_proton_concentration')),
+            (self.seopCellNumberChanged.emit, operator.attrgetter('_seop_cell_number')),
+            (self.seopRefillCycleChanged.emit, operator.attrgetter('_seop_refill_cycle')),
+            (self.calculatedElectronPolarizationChanged.emit, operator.attrgetter('_calculated_electron_polarization')),
+            (self.calculatedXePolarizationChanged.emit, operator.attrgetter('_calculated_xe_polarization')),
+            (self.calculatedBuildupRateChanged.emit, operator.attrgetter('_calculated_buildup_rate')),
+            (self.calculatedElectronPolarizationErrorChanged.emit, operator.attrgetter('_calculated_electron_polarization_error')),
+            (self.calculatedXePolarizationErrorChanged.emit, operator.attrgetter('_calculated_xe_polarization_error')),
+            (self.calculatedBuildupRateErrorChanged.emit, operator.attrgetter('_calculated_buildup_rate_error')),
+            (self.calculatedFittedXePolarizationMaxChanged.emit, operator.attrgetter('_calculated_fitted_xe_polarization_max')),
+            (self.calculatedFittedXePolarizationMaxErrorChanged.emit, operator.attrgetter('_calculated_fitted_xe_polarization_max_error')),
+            (self.calculatedHPXeT1Changed.emit, operator.attrgetter('_calculated_hp_xe_t1')),
+            (self.calculatedHPXeT1ErrorChanged.emit, operator.attrgetter('_calculated_hp_xe_t1_error')),
+            (self.measuredCurrentIRSignalChanged.emit, operator.attrgetter('_measured_current_ir_signal')),
+            (self.measuredColdCellIRSignalChanged.emit, operator.attrgetter('_measured_cold_cell_ir_signal')),
+            (self.measuredHotCellIRSignalChanged.emit, operator.attrgetter('_measured_hot_cell_ir_signal')),
+            (self.measuredWater1HNMRReferenceSignalChanged.emit, operator.attrgetter('_measured_water_1h_nmr_reference_signal')),
+            (self.measuredWaterT2Changed.emit, operator.attrgetter('_measured_water_t2')),
+            (self.measuredHP129XeNMRSignalChanged.emit, operator.attrgetter('_measured_hp_129xe_nmr_signal')),
+            (self.measuredHP129XeT2Changed.emit, operator.attrgetter('_measured_hp_129xe_t2')),
+            (self.measuredT2CorrectionFactorChanged.emit, operator.attrgetter('_measured_t2_correction_factor')),
+            (self.additionalMagnetPSUCurrentProtonNMRChanged.emit, operator.attrgetter('_additional_magnet_psu_current_proton_nmr')),
+            (self.additionalMagnetPSUCurrent129XeNMRChanged.emit, operator.attrgetter('_additional_magnet_psu_current_129xe_nmr')),
+            (self.additionalOperationalLaserPSUCurrentChanged.emit, operator.attrgetter('_additional_operational_laser_psu_current')),
+            (self.additionalRFPulseDurationChanged.emit, operator.attrgetter('_additional_rf_pulse_duration')),
+            (self.additionalResonanceFrequencyChanged.emit, operator.attrgetter('_additional_resonance_frequency')),
+            (self.additionalProtonRFPulsePowerChanged.emit, operator.attrgetter('_additional_proton_rf_pulse_power')),
+            (self.additionalHP129XeRFPulsePowerChanged.emit, operator.attrgetter('_additional_hp_129xe_rf_pulse_power')),
+            (self.additionalStepSizeB0SweepHP129XeChanged.emit, operator.attrgetter('_additional_step_size_b0_sweep_hp_129xe')),
+            (self.additionalStepSizeB0SweepProtonsChanged.emit, operator.attrgetter('_additional_step_size_b0_sweep_protons')),
+            (self.additionalXeAlicatsPressureChanged.emit, operator.attrgetter('_additional_xe_alicats_pressure')),
+            (self.additionalNitrogenAlicatsPressureChanged.emit, operator.attrgetter('_additional_nitrogen_alicats_pressure')),
+            (self.additionalChillerTempSetpointChanged.emit, operator.attrgetter('_additional_chiller_temp_setpoint')),
+            (self.additionalSEOPResonanceFrequencyChanged.emit, operator.attrgetter('_additional_seop_resonance_frequency')),
+            (self.additionalSEOPResonanceFrequencyToleranceChanged.emit, operator.attrgetter('_additional_seop_resonance_frequency_tolerance')),
+            (self.additionalIRSpectrometerNumberOfScansChanged.emit, operator.attrgetter('_additional_ir_spectrometer_number_of_scans')),
+            (self.additionalIRSpectrometerExposureDurationChanged.emit, operator.attrgetter('_additional_ir_spectrometer_exposure_duration')),
+            (self.additional1HReferenceNScansChanged.emit, operator.attrgetter('_additional_1h_reference_n_scans')),
+            (self.additional1HCurrentSweepNScansChanged.emit, operator.attrgetter('_additional_1h_current_sweep_n_scans')),
+            (self.additionalBaselineCorrectionMinFrequencyChanged.emit, operator.attrgetter('_additional_baseline_correction_min_frequency')),
+            (self.additionalBaselineCorrectionMaxFrequencyChanged.emit, operator.attrgetter('_additional_baseline_correction_max_frequency')),
+            (self.manualModeRFPulseFrequencyChanged.emit, operator.attrgetter('_manual_mode_rf_pulse_frequency')),
+            (self.manualModeRFPulsePowerChanged.emit, operator.attrgetter('_manual_mode_rf_pulse_power')),
+            (self.manualModeRFPulseDurationChanged.emit, operator.attrgetter('_manual_mode_rf_pulse_duration')),
+            (self.manualModePreAcquisitionChanged.emit, operator.attrgetter('_manual_mode_pre_acquisition')),
+            (self.manualModeNMRGainChanged.emit, operator.attrgetter('_manual_mode_nmr_gain')),
+            (self.manualModeNMRNumberOfScansChanged.emit, operator.attrgetter('_manual_mode_nmr_number_of_scans')),
+            (self.manualModeNMRRecoveryChanged.emit, operator.attrgetter('_manual_mode_nmr_recovery')),
+            (self.manualModeCenterFrequencyChanged.emit, operator.attrgetter('_manual_mode_center_frequency')),
+            (self.manualModeFrequencySpanChanged.emit, operator.attrgetter('_manual_mode_frequency_span')),
+        )
         
         # Worker-поток для Modbus I/O (чтобы UI не подвисал)
         self._io_thread = QThread(self)
         self._io_worker = _ModbusIoWorker()
         self._io_worker.moveToThread(self._io_thread)
 
-        # Подключаем внутренние сигналы к worker слотам (queued connection автоматически, т.к. другой поток)
-        self._workerSetClient.connect(self._io_worker.setClient)
-        self._workerConnect.connect(self._io_worker.connectClient)
-        self._workerDisconnect.connect(self._io_worker.disconnectClient)
-        self._workerEnqueueRead.connect(self._io_worker.enqueueRead)
-        self._workerEnqueueWrite.connect(self._io_worker.enqueueWrite)
+        # Подключаем внутренние сигналы к worker слотам напрямую: слоты потокобезопасны и только
+        # ставят задачу в очередь, а event loop worker-потока занят циклом run().
+        # Задачи чтения/записи ставятся вызовом enqueue* без сигнала (см. _enqueue_read/_enqueue_write)
+        direct = Qt.ConnectionType.DirectConnection
+        self._workerSetClient.connect(self._io_worker.setClient, direct)
+        self._workerConnect.connect(self._io_worker.connectClient, direct)
+        self._workerDisconnect.connect(self._io_worker.disconnectClient, direct)
 
         # Результаты от worker обратно в GUI-поток
         self._io_worker.connectFinished.connect(self._onWorkerConnectFinished)
@@ -649,6 +1206,7 @@ class ModbusManager(QObject):
         self._io_worker.readFinished.connect(self._onWorkerReadFinished)
         self._io_worker.writeFinished.connect(self._onWorkerWriteFinished)
 
+        self._io_thread.started.connect(self._io_worker.run)
         self._io_thread.start()
         self.destroyed.connect(self._shutdownIoThread)
     
@@ -664,53 +1222,70 @@ class ModbusManager(QObject):
     
     def _addLog(self, message: str):
         """Добавить сообщение в лог для отображения в Clinicalmode"""
-        from datetime import datetime
         timestamp = datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {message}"
         self.logMessageChanged.emit(log_entry)
-        logger.info(f"LOG: {log_entry}")
+        logger.info("LOG: %s", log_entry)
+    
+    def _setConnectionStatus(self, status: str, button_text: str, is_connected: Optional[bool] = None):
+        """
+        Единственное место записи статуса подключения и текста кнопки.
+        Сигналы отправляются только для реально изменившихся значений.
+        """
+        if is_connected is not None and self._is_connected != is_connected:
+            self._is_connected = is_connected
+            self.connectionStatusChanged.emit(is_connected)
+        if self._status_text != status:
+            self._status_text = status
+            self.statusTextChanged.emit(status)
+        if self._connection_button_text != button_text:
+            self._connection_button_text = button_text
+            self.connectionButtonTextChanged.emit(button_text)
     
     def _updateActionStatus(self, action: str):
-        """Обновление статуса последнего действия пользователя"""
-        logger.info(f"🔄 Обновление статуса действия: {action}")
+        """Обновление статуса последнего действия пользователя (повтор того же текста не эмитируется)"""
+        if action == self._status_text:
+            return
         self._status_text = action
-        self.statusTextChanged.emit(self._status_text)
-        logger.info(f"✅ Статус обновлен, эмитирован сигнал. Текущий статус: {self._status_text}")
+        self.statusTextChanged.emit(action)
+    
+    def _emitRelayStates(self, changed_mask: int):
+        """Агрегированный relayStatesChanged по буферу реле (состояния всех реле одной маской)"""
+        relay_states = self._relays.states
+        on_mask = 0
+        for key, mask in self._relay_bit_table:
+            if relay_states[key]:
+                on_mask |= mask
+        self.relayStatesChanged.emit(changed_mask, on_mask)
     
     def _emitCachedStates(self):
         """Отправка всех состояний из буфера в UI для мгновенного отображения при переключении страниц"""
         # Отправляем состояния реле из буфера
-        self.waterChillerStateChanged.emit(self._relay_states['water_chiller'])
-        self.magnetPSUStateChanged.emit(self._relay_states['magnet_psu'])
-        self.laserPSUStateChanged.emit(self._relay_states['laser_psu'])
-        self.vacuumPumpStateChanged.emit(self._relay_states['vacuum_pump'])
-        self.vacuumGaugeStateChanged.emit(self._relay_states['vacuum_gauge'])
-        self.pidControllerStateChanged.emit(self._relay_states['pid_controller'])
-        self.opCellHeatingStateChanged.emit(self._relay_states['op_cell_heating'])
-        
-        # Отправляем состояния клапанов из буфера
-        for valve_index in range(5, 12):
-            self.valveStateChanged.emit(valve_index, self._valve_states[valve_index])
-        
-        # Отправляем состояния вентиляторов из буфера
-        for fan_index in range(11):
-            self.fanStateChanged.emit(fan_index, self._fan_states[fan_index])
+        self._emitRelayStates(_RELAY_BITS_MASK)
+        # Внешние реле (регистр 1020) эмитируются из чтения только при изменении - повторяем из кэша
+        external_relays = self._register_cache.get(1020)
+        if external_relays is not None:
+            self.externalRelaysChanged.emit(external_relays & 0xFF, _BIN8[external_relays & 0xFF])
+        
+        # Отправляем состояния клапанов из буфера одним сигналом
+        on_mask = 0
+        for valve_index, state in self._valves.states.items():
+            if state:
+                on_mask |= 1 << valve_index
+        self.valveStatesChanged.emit(_ValveSubsystem.BITS_MASK, on_mask)
+        
+        # Отправляем состояния вентиляторов из буфера одним сигналом
+        on_mask = 0
+        for fan_index, state in self._fans.states.items():
+            if state:
+                on_mask |= 1 << fan_index
+        self.fanStatesChanged.emit(_FAN_INDEX_MASK, on_mask)
         
         # Отправляем числовые значения (температуры, токи, давления) - они уже хранятся в свойствах
-        # и автоматически доступны через Properties, но можно явно эмитировать сигналы для обновления UI
-        self.waterChillerTemperatureChanged.emit(self._water_chiller_temperature)
-        self.waterChillerSetpointChanged.emit(self._water_chiller_setpoint)
-        self.seopCellTemperatureChanged.emit(self._seop_cell_temperature)
-        self.seopCellSetpointChanged.emit(self._seop_cell_setpoint)
-        self.magnetPSUCurrentChanged.emit(self._magnet_psu_current)
-        self.magnetPSUSetpointChanged.emit(self._magnet_psu_setpoint)
-        self.laserPSUCurrentChanged.emit(self._laser_psu_current)
-        self.laserPSUSetpointChanged.emit(self._laser_psu_setpoint)
-        self.xenonPressureChanged.emit(self._xenon_pressure)
-        self.xenonSetpointChanged.emit(self._xenon_setpoint)
-        self.n2PressureChanged.emit(self._n2_pressure)
-        self.n2SetpointChanged.emit(self._n2_setpoint)
-        self.vacuumPressureChanged.emit(self._vacuum_pressure)
+        # и автоматически доступны через Properties, но можно явно эмитировать сигналы для обновления UI.
+        # Эмитируем без проверки изменений: только что загруженная страница должна получить все значения
+        for emit, getter in self._value_emit_table:
+            emit(getter(self))
 
     @Slot()
     def pausePolling(self):
@@ -734,49 +1309,53 @@ class ModbusManager(QObject):
         self.pollingPausedChanged.emit(False)
         logger.info("▶️ Опрос Modbus возобновлен после переключения экрана")
     
+    def _setBulkSyncEnabled(self, address: int, enabled: bool) -> bool:
+        """Включить/выключить регистр в групповой синхронизации. Возвращает True, если состояние изменилось"""
+        if enabled == (address in self._bulk_sync_addresses):
+            return False
+        if enabled:
+            self._bulk_sync_addresses.add(address)
+        else:
+            self._bulk_sync_addresses.discard(address)
+        return True
+
     @Slot()
     def enableRelayPolling(self):
         """Включить чтение регистра 1021 (реле) по требованию (например, при открытии External Relays)"""
         if self._is_connected and not self._polling_paused:
-            if not self._relay_1021_timer.isActive():
-                self._relay_1021_timer.start()
+            if self._setBulkSyncEnabled(1021, True):
                 logger.info("▶️ Опрос реле (регистр 1021) включен")
     
     @Slot()
     def disableRelayPolling(self):
         """Выключить чтение регистра 1021 (реле) по требованию (например, при закрытии External Relays)"""
-        if self._relay_1021_timer.isActive():
-            self._relay_1021_timer.stop()
+        if self._setBulkSyncEnabled(1021, False):
             logger.info("⏸ Опрос реле (регистр 1021) выключен")
     
     @Slot()
     def enableValvePolling(self):
         """Включить чтение регистра 1111 (клапаны) по требованию (например, при открытии Valves and Fans)"""
         if self._is_connected and not self._polling_paused:
-            if not self._valve_1111_timer.isActive():
-                self._valve_1111_timer.start()
+            if self._setBulkSyncEnabled(1111, True):
                 logger.info("▶️ Опрос клапанов (регистр 1111) включен")
     
     @Slot()
     def disableValvePolling(self):
         """Выключить чтение регистра 1111 (клапаны) по требованию (например, при закрытии Valves and Fans)"""
-        if self._valve_1111_timer.isActive():
-            self._valve_1111_timer.stop()
+        if self._setBulkSyncEnabled(1111, False):
             logger.info("⏸ Опрос клапанов (регистр 1111) выключен")
     
     @Slot()
     def enableFanPolling(self):
         """Включить чтение регистра 1131 (вентиляторы) по требованию (например, при открытии Valves and Fans)"""
         if self._is_connected and not self._polling_paused:
-            if not self._fan_1131_timer.isActive():
-                self._fan_1131_timer.start()
+            if self._setBulkSyncEnabled(1131, True):
                 logger.info("▶️ Опрос вентиляторов (регистр 1131) включен")
     
     @Slot()
     def disableFanPolling(self):
         """Выключить чтение регистра 1131 (вентиляторы) по требованию (например, при закрытии Valves and Fans)"""
-        if self._fan_1131_timer.isActive():
-            self._fan_1131_timer.stop()
+        if self._setBulkSyncEnabled(1131, False):
             logger.info("⏸ Опрос вентиляторов (регистр 1131) выключен")
     
     @Slot()
@@ -1149,7 +1728,7 @@ class ModbusManager(QObject):
             self._host = value
             # Пересоздаем клиент с новыми параметрами
             self._modbus_client = None
-            logger.info(f"Установлен host: {value}")
+            logger.info("Установлен host: %s", value)
     
     @Property(int)
     def port(self):
@@ -1165,7 +1744,7 @@ class ModbusManager(QObject):
             self._port = value
             # Пересоздаем клиент с новыми параметрами
             self._modbus_client = None
-            logger.info(f"Установлен port: {value}")
+            logger.info("Установлен port: %s", value)
     
     @Property(int)
     def unitId(self):
@@ -1181,7 +1760,7 @@ class ModbusManager(QObject):
             self._unit_id = value
             # Пересоздаем клиент с новыми параметрами
             self._modbus_client = None
-            logger.info(f"Установлен unit_id: {value}")
+            logger.info("Установлен unit_id: %s", value)
     
     @Slot()
     def toggleConnection(self):
@@ -1201,8 +1780,9 @@ class ModbusManager(QObject):
             return
         if self._is_connected:
             return
+        self._auto_reconnect = False
 
-        logger.info(f"Попытка подключения к {self._host}:{self._port} (в фоне, без блокировки UI)")
+        logger.info("Попытка подключения к %s:%s (в фоне, без блокировки UI)", self._host, self._port)
 
         # Если был старый клиент/соединение — сначала логически отключаемся
         if self._modbus_client is not None:
@@ -1215,12 +1795,10 @@ class ModbusManager(QObject):
             unit_id=self._unit_id,
             framer="rtu"
         )
+        self._read_funcs.clear()
 
         self._connection_in_progress = True
-        self._status_text = "Connecting"
-        self._connection_button_text = "Connecting..."
-        self.statusTextChanged.emit(self._status_text)
-        self.connectionButtonTextChanged.emit(self._connection_button_text)
+        self._setConnectionStatus("Connecting", "Connecting...")
 
         # Передаем клиента в worker и запускаем connect
         self._workerSetClient.emit(self._modbus_client)
@@ -1232,94 +1810,75 @@ class ModbusManager(QObject):
         try:
             logger.info("Отключение от Modbus устройства")
             self._connection_in_progress = False
-            self._connection_check_timer.stop()
+            self._auto_reconnect = False
             self._sync_timer.stop()  # Останавливаем синхронизацию
-            self._relay_1021_timer.stop()  # Останавливаем чтение регистра 1021
-            self._valve_1111_timer.stop()  # Останавливаем чтение регистра 1111
-            self._water_chiller_temp_timer.stop()  # Останавливаем чтение температуры Water Chiller
-            self._water_chiller_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint
-            self._magnet_psu_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint Magnet PSU
-            self._laser_psu_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint Laser PSU
-            self._seop_cell_temp_timer.stop()  # Останавливаем чтение температуры SEOP Cell
-            self._seop_cell_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint SEOP Cell
-            self._magnet_psu_current_timer.stop()  # Останавливаем чтение тока Magnet PSU
-            self._laser_psu_current_timer.stop()  # Останавливаем чтение тока Laser PSU
-            self._xenon_pressure_timer.stop()  # Останавливаем чтение давления Xenon
-            self._xenon_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint Xenon
-            self._n2_setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint N2
-            self._n2_pressure_timer.stop()  # Останавливаем чтение давления N2
-            self._vacuum_pressure_timer.stop()  # Останавливаем чтение давления Vacuum
-            self._fan_1131_timer.stop()  # Останавливаем чтение регистра 1131 (fans)
+            self._setpoint_auto_update_timer.stop()  # Останавливаем автообновление setpoint
+            self._dirty_reads.clear()
+            self._last_sent_setpoints.clear()
+            self._setpoint_write_timer.stop()
+            self._debounced_writes.clear()
+            with self._pending_fan_lock:
+                self._pending_fan_bits = {}
+            with self._pending_relay_lock:
+                self._pending_relay_bits = {}
+            self._last_emitted_temperatures.clear()
+            self._last_raw_values.clear()
+            self._bulk_sync_addresses = set(self._bulk_sync_table)
+            self._syncing = False
+            self._bulk_sync_pending = ()
+            # Ответы на групповые чтения после отключения не придут - сбрасываем флаги и интервалы
+            for flag, timer, base_interval in self._group_read_polls.values():
+                setattr(self, flag, False)
+                timer.setInterval(base_interval)
+            self._group_read_stalls.clear()
             
             # Отключение Modbus делаем в worker-потоке (чтобы UI не блокировался)
             self._workerDisconnect.emit()
             self._workerSetClient.emit(None)
             self._modbus_client = None
             
-            self._is_connected = False
-            self._status_text = "Disconnected"
-            self._connection_button_text = "Connect"
-            self.connectionStatusChanged.emit(self._is_connected)
-            self.statusTextChanged.emit(self._status_text)
-            self.connectionButtonTextChanged.emit(self._connection_button_text)
+            self._setConnectionStatus("Disconnected", "Connect", False)
             
-            # Сбрасываем состояния всех кнопок в GUI при отключении (только визуально, на устройство команды не отправляются)
-            self.waterChillerStateChanged.emit(False)
-            self.magnetPSUStateChanged.emit(False)
-            self.laserPSUStateChanged.emit(False)
-            self.vacuumPumpStateChanged.emit(False)
-            self.vacuumGaugeStateChanged.emit(False)
-            self.pidControllerStateChanged.emit(False)
-            self.opCellHeatingStateChanged.emit(False)
+            # Сбрасываем состояния всех кнопок в GUI при отключении (только визуально, на устройство команды не отправляются).
+            # Сигналы отправляем только для тех элементов, которые сейчас не в состоянии по умолчанию:
+            # каждый сигнал обходит все Connections в QML, поэтому "пустые" эмиты заметно тормозят UI
+            relay_states = self._relays.states
+            changed_mask = 0
+            for key, mask in self._relay_bit_table:
+                if relay_states[key]:
+                    relay_states[key] = False
+                    changed_mask |= mask
+            if changed_mask:
+                self.relayStatesChanged.emit(changed_mask, 0)
+            self._relays.last_bits = None
             
             # Сбрасываем состояния клапанов X6-X12 в GUI при отключении
-            self.valveStateChanged.emit(5, False)  # X6
-            self.valveStateChanged.emit(6, False)  # X7
-            self.valveStateChanged.emit(7, False)  # X8
-            self.valveStateChanged.emit(8, False)  # X9
-            self.valveStateChanged.emit(9, False)  # X10
-            self.valveStateChanged.emit(10, False)  # X11
-            self.valveStateChanged.emit(11, False)  # X12
+            valve_states = self._valves.states
+            changed_mask = 0
+            for valve_index in range(5, 12):
+                if valve_states[valve_index]:
+                    valve_states[valve_index] = False
+                    changed_mask |= 1 << valve_index
+            if changed_mask:
+                self.valveStatesChanged.emit(changed_mask, 0)
+            self._valves.last_bits = None
             
             # Сбрасываем состояния всех вентиляторов в GUI при отключении
-            self.fanStateChanged.emit(0, False)   # inlet fan 1
-            self.fanStateChanged.emit(1, False)   # inlet fan 2
-            self.fanStateChanged.emit(2, False)   # inlet fan 3
-            self.fanStateChanged.emit(3, False)   # inlet fan 4
-            self.fanStateChanged.emit(4, False)   # outlet fan 1
-            self.fanStateChanged.emit(5, False)   # outlet fan 2
-            self.fanStateChanged.emit(6, False)   # opcell fan 1
-            self.fanStateChanged.emit(7, False)   # opcell fan 2
-            self.fanStateChanged.emit(8, False)   # opcell fan 3
-            self.fanStateChanged.emit(9, False)   # opcell fan 4
-            self.fanStateChanged.emit(10, False)  # laser fan
+            fan_states = self._fans.states
+            changed_mask = 0
+            for fan_index in range(11):
+                if fan_states[fan_index]:
+                    fan_states[fan_index] = False
+                    changed_mask |= 1 << fan_index
+            if changed_mask:
+                self.fanStatesChanged.emit(changed_mask, 0)
+            self._fans.last_bits = None
             
             # Сбрасываем числовые значения (температуры, токи, давления) при отключении
-            self._water_chiller_temperature = 0.0
-            self._water_chiller_setpoint = 0.0
-            self._seop_cell_temperature = 0.0
-            self._magnet_psu_current = 0.0
-            self._magnet_psu_setpoint = 0.0
-            self._laser_psu_current = 0.0
-            self._laser_psu_setpoint = 0.0
-            self._xenon_pressure = 0.0
-            self._xenon_setpoint = 0.0
-            self._n2_pressure = 0.0
-            self._n2_setpoint = 0.0
-            self._vacuum_pressure = 0.0
-            self.waterChillerTemperatureChanged.emit(0.0)
-            self.waterChillerSetpointChanged.emit(0.0)
-            self.seopCellTemperatureChanged.emit(0.0)
-            self.seopCellSetpointChanged.emit(0.0)
-            self.magnetPSUCurrentChanged.emit(0.0)
-            self.magnetPSUSetpointChanged.emit(0.0)
-            self.laserPSUCurrentChanged.emit(0.0)
-            self.laserPSUSetpointChanged.emit(0.0)
-            self.xenonPressureChanged.emit(0.0)
-            self.xenonSetpointChanged.emit(0.0)
-            self.n2PressureChanged.emit(0.0)
-            self.n2SetpointChanged.emit(0.0)
-            self.vacuumPressureChanged.emit(0.0)
+            for attr, zero, signal_name in self._DISCONNECT_RESET_FIELDS:
+                if getattr(self, attr) != zero:
+                    setattr(self, attr, zero)
+                    getattr(self, signal_name).emit(zero)
             
             logger.info("Успешно отключено от Modbus устройства")
         except Exception as e:
@@ -1327,25 +1886,28 @@ class ModbusManager(QObject):
             self.errorOccurred.emit(error_msg)
             logger.error(error_msg, exc_info=True)
             # Все равно устанавливаем состояние отключено
-            self._is_connected = False
-            self._status_text = "Disconnected"
-            self._connection_button_text = "Connect"
-            self.connectionStatusChanged.emit(self._is_connected)
-            self.statusTextChanged.emit(self._status_text)
-            self.connectionButtonTextChanged.emit(self._connection_button_text)
+            self._setConnectionStatus("Disconnected", "Connect", False)
     
     @Slot(bool, str)
     def _onWorkerConnectFinished(self, success: bool, error_message: str):
         """Результат подключения из worker-потока."""
         self._connection_in_progress = False
 
+        if not success and self._auto_reconnect:
+            # Автоматическое переподключение: не показываем ошибку пользователю, пробуем снова
+            # с экспоненциально растущей задержкой, чтобы не забрасывать недоступное устройство SYN'ами
+            self._reconnect_attempt += 1
+            delay_ms = min(2 ** (self._reconnect_attempt - 1) * self._reconnect_base_ms, self._reconnect_max_ms)
+            self._reconnect_next_attempt_ts = time.monotonic() + delay_ms / 1000.0
+            logger.warning(
+                "Переподключение не удалось (%s), попытка %d, повтор через %d мс",
+                error_message, self._reconnect_attempt, delay_ms,
+            )
+            QTimer.singleShot(delay_ms, self._attemptReconnect)
+            return
+
         if not success:
-            self._is_connected = False
-            self._status_text = "Connection Failed" if error_message else "Connection Failed"
-            self._connection_button_text = "Connect"
-            self.connectionStatusChanged.emit(self._is_connected)
-            self.statusTextChanged.emit(self._status_text)
-            self.connectionButtonTextChanged.emit(self._connection_button_text)
+            self._setConnectionStatus("Connection Failed", "Connect", False)
 
             error_msg = (
                 f"Не удалось подключиться к {self._host}:{self._port}."
@@ -1360,42 +1922,22 @@ class ModbusManager(QObject):
             return
 
         # Успешное подключение
-        self._is_connected = True
-        self._status_text = "Connected"
-        self._connection_button_text = "Disconnect"
+        self._auto_reconnect = False
+        self._reconnect_attempt = 0
+        self._reconnect_next_attempt_ts = 0.0
+        self._setConnectionStatus("Connected", "Disconnect", True)
         self._connection_fail_count = 0
         self._sync_fail_count = 0
-        self._last_modbus_ok_time = time.time()
-
-        self.connectionStatusChanged.emit(self._is_connected)
-        self.statusTextChanged.emit(self._status_text)
-        self.connectionButtonTextChanged.emit(self._connection_button_text)
+        self._last_modbus_ok_time = time.monotonic()
 
         # Немедленно отправляем текущие состояния из буфера в UI для мгновенного отображения
         self._emitCachedStates()
 
         # Запускаем таймеры (они теперь будут только ставить задачи в worker, не блокируя UI)
-        self._connection_check_timer.start()
-        QTimer.singleShot(100, lambda: self._sync_timer.start())
-        QTimer.singleShot(50, lambda: self._relay_1021_timer.start())
-        QTimer.singleShot(80, lambda: self._valve_1111_timer.start())
-        QTimer.singleShot(110, lambda: self._water_chiller_temp_timer.start())
-        QTimer.singleShot(140, lambda: self._seop_cell_temp_timer.start())
-        QTimer.singleShot(170, lambda: self._magnet_psu_current_timer.start())
-        QTimer.singleShot(200, lambda: self._laser_psu_current_timer.start())
-        QTimer.singleShot(230, lambda: self._xenon_pressure_timer.start())
-        QTimer.singleShot(260, lambda: self._n2_pressure_timer.start())
-        QTimer.singleShot(290, lambda: self._vacuum_pressure_timer.start())
-        QTimer.singleShot(320, lambda: self._fan_1131_timer.start())
+        QTimer.singleShot(100, self._sync_timer.start)
 
         # Таймеры автообновления setpoint (UI-логика)
-        self._water_chiller_setpoint_auto_update_timer.start()
-        self._magnet_psu_setpoint_auto_update_timer.start()
-        self._laser_psu_setpoint_auto_update_timer.start()
-        self._seop_cell_setpoint_auto_update_timer.start()
-        self._pid_controller_setpoint_auto_update_timer.start()
-        self._xenon_setpoint_auto_update_timer.start()
-        self._n2_setpoint_auto_update_timer.start()
+        self._setpoint_auto_update_timer.start()
 
         logger.info("Успешное подключение к Modbus устройству (I/O в фоне)")
 
@@ -1406,71 +1948,42 @@ class ModbusManager(QObject):
 
     @Slot(str, object)
     def _onWorkerReadFinished(self, key: str, value: object):
-        # Любое успешное чтение считаем keep-alive
+        # Любое успешное чтение считаем keep-alive, неудачное — учитываем для обнаружения обрыва
         if value is not None:
-            self._last_modbus_ok_time = time.time()
+            self._last_modbus_ok_time = time.monotonic()
             self._connection_fail_count = 0
-
-        # Диспетчер чтений: ключи будут использоваться в polling методах
-        if key == "1021":
-            self._applyRelay1021Value(value)
-        elif key == "1111":
-            self._applyValve1111Value(value)
-        elif key == "1511":
-            self._applyWaterChillerTemperatureValue(value)
-        elif key == "1411":
-            self._applySeopCellTemperatureValue(value)
-        elif key == "1341":
-            self._applyMagnetPSUCurrentValue(value)
-        elif key == "1251":
-            self._applyLaserPSUCurrentValue(value)
-        elif key == "1611":
-            self._applyXenonPressureValue(value)
-        elif key == "1651":
-            self._applyN2PressureValue(value)
-        elif key == "1701":
-            self._applyVacuumPressureValue(value)
-        elif key == "1131":
-            self._applyFan1131Value(value)
-        elif key == "power_supply":
-            self._applyPowerSupplyValue(value)
-        elif key == "pid_controller":
-            self._applyPIDControllerValue(value)
-        elif key == "water_chiller":
-            self._applyWaterChillerValue(value)
-        elif key == "alicats":
-            self._applyAlicatsValue(value)
-        elif key == "vacuum_controller":
-            self._applyVacuumControllerValue(value)
-        elif key == "laser":
-            self._applyLaserValue(value)
-        elif key == "seop_parameters":
-            self._applySEOPParametersValue(value)
-        elif key == "calculated_parameters":
-            self._applyCalculatedParametersValue(value)
-        elif key == "measured_parameters":
-            self._applyMeasuredParametersValue(value)
-        elif key == "additional_parameters":
-            self._applyAdditionalParametersValue(value)
-        elif key == "manual_mode_settings":
-            self._applyManualModeSettingsValue(value)
-        elif key == "1020":
-            self._applyExternalRelays1020Value(value)
-        elif key == "ir":
-            self._ir_request_in_flight = False
-            if value is None:
-                logger.warning("IR spectrum read returned None")
-            self._applyIrSpectrum(value)
         else:
+            self._onRequestFailed()
+
+        if self._group_read_stalls.pop(key, None) is not None:
+            # Затянувшееся групповое чтение завершилось - возвращаем штатный интервал опроса
+            _, timer, base_interval = self._group_read_polls[key]
+            timer.setInterval(base_interval)
+
+        # Диспетчер чтений: один поиск по таблице вместо цепочки сравнений ключа
+        apply = self._read_appliers.get(key)
+        if apply is None:
             # Это могут быть "fire-and-forget" задачи; игнорируем.
             return
+        apply(value)
+
+        # Если за время чтения был пропущен тик опроса этого адреса — повторяем сразу
+        if key in self._dirty_reads:
+            self._dirty_reads.discard(key)
+            self._dirty_readers[key]()
 
     @Slot(str, bool, object)
     def _onWorkerWriteFinished(self, key: str, success: bool, meta: object):
+        # Результат записи учитывается так же, как результат чтения: переподключение решает только _onRequestFailed
         if success:
-            self._last_modbus_ok_time = time.time()
+            self._last_modbus_ok_time = time.monotonic()
+            self._connection_fail_count = 0
         else:
-            logger.warning(f"Modbus write failed: {key} meta={meta}")
+            logger.warning("Modbus write failed: %s meta=%s", key, meta)
+            self._onRequestFailed()
+        if key.startswith("write:"):
+            # writeRegister вернул True сразу после постановки в очередь; фактический результат - сигналом
+            self.registerWriteCompleted.emit(meta["address"], success)
 
     def _shutdownIoThread(self, *args):
         """Аккуратно останавливаем worker-поток при завершении приложения."""
@@ -1480,29 +1993,54 @@ class ModbusManager(QObject):
                 self._workerDisconnect.emit()
             except Exception:
                 pass
+            if hasattr(self, "_io_worker"):
+                # Цикл run() завершится после отключения, затем поток выйдет из event loop
+                self._io_worker.stop()
             if hasattr(self, "_io_thread") and self._io_thread.isRunning():
                 self._io_thread.quit()
                 self._io_thread.wait(1500)
         except Exception:
             pass
 
-    def _enqueue_read(self, key: str, func: Callable[[], Any]) -> None:
-        """Поставить задачу чтения в worker-поток."""
+    def _enqueue_read(self, key: str, func: Callable[[], Any], priority: int = PRIORITY_READ) -> None:
+        """Поставить задачу чтения в worker-поток (PRIORITY_BACKGROUND - для тяжелых чтений экранов параметров)."""
         try:
-            self._workerEnqueueRead.emit(key, func)
+            self._io_worker.enqueueRead(key, func, priority)
         except Exception:
             logger.exception("Failed to enqueue read task")
 
-    def _enqueue_write(self, key: str, func: Callable[[], bool], meta: object = None) -> None:
-        """Поставить задачу записи в worker-поток (приоритет)."""
+    def _enqueue_write(self, key: str, func: Callable[[], bool], meta: object = None, coalesce: bool = False) -> None:
+        """
+        Поставить задачу записи в worker-поток (приоритет).
+
+        coalesce=True - для записей абсолютного значения (setpoint): подряд идущие
+        записи с тем же ключом объединяются, выполняется только последняя.
+        """
         try:
-            self._workerEnqueueWrite.emit(key, func, meta)
+            if coalesce:
+                self._io_worker.enqueueWriteCoalesced(key, func, meta)
+            else:
+                self._io_worker.enqueueWrite(key, func, meta)
         except Exception:
             logger.exception("Failed to enqueue write task")
 
+    def _enqueueDebouncedWrite(self, key: str, func: Callable[[], bool], meta: object = None) -> None:
+        """
+        Отложенная запись setpoint: UI уже обновлен оптимистично, а в очередь worker'а
+        попадает только последнее значение после паузы SETPOINT_WRITE_DEBOUNCE_MS.
+        """
+        self._debounced_writes[key] = (func, meta)
+        self._setpoint_write_timer.start()
+
+    @Slot()
+    def _flushDebouncedWrites(self):
+        pending = self._debounced_writes
+        self._debounced_writes = {}
+        for key, (func, meta) in pending.items():
+            self._enqueue_write(key, func, meta, coalesce=True)
+
     # ===== apply-методы: применяют результат чтения в GUI-потоке =====
     def _applyRelay1021Value(self, value: object):
-        self._reading_1021 = False
         if value is None:
             return
         try:
@@ -1510,122 +2048,143 @@ class ModbusManager(QObject):
         except Exception:
             return
 
+        # Эмитируем только для реле, состояние которых отличается от буфера
+        # (буфер учитывает и оптимистичные обновления из UI)
         low_byte = value_int & 0xFF
-        self._relay_states['water_chiller'] = bool(low_byte & 0x01)
-        self._relay_states['magnet_psu'] = bool(low_byte & 0x02)
-        self._relay_states['laser_psu'] = bool(low_byte & 0x04)
-        self._relay_states['vacuum_pump'] = bool(low_byte & 0x08)
-        self._relay_states['vacuum_gauge'] = bool(low_byte & 0x10)
-        self._relay_states['pid_controller'] = bool(low_byte & 0x20)
-        self._relay_states['op_cell_heating'] = bool(low_byte & 0x40)
-
-        self.waterChillerStateChanged.emit(self._relay_states['water_chiller'])
-        self.magnetPSUStateChanged.emit(self._relay_states['magnet_psu'])
-        self.laserPSUStateChanged.emit(self._relay_states['laser_psu'])
-        self.vacuumPumpStateChanged.emit(self._relay_states['vacuum_pump'])
-        self.vacuumGaugeStateChanged.emit(self._relay_states['vacuum_gauge'])
-        self.pidControllerStateChanged.emit(self._relay_states['pid_controller'])
-        self.opCellHeatingStateChanged.emit(self._relay_states['op_cell_heating'])
+        relays = self._relays
+        if low_byte == relays.last_bits:
+            # Регистр не изменился с прошлого чтения, буфер с ним согласован
+            return
+        relays.last_bits = low_byte
+        relay_states = relays.states
+        changed_mask = 0  # Изменившиеся реле для одного relayStatesChanged
+        for key, mask in self._relay_bit_table:
+            state = bool(low_byte & mask)
+            if relay_states[key] != state:
+                relay_states[key] = state
+                changed_mask |= mask
+        if changed_mask:
+            # После цикла буфер совпадает с прочитанным байтом для всех реле из таблицы
+            self.relayStatesChanged.emit(changed_mask, low_byte & _RELAY_BITS_MASK)
 
     def _applyValve1111Value(self, value: object):
-        self._reading_1111 = False
         if value is None:
             return
         try:
             value_int = int(value)
         except Exception:
             return
-        for valve_index in range(5, 12):
-            state = bool(value_int & (1 << valve_index))
-            self._valve_states[valve_index] = state
-            self.valveStateChanged.emit(valve_index, state)
+        valves = self._valves
+        bits = value_int & valves.BITS_MASK
+        if bits == valves.last_bits:
+            # Регистр не изменился с прошлого чтения, буфер с ним согласован
+            return
+        valves.last_bits = bits
+        valve_states = valves.states
+        changed_mask = 0  # Изменившиеся valveIndex для одного valveStatesChanged
+        for valve_index, mask in self._valve_bit_table:
+            state = bool(bits & mask)
+            if valve_states[valve_index] != state:
+                valve_states[valve_index] = state
+                changed_mask |= mask
+        if changed_mask:
+            self.valveStatesChanged.emit(changed_mask, bits)
 
     def _applyWaterChillerTemperatureValue(self, value: object):
-        self._reading_1511 = False
         if value is None:
             return
+        temperature = self._scaleRaw100(1511, value, self._water_chiller_temperature)
+        if temperature is None:
+            return
+        self._water_chiller_temperature = temperature
+        self._emitTemperatureIfVisible('waterChillerTemperatureChanged', temperature)
+
+    def _scaleRaw100(self, address: int, value: object, current: float):
+        """
+        Перевод сырого значения регистра в value/100.
+
+        Возвращает None, если значение нельзя преобразовать или сырое значение не изменилось
+        с прошлого чтения и уже применено (сравнение int до float-деления).
+        """
+        cached = self._last_raw_values.get(address)
+        if cached is not None and cached[0] == value and cached[1] == current:
+            return None
         try:
-            temperature = float(int(value)) / 100.0
+            scaled = float(int(value)) / 100.0
         except Exception:
+            return None
+        self._last_raw_values[address] = (value, scaled)
+        return scaled
+
+    def _emitTemperatureIfVisible(self, signal_name: str, temperature: float):
+        """Эмит температуры, только если она меняет отображаемое значение (округление до _TEMP_DISPLAY_DIGITS знаков)"""
+        last = self._last_emitted_temperatures.get(signal_name)
+        digits = self._TEMP_DISPLAY_DIGITS
+        if last is not None and round(temperature, digits) == round(last, digits):
             return
-        if self._water_chiller_temperature != temperature:
-            self._water_chiller_temperature = temperature
-            self.waterChillerTemperatureChanged.emit(temperature)
+        self._last_emitted_temperatures[signal_name] = temperature
+        getattr(self, signal_name).emit(temperature)
 
     def _applySeopCellTemperatureValue(self, value: object):
-        self._reading_1411 = False
         if value is None:
             return
-        try:
-            temperature = float(int(value)) / 100.0
-        except Exception:
+        temperature = self._scaleRaw100(1411, value, self._seop_cell_temperature)
+        if temperature is None:
             return
-        if self._seop_cell_temperature != temperature:
-            self._seop_cell_temperature = temperature
-            self.seopCellTemperatureChanged.emit(temperature)
+        self._seop_cell_temperature = temperature
+        self._emitTemperatureIfVisible('seopCellTemperatureChanged', temperature)
 
     def _applyMagnetPSUCurrentValue(self, value: object):
-        self._reading_1341 = False
         if value is None:
             return
-        try:
-            current = float(int(value)) / 100.0
-        except Exception:
+        current = self._scaleRaw100(1341, value, self._magnet_psu_current)
+        if current is None:
             return
         if self._magnet_psu_current != current:
             self._magnet_psu_current = current
             self.magnetPSUCurrentChanged.emit(current)
 
     def _applyLaserPSUCurrentValue(self, value: object):
-        self._reading_1251 = False
         if value is None:
             return
-        try:
-            current = float(int(value)) / 100.0
-        except Exception:
+        current = self._scaleRaw100(1251, value, self._laser_psu_current)
+        if current is None:
             return
         if self._laser_psu_current != current:
             self._laser_psu_current = current
             self.laserPSUCurrentChanged.emit(current)
 
     def _applyXenonPressureValue(self, value: object):
-        self._reading_1611 = False
         if value is None:
             return
-        try:
-            pressure = float(int(value)) / 100.0
-        except Exception:
+        pressure = self._scaleRaw100(1611, value, self._xenon_pressure)
+        if pressure is None:
             return
         if self._xenon_pressure != pressure:
             self._xenon_pressure = pressure
             self.xenonPressureChanged.emit(pressure)
 
     def _applyN2PressureValue(self, value: object):
-        self._reading_1651 = False
         if value is None:
             return
-        try:
-            pressure = float(int(value)) / 100.0
-        except Exception:
+        pressure = self._scaleRaw100(1651, value, self._n2_pressure)
+        if pressure is None:
             return
         if self._n2_pressure != pressure:
             self._n2_pressure = pressure
             self.n2PressureChanged.emit(pressure)
 
     def _applyVacuumPressureValue(self, value: object):
-        self._reading_1701 = False
         if value is None:
             return
-        try:
-            pressure = float(int(value)) / 100.0
-        except Exception:
+        pressure = self._scaleRaw100(1701, value, self._vacuum_pressure)
+        if pressure is None:
             return
         if self._vacuum_pressure != pressure:
             self._vacuum_pressure = pressure
             self.vacuumPressureChanged.emit(pressure)
 
     def _applyFan1131Value(self, value: object):
-        self._reading_1131 = False
         if value is None:
             return
         try:
@@ -1633,43 +2192,41 @@ class ModbusManager(QObject):
         except Exception:
             return
 
-        fan_mapping = {
-            0: 0,
-            1: 1,
-            2: 2,
-            3: 3,
-            6: 4,
-            7: 5,
-            8: 6,
-            9: 7,
-            4: 8,
-            5: 9,
-        }
-
-        current_time = time.time()
-        for fan_index, bit_pos in fan_mapping.items():
-            if fan_index in self._fan_optimistic_updates:
-                time_since_update = current_time - self._fan_optimistic_updates[fan_index]
-                if time_since_update < 0.5:
-                    continue
-                del self._fan_optimistic_updates[fan_index]
-
-            state = bool(value_int & (1 << bit_pos))
-            self._fan_states[fan_index] = state
-            self.fanStateChanged.emit(fan_index, state)
-
-        # laser fan: bit 15
-        if 10 in self._fan_optimistic_updates:
-            time_since_update = current_time - self._fan_optimistic_updates[10]
-            if time_since_update >= 0.5:
-                del self._fan_optimistic_updates[10]
-                laser_fan_state = bool(value_int & (1 << 15))
-                self._fan_states[10] = laser_fan_state
-                self.fanStateChanged.emit(10, laser_fan_state)
+        fans = self._fans
+        bits = value_int & _FAN_BITS_MASK
+        last_bits = fans.last_bits
+        if last_bits is None:
+            # Буфер менялся вне чтения (setFan, отключение) - проходим по всем битам
+            changed = _FAN_BITS_MASK
         else:
-            laser_fan_state = bool(value_int & (1 << 15))
-            self._fan_states[10] = laser_fan_state
-            self.fanStateChanged.emit(10, laser_fan_state)
+            # Только изменившиеся с прошлого чтения биты
+            changed = bits ^ last_bits
+            if not changed:
+                return
+        fans.last_bits = bits
+
+        now = time.monotonic()
+        deadline = fans.optimistic_deadline
+        fan_states = fans.states
+        changed_mask = 0  # Изменившиеся fanIndex для одного fanStatesChanged
+        on_mask = 0
+        while changed:
+            mask = changed & -changed
+            changed ^= mask
+            fan_index = _FAN_INDEX_BY_BIT[mask.bit_length() - 1]
+            if now < deadline[fan_index]:
+                # Кнопка только что нажата: сверим ее полным проходом после окончания окна
+                fans.last_bits = None
+                continue
+
+            state = bool(bits & mask)
+            if fan_states[fan_index] != state:
+                fan_states[fan_index] = state
+                changed_mask |= 1 << fan_index
+                if state:
+                    on_mask |= 1 << fan_index
+        if changed_mask:
+            self.fanStatesChanged.emit(changed_mask, on_mask)
 
     def _applyPowerSupplyValue(self, value: object):
         """Применение результатов чтения Power Supply (Laser PSU и Magnet PSU)"""
@@ -1709,243 +2266,257 @@ class ModbusManager(QObject):
         
         if 'temperature' in value:
             temp = float(value['temperature'])
-            self._pid_controller_temperature = temp
-            self.pidControllerTemperatureChanged.emit(temp)
+            if self._pid_controller_temperature != temp:
+                self._pid_controller_temperature = temp
+                self.pidControllerTemperatureChanged.emit(temp)
         if 'setpoint' in value:
             setpoint = float(value['setpoint'])
             # Обновляем только если пользователь не взаимодействует с полем
-            if not self._pid_controller_setpoint_user_interaction:
+            if not self._pid_controller_setpoint_user_interaction and self._pid_controller_setpoint != setpoint:
                 self._pid_controller_setpoint = setpoint
                 self.pidControllerSetpointChanged.emit(setpoint)
         if 'state' in value:
             state = bool(value['state'])
-            self._pid_controller_state = state
-            self.pidControllerStateChanged.emit(state)
+            if self._pid_controller_state != state:
+                self._pid_controller_state = state
+                self.pidControllerStateChanged.emit(state)
     
     def _applyWaterChillerValue(self, value: object):
         """Применение результатов чтения Water Chiller (1511, 1521, 1531, 1541)"""
         self._reading_water_chiller = False
         if value is None or not isinstance(value, dict):
-            logger.warning(f"_applyWaterChillerValue: value is None or not dict: {value}")
+            logger.warning("_applyWaterChillerValue: value is None or not dict: %s", value)
             return
         
-        logger.debug(f"_applyWaterChillerValue: received value={value}")
+        logger.debug("_applyWaterChillerValue: received value=%s", value)
         
         if 'inlet_temperature' in value:
             temp = float(value['inlet_temperature'])
-            self._water_chiller_inlet_temperature = temp
-            self._water_chiller_temperature = temp  # Для обратной совместимости
-            self.waterChillerInletTemperatureChanged.emit(temp)
-            self.waterChillerTemperatureChanged.emit(temp)  # Старый сигнал для обратной совместимости
-            logger.debug(f"Water Chiller inlet temperature: {temp}°C")
+            if self._water_chiller_inlet_temperature != temp:
+                self._water_chiller_inlet_temperature = temp
+                self.waterChillerInletTemperatureChanged.emit(temp)
+                logger.debug("Water Chiller inlet temperature: %s°C", temp)
+            # Старый сигнал для обратной совместимости: через тот же кэш, что и одиночное чтение 1511,
+            # иначе кэш отстает от UI и следующее одиночное чтение подавляется
+            self._water_chiller_temperature = temp
+            self._emitTemperatureIfVisible('waterChillerTemperatureChanged', temp)
         if 'outlet_temperature' in value:
             temp = float(value['outlet_temperature'])
-            self._water_chiller_outlet_temperature = temp
-            self.waterChillerOutletTemperatureChanged.emit(temp)
-            logger.debug(f"Water Chiller outlet temperature: {temp}°C")
+            if self._water_chiller_outlet_temperature != temp:
+                self._water_chiller_outlet_temperature = temp
+                self.waterChillerOutletTemperatureChanged.emit(temp)
+                logger.debug("Water Chiller outlet temperature: %s°C", temp)
         if 'setpoint' in value:
             setpoint = float(value['setpoint'])
             # Обновляем только если пользователь не взаимодействует с полем
-            if not self._water_chiller_setpoint_user_interaction:
+            if not self._water_chiller_setpoint_user_interaction and self._water_chiller_setpoint != setpoint:
                 self._water_chiller_setpoint = setpoint
                 self.waterChillerSetpointChanged.emit(setpoint)
-                logger.debug(f"Water Chiller setpoint: {setpoint}°C")
+                logger.debug("Water Chiller setpoint: %s°C", setpoint)
         if 'state' in value:
             state = bool(value['state'])
-            self._water_chiller_state = state
-            self.waterChillerStateChanged.emit(state)
-            logger.debug(f"Water Chiller state: {state}")
+            if self._water_chiller_state != state:
+                self._water_chiller_state = state
+                self.waterChillerStateChanged.emit(state)
+                logger.debug("Water Chiller state: %s", state)
     
     def _applyAlicatsValue(self, value: object):
         """Применение результатов чтения Alicats (1611, 1621, 1651, 1661)"""
         self._reading_alicats = False
         if value is None or not isinstance(value, dict):
-            logger.warning(f"_applyAlicatsValue: value is None or not dict: {value}")
+            logger.warning("_applyAlicatsValue: value is None or not dict: %s", value)
             return
         
-        logger.debug(f"_applyAlicatsValue: received value={value}")
+        logger.debug("_applyAlicatsValue: received value=%s", value)
         
         if 'xenon_pressure' in value:
             pressure = float(value['xenon_pressure'])
-            self._xenon_pressure = pressure
-            self.xenonPressureChanged.emit(pressure)
-            logger.debug(f"Alicat 1 Xenon pressure: {pressure} Torr")
+            if self._xenon_pressure != pressure:
+                self._xenon_pressure = pressure
+                self.xenonPressureChanged.emit(pressure)
+                logger.debug("Alicat 1 Xenon pressure: %s Torr", pressure)
         if 'xenon_setpoint' in value:
             setpoint = float(value['xenon_setpoint'])
             # Обновляем только если пользователь не взаимодействует с полем
-            if not self._xenon_setpoint_user_interaction:
+            if not self._xenon_setpoint_user_interaction and self._xenon_setpoint != setpoint:
                 self._xenon_setpoint = setpoint
                 self.xenonSetpointChanged.emit(setpoint)
-                logger.debug(f"Alicat 1 Xenon setpoint: {setpoint} Torr")
+                logger.debug("Alicat 1 Xenon setpoint: %s Torr", setpoint)
         if 'n2_pressure' in value:
             pressure = float(value['n2_pressure'])
-            self._n2_pressure = pressure
-            self.n2PressureChanged.emit(pressure)
-            logger.debug(f"Alicat 2 N2 pressure: {pressure} Torr")
+            if self._n2_pressure != pressure:
+                self._n2_pressure = pressure
+                self.n2PressureChanged.emit(pressure)
+                logger.debug("Alicat 2 N2 pressure: %s Torr", pressure)
         if 'n2_setpoint' in value:
             setpoint = float(value['n2_setpoint'])
             # Обновляем только если пользователь не взаимодействует с полем
-            if not self._n2_setpoint_user_interaction:
+            if not self._n2_setpoint_user_interaction and self._n2_setpoint != setpoint:
                 self._n2_setpoint = setpoint
                 self.n2SetpointChanged.emit(setpoint)
-                logger.debug(f"Alicat 2 N2 setpoint: {setpoint} Torr")
+                logger.debug("Alicat 2 N2 setpoint: %s Torr", setpoint)
     
     def _applyVacuumControllerValue(self, value: object):
         """Применение результатов чтения Vacuum Controller (1701)"""
         self._reading_vacuum_controller = False
         if value is None or not isinstance(value, dict):
-            logger.warning(f"_applyVacuumControllerValue: value is None or not dict: {value}")
+            logger.warning("_applyVacuumControllerValue: value is None or not dict: %s", value)
             return
         
-        logger.debug(f"_applyVacuumControllerValue: received value={value}")
+        logger.debug("_applyVacuumControllerValue: received value=%s", value)
         
         if 'pressure' in value:
             pressure_mtorr = float(value['pressure'])
-            self._vacuum_controller_pressure = pressure_mtorr
-            self.vacuumControllerPressureChanged.emit(pressure_mtorr)
-            logger.debug(f"Vacuum Controller pressure: {pressure_mtorr} mTorr")
+            if self._vacuum_controller_pressure != pressure_mtorr:
+                self._vacuum_controller_pressure = pressure_mtorr
+                self.vacuumControllerPressureChanged.emit(pressure_mtorr)
+                logger.debug("Vacuum Controller pressure: %s mTorr", pressure_mtorr)
     
     def _applyLaserValue(self, value: object):
         """Применение результатов чтения Laser (1811, 1821, 1831, 1841)"""
         self._reading_laser = False
         if value is None or not isinstance(value, dict):
-            logger.warning(f"_applyLaserValue: value is None or not dict: {value}")
+            logger.warning("_applyLaserValue: value is None or not dict: %s", value)
             return
         
-        logger.debug(f"_applyLaserValue: received value={value}")
+        logger.debug("_applyLaserValue: received value=%s", value)
         
         if 'beam_state' in value:
             state = bool(value['beam_state'])
-            self._laser_beam_state = state
-            self.laserBeamStateChanged.emit(state)
-            logger.debug(f"Laser Beam state: {state}")
+            if self._laser_beam_state != state:
+                self._laser_beam_state = state
+                self.laserBeamStateChanged.emit(state)
+                logger.debug("Laser Beam state: %s", state)
         if 'mpd' in value:
             mpd = float(value['mpd'])
-            self._laser_mpd = mpd
-            self.laserMPDChanged.emit(mpd)
-            logger.debug(f"Laser MPD: {mpd} uA")
+            if self._laser_mpd != mpd:
+                self._laser_mpd = mpd
+                self.laserMPDChanged.emit(mpd)
+                logger.debug("Laser MPD: %s uA", mpd)
         if 'output_power' in value:
             output_power = float(value['output_power'])
-            self._laser_output_power = output_power
-            self.laserOutputPowerChanged.emit(output_power)
-            logger.debug(f"Laser Output Power: {output_power}")
+            if self._laser_output_power != output_power:
+                self._laser_output_power = output_power
+                self.laserOutputPowerChanged.emit(output_power)
+                logger.debug("Laser Output Power: %s", output_power)
         if 'temp' in value:
             temp = float(value['temp'])
-            self._laser_temp = temp
-            self.laserTempChanged.emit(temp)
-            logger.debug(f"Laser Temp: {temp}")
+            if self._laser_temp != temp:
+                self._laser_temp = temp
+                self.laserTempChanged.emit(temp)
+                logger.debug("Laser Temp: %s", temp)
     
     def _applySEOPParametersValue(self, value: object):
         """Применение результатов чтения SEOP Parameters (3011-3081)"""
         self._reading_seop_parameters = False
         if value is None or not isinstance(value, dict):
-            logger.warning(f"_applySEOPParametersValue: value is None or not dict: {value}")
+            logger.warning("_applySEOPParametersValue: value is None or not dict: %s", value)
             return
         
-        logger.debug(f"_applySEOPParametersValue: received value={value}")
+        logger.debug("_applySEOPParametersValue: received value=%s", value)
         
         if 'laser_max_temp' in value:
             temp = float(value['laser_max_temp'])
-            if not self._seop_laser_max_temp_user_interaction:
+            if not self._seop_laser_max_temp_user_interaction and self._seop_laser_max_temp != temp:
                 self._seop_laser_max_temp = temp
                 self.seopLaserMaxTempChanged.emit(temp)
-                logger.debug(f"SEOP Laser Max Temp: {temp}°C")
+                logger.debug("SEOP Laser Max Temp: %s°C", temp)
         if 'laser_min_temp' in value:
             temp = float(value['laser_min_temp'])
-            if not self._seop_laser_min_temp_user_interaction:
+            if not self._seop_laser_min_temp_user_interaction and self._seop_laser_min_temp != temp:
                 self._seop_laser_min_temp = temp
                 self.seopLaserMinTempChanged.emit(temp)
-                logger.debug(f"SEOP Laser Min Temp: {temp}°C")
+                logger.debug("SEOP Laser Min Temp: %s°C", temp)
         if 'cell_max_temp' in value:
             temp = float(value['cell_max_temp'])
-            if not self._seop_cell_max_temp_user_interaction:
+            if not self._seop_cell_max_temp_user_interaction and self._seop_cell_max_temp != temp:
                 self._seop_cell_max_temp = temp
                 self.seopCellMaxTempChanged.emit(temp)
-                logger.debug(f"SEOP Cell Max Temp: {temp}°C")
+                logger.debug("SEOP Cell Max Temp: %s°C", temp)
         if 'cell_min_temp' in value:
             temp = float(value['cell_min_temp'])
-            if not self._seop_cell_min_temp_user_interaction:
+            if not self._seop_cell_min_temp_user_interaction and self._seop_cell_min_temp != temp:
                 self._seop_cell_min_temp = temp
                 self.seopCellMinTempChanged.emit(temp)
-                logger.debug(f"SEOP Cell Min Temp: {temp}°C")
+                logger.debug("SEOP Cell Min Temp: %s°C", temp)
         if 'ramp_temp' in value:
             temp = float(value['ramp_temp'])
-            if not self._seop_ramp_temp_user_interaction:
+            if not self._seop_ramp_temp_user_interaction and self._seop_ramp_temp != temp:
                 self._seop_ramp_temp = temp
                 self.seopRampTempChanged.emit(temp)
-                logger.debug(f"SEOP Ramp Temp: {temp}°C")
+                logger.debug("SEOP Ramp Temp: %s°C", temp)
         if 'seop_temp' in value:
             temp = float(value['seop_temp'])
-            if not self._seop_temp_user_interaction:
+            if not self._seop_temp_user_interaction and self._seop_temp != temp:
                 self._seop_temp = temp
                 self.seopTempChanged.emit(temp)
-                logger.debug(f"SEOP Temp: {temp}°C")
+                logger.debug("SEOP Temp: %s°C", temp)
         if 'cell_refill_temp' in value:
             temp = float(value['cell_refill_temp'])
-            if not self._seop_cell_refill_temp_user_interaction:
+            if not self._seop_cell_refill_temp_user_interaction and self._seop_cell_refill_temp != temp:
                 self._seop_cell_refill_temp = temp
                 self.seopCellRefillTempChanged.emit(temp)
-                logger.debug(f"SEOP Cell Refill Temp: {temp}°C")
+                logger.debug("SEOP Cell Refill Temp: %s°C", temp)
         if 'loop_time' in value:
             time_val = float(value['loop_time'])
-            if not self._seop_loop_time_user_interaction:
+            if not self._seop_loop_time_user_interaction and self._seop_loop_time != time_val:
                 self._seop_loop_time = time_val
                 self.seopLoopTimeChanged.emit(time_val)
-                logger.debug(f"SEOP Loop Time: {time_val} s")
+                logger.debug("SEOP Loop Time: %s s", time_val)
         if 'process_duration' in value:
             duration = float(value['process_duration'])
-            if not self._seop_process_duration_user_interaction:
+            if not self._seop_process_duration_user_interaction and self._seop_process_duration != duration:
                 self._seop_process_duration = duration
                 self.seopProcessDurationChanged.emit(duration)
-                logger.debug(f"SEOP Process Duration: {duration} min")
+                logger.debug("SEOP Process Duration: %s min", duration)
         if 'laser_max_output_power' in value:
             power = float(value['laser_max_output_power'])
-            if not self._seop_laser_max_output_power_user_interaction:
+            if not self._seop_laser_max_output_power_user_interaction and self._seop_laser_max_output_power != power:
                 self._seop_laser_max_output_power = power
                 self.seopLaserMaxOutputPowerChanged.emit(power)
-                logger.debug(f"SEOP Laser Max Output Power: {power} W")
+                logger.debug("SEOP Laser Max Output Power: %s W", power)
         if 'laser_psu_max_current' in value:
             current = float(value['laser_psu_max_current'])
-            if not self._seop_laser_psu_max_current_user_interaction:
+            if not self._seop_laser_psu_max_current_user_interaction and self._seop_laser_psu_max_current != current:
                 self._seop_laser_psu_max_current = current
                 self.seopLaserPSUMaxCurrentChanged.emit(current)
-                logger.debug(f"SEOP Laser PSU MAX Current: {current} A")
+                logger.debug("SEOP Laser PSU MAX Current: %s A", current)
         if 'water_chiller_max_temp' in value:
             temp = float(value['water_chiller_max_temp'])
-            if not self._seop_water_chiller_max_temp_user_interaction:
+            if not self._seop_water_chiller_max_temp_user_interaction and self._seop_water_chiller_max_temp != temp:
                 self._seop_water_chiller_max_temp = temp
                 self.seopWaterChillerMaxTempChanged.emit(temp)
-                logger.debug(f"SEOP Water Chiller Max Temp: {temp}°C")
+                logger.debug("SEOP Water Chiller Max Temp: %s°C", temp)
         if 'water_chiller_min_temp' in value:
             temp = float(value['water_chiller_min_temp'])
-            if not self._seop_water_chiller_min_temp_user_interaction:
+            if not self._seop_water_chiller_min_temp_user_interaction and self._seop_water_chiller_min_temp != temp:
                 self._seop_water_chiller_min_temp = temp
                 self.seopWaterChillerMinTempChanged.emit(temp)
-                logger.debug(f"SEOP Water Chiller Min Temp: {temp}°C")
+                logger.debug("SEOP Water Chiller Min Temp: %s°C", temp)
         if 'xe_concentration' in value:
             concentration = float(value['xe_concentration'])
-            if not self._seop_xe_concentration_user_interaction:
+            if not self._seop_xe_concentration_user_interaction and self._seop_xe_concentration != concentration:
                 self._seop_xe_concentration = concentration
                 self.seopXeConcentrationChanged.emit(concentration)
-                logger.debug(f"SEOP 129Xe concentration: {concentration} mMol")
+                logger.debug("SEOP 129Xe concentration: %s mMol", concentration)
         if 'water_proton_concentration' in value:
             concentration = float(value['water_proton_concentration'])
-            if not self._seop_water_proton_concentration_user_interaction:
+            if not self._seop_water_proton_concentration_user_interaction and self._seop_water_proton_concentration != concentration:
                 self._seop_water_proton_concentration = concentration
                 self.seopWaterProtonConcentrationChanged.emit(concentration)
-                logger.debug(f"SEOP Water proton concentration: {concentration} Mol")
+                logger.debug("SEOP Water proton concentration: %s Mol", concentration)
         if 'cell_number' in value:
             cell_num = int(value['cell_number'])
-            if not self._seop_cell_number_user_interaction:
+            if not self._seop_cell_number_user_interaction and self._seop_cell_number != cell_num:
                 self._seop_cell_number = cell_num
                 self.seopCellNumberChanged.emit(cell_num)
-                logger.debug(f"SEOP Cell number: {cell_num}")
+                logger.debug("SEOP Cell number: %s", cell_num)
         if 'refill_cycle' in value:
             refill = int(value['refill_cycle'])
-            if not self._seop_refill_cycle_user_interaction:
+            if not self._seop_refill_cycle_user_interaction and self._seop_refill_cycle != refill:
                 self._seop_refill_cycle = refill
                 self.seopRefillCycleChanged.emit(refill)
-                logger.debug(f"SEOP Refill cycle: {refill}")
+                logger.debug("SEOP Refill cycle: %s", refill)
     
     def _applyExternalRelays1020Value(self, value: object):
         if value is None:
@@ -1954,9 +2525,11 @@ class ModbusManager(QObject):
             value_int = int(value)
         except Exception:
             return
+        if self._register_cache.get(1020) == value_int:
+            return
         self._register_cache[1020] = value_int
         low_byte = value_int & 0xFF
-        binary_str = format(low_byte, '08b')
+        binary_str = _BIN8[low_byte]
         self.externalRelaysChanged.emit(low_byte, binary_str)
 
     def _registers_to_float_ir(self, reg1: int, reg2: int) -> float:
@@ -1964,14 +2537,8 @@ class ModbusManager(QObject):
         IR float decode как в test_modbus.registers_to_float_ir:
         swap byte1<->byte2 и byte3<->byte4.
         """
-        import struct
-        byte1 = (reg1 >> 8) & 0xFF
-        byte2 = reg1 & 0xFF
-        byte3 = (reg2 >> 8) & 0xFF
-        byte4 = reg2 & 0xFF
-        swapped = bytes([byte2, byte1, byte4, byte3])
         try:
-            return float(struct.unpack(">f", swapped)[0])
+            return float(_FLOAT_BE.unpack(_IR_FLOAT_WORDS.pack(reg1 & 0xFFFF, reg2 & 0xFFFF))[0])
         except Exception:
             return 0.0
 
@@ -1979,17 +2546,24 @@ class ModbusManager(QObject):
         """
         Применяет результат чтения IR спектра (GUI поток) и дергает сигнал для QML графика.
         """
+        self._ir_request_in_flight = False
+        if value is None:
+            logger.warning("IR spectrum read returned None")
         if not value or not isinstance(value, dict):
             logger.warning("IR spectrum: empty/invalid payload (not a dict or None)")
             return
-        pts = value.get("points")
-        logger.info(
-            f"IR spectrum: payload received, points={len(pts) if isinstance(pts, list) else 'n/a'} "
-            f"x=[{value.get('x_min')},{value.get('x_max')}] y=[{value.get('y_min')},{value.get('y_max')}] "
-            f"status={value.get('status')}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            data = value.get("data")
+            logger.info(
+                "IR spectrum: payload received, points=%s x=[%s,%s] y=[%s,%s] status=%s",
+                len(data) if isinstance(data, list) else 'n/a',
+                value.get('x_min'), value.get('x_max'), value.get('y_min'), value.get('y_max'),
+                value.get('status'),
+            )
         self._ir_last = value
-        self.irSpectrumChanged.emit(value)
+        # В QVariantMap конвертируем только то, что рисует график:
+        # сырые регистры и варианты декодирования остаются в _ir_last
+        self.irSpectrumChanged.emit({key: value[key] for key in _IR_QML_KEYS if key in value})
 
     @Slot(result=bool)
     def requestIrSpectrum(self) -> bool:
@@ -2014,8 +2588,6 @@ class ModbusManager(QObject):
         client = self._modbus_client
 
         def task():
-            import math
-            import struct
             # Читаем 400..414 и 420..477 (как в test_modbus при ir)
             # Метаданные лучше читать одним блоком (15 регистров) — иначе иногда "плывут" поля.
             meta = client.read_input_registers_direct(400, 15, max_chunk=15)
@@ -2083,29 +2655,12 @@ class ModbusManager(QObject):
                 A,B = bytes of reg1 (hi,lo); C,D = bytes of reg2 (hi,lo)
                 Variants: ABCD, BADC (swap bytes in words), CDAB (swap words), DCBA (full reverse)
                 """
-                A = (reg1 >> 8) & 0xFF
-                B = reg1 & 0xFF
-                C = (reg2 >> 8) & 0xFF
-                D = reg2 & 0xFF
-                orders = {
-                    "ABCD": bytes([A, B, C, D]),
-                    "BADC": bytes([B, A, D, C]),
-                    "CDAB": bytes([C, D, A, B]),
-                    "DCBA": bytes([D, C, B, A]),
-                }
-                out: dict[str, float] = {}
-                for k, bb in orders.items():
-                    try:
-                        v = float(struct.unpack(">f", bb)[0])
-                    except Exception:
-                        continue
-                    if math.isfinite(v):
-                        out[k] = v
-                return out
+                return {k: v for k, v in _float_byte_order_variants(reg1, reg2) if math.isfinite(v)}
 
             def _float_from_regs_with_key(reg1: int, reg2: int, key: str) -> float:
-                vmap = _float_variants_from_regs(reg1, reg2)
-                return float(vmap.get(key, float("nan")))
+                # Формат уже подобран по x_min/x_max - декодируем только его, а не все четыре варианта
+                v = _FLOAT_ORDER_DECODERS[key](reg1 & 0xFFFF, reg2 & 0xFFFF)
+                return v if math.isfinite(v) else float("nan")
 
             # Определяем формат метаданных по x_min/x_max (401-404)
             xmin_r1, xmin_r2 = int(meta[1]), int(meta[2])
@@ -2219,12 +2774,7 @@ class ModbusManager(QObject):
             # Преобразование для отображения:
             # Значения могут быть отрицательными -> интерпретируем как int16 (two's complement).
             # => отображаем как int16 / 100.0
-            def _to_int16(u16: int) -> int:
-                return u16 - 65536 if u16 >= 32768 else u16
-
-            y_values_raw_i16 = [_to_int16(v) for v in y_values_raw_u16]
-            scale = 100.0
-            y_values = [float(v) / scale for v in y_values_raw_i16]
+            y_values_raw_i16, y_values = _decode_int16_block(y_values_raw_u16, 100.0)
 
             # Убеждаемся, что у нас ровно 58 точек
             if len(y_values) != 58:
@@ -2236,29 +2786,8 @@ class ModbusManager(QObject):
                     logger.error(f"IR spectrum: insufficient data points: {len(y_values)} < 58")
                     return None
 
-            # Собираем точки для графика (x равномерно от x_min до x_max)
-            # Шаг вычисляется как (x_max - x_min) / status, где status из регистра 400
-            # Но для растяжения на весь диапазон используем формулу:
-            # x[i] = x_min + (x_max - x_min) * i / (n-1), чтобы последняя точка была на x_max
-            # ВСЕ 58 точек должны быть построены и растянуты на весь диапазон [x_min, x_max]
-            points = []
-            if len(y_values) >= 2 and x_max != x_min and status > 0:
-                # Растягиваем все точки на весь диапазон от x_min до x_max
-                # Используем status для вычисления шага, но распределяем точки равномерно
-                for i, y in enumerate(y_values):
-                    if len(y_values) > 1:
-                        x_coord = x_min + (x_max - x_min) * float(i) / float(len(y_values) - 1)
-                    else:
-                        x_coord = x_min
-                    points.append({"x": x_coord, "y": float(y)})
-            elif len(y_values) >= 2 and x_max != x_min:
-                # Fallback: если status невалиден, используем старую формулу
-                step = (x_max - x_min) / float(len(y_values) - 1)
-                for i, y in enumerate(y_values):
-                    points.append({"x": x_min + step * i, "y": float(y)})
-            else:
-                for i, y in enumerate(y_values):
-                    points.append({"x": float(i), "y": float(y)})
+            # Координаты x точек не передаем: QML (updateIrGraph) сам считает x по x_min/x_max и status,
+            # поэтому список словарей {x, y} на каждый кадр не строим
 
             # Для оси Y используем y_min/y_max из МЕТАДАННЫХ (регистры 405-408),
             # а не из данных! Это важно для правильного отображения графика.
@@ -2303,14 +2832,13 @@ class ModbusManager(QObject):
                 f"IR spectrum decoded: status={status} x=[{x_min:.6f},{x_max:.6f}] "
                 f"y_axis=[{y_min:.6f},{y_max:.6f}] (from metadata) y_data_range=[{y_min_data:.6f},{y_max_data:.6f}] (from data) "
                 f"y_min_meta={y_min_meta_str} y_max_meta={y_max_meta_str} "
-                f"points={len(points)} (expected 58) raw_u16_range=[{min(y_values_raw_u16) if y_values_raw_u16 else 'n/a'},{max(y_values_raw_u16) if y_values_raw_u16 else 'n/a'}] "
+                f"points={len(y_values)} (expected 58) raw_u16_range=[{min(y_values_raw_u16) if y_values_raw_u16 else 'n/a'},{max(y_values_raw_u16) if y_values_raw_u16 else 'n/a'}] "
                 f"raw_i16_range=[{min(y_values_raw_i16) if y_values_raw_i16 else 'n/a'},{max(y_values_raw_i16) if y_values_raw_i16 else 'n/a'}] "
                 f"first10_y_values={y_values[:10]} last10_y_values={y_values[-10:]}"
             )
 
             # Возвращаем только простые типы (int/float/str/list/dict), чтобы конвертировалось в QVariantMap
             # ВАЖНО: убеждаемся, что передаем ровно 58 точек
-            import json
             result = {
                 "status": status,
                 "x_min": float(x_min),
@@ -2339,51 +2867,54 @@ class ModbusManager(QObject):
                 "data": y_values,  # ВСЕ 58 точек
                 # JSON-версии для надежного парсинга в QML (иногда QVariantList ведет себя странно)
                 "data_json": json.dumps(y_values),  # ВСЕ 58 точек в JSON
-                "points": points,  # ВСЕ 58 точек с координатами x,y
             }
             
-            # Финальная проверка: убеждаемся, что все массивы содержат 58 элементов
+            # Финальная проверка: data и data_json строятся из одного списка y_values
             if len(result["data"]) != 58:
                 logger.error(f"IR spectrum: result.data length mismatch: {len(result['data'])} != 58")
-            if len(result["points"]) != 58:
-                logger.error(f"IR spectrum: result.points length mismatch: {len(result['points'])} != 58")
-            try:
-                data_json_parsed = json.loads(result["data_json"])
-                if len(data_json_parsed) != 58:
-                    logger.error(f"IR spectrum: result.data_json length mismatch: {len(data_json_parsed)} != 58")
-            except Exception as e:
-                logger.error(f"IR spectrum: failed to verify data_json: {e}")
             
-            logger.info(f"IR spectrum: returning payload with {len(result['data'])} data points, {len(result['points'])} graph points")
+            logger.info(f"IR spectrum: returning payload with {len(result['data'])} data points")
             return result
 
-        self._enqueue_read("ir", task)
+        self._enqueue_read("ir", task, PRIORITY_BACKGROUND)
         return True
 
-    def _check_connection(self):
+    def _onRequestFailed(self):
         """
-        Проверка "живости" соединения без блокирующих сетевых вызовов в GUI-потоке.
-        Если давно не было успешного I/O (чтение/запись), пробуем переподключиться через worker.
+        Учет неудачного запроса (чтения или записи). Соединение считается потерянным по результатам
+        обычного опроса и команд (чтения идут несколько раз в секунду), без отдельных keep-alive запросов.
         """
-        if not self._is_connected or self._modbus_client is None:
+        self._connection_fail_count += 1
+        if self._connection_fail_count < self._connection_fail_threshold:
             return
-        if self._connection_in_progress:
+        if not self._is_connected or self._modbus_client is None or self._connection_in_progress:
             return
-
-        now = time.time()
-        if self._last_modbus_ok_time <= 0:
+        # Если давно не было успешных ответов — считаем соединение "подвисшим".
+        # Обрыв TCP на стороне ядра ловит SO_KEEPALIVE (настраивается в ModbusClient.connect),
+        # а client.is_connected() только читает кэшированное состояние, без сетевых операций
+        if (time.monotonic() - self._last_modbus_ok_time) < 3.0 and self._modbus_client.is_connected():
             return
 
-        # Если давно не было успешных ответов — считаем соединение "подвисшим"
-        if (now - self._last_modbus_ok_time) < 3.0:
-            return
+        logger.warning(
+            "Нет успешных ответов Modbus >3с (%d неудачных чтений подряд), пробуем переподключиться (в фоне)",
+            self._connection_fail_count,
+        )
+        self._setConnectionStatus("Reconnecting", "Connecting...", False)
 
-        # Не дергаем reconnect слишком часто
-        if (now - self._last_reconnect_attempt_time) < 3.0:
+        self._auto_reconnect = True
+        self._attemptReconnect()
+
+    def _attemptReconnect(self):
+        """Попытка автоматического переподключения через worker (без блокировки GUI-потока)"""
+        if not self._auto_reconnect or self._connection_in_progress or self._modbus_client is None:
+            return
+        remaining = self._reconnect_next_attempt_ts - time.monotonic()
+        if remaining > 0:
+            # Таймер мог сработать чуть раньше (coarse timer) — дожидаемся назначенного времени
+            QTimer.singleShot(int(remaining * 1000) + 1, self._attemptReconnect)
             return
 
-        self._last_reconnect_attempt_time = now
-        logger.warning("Нет успешных ответов Modbus >3с, пробуем переподключиться (в фоне)")
+        self._last_reconnect_attempt_time = time.monotonic()
 
         # Останавливаем polling таймеры, чтобы не засыпать очередь запросами во время reconnect
         try:
@@ -2396,96 +2927,148 @@ class ModbusManager(QObject):
         self._workerSetClient.emit(self._modbus_client)
         self._workerConnect.emit()
     
-    def _syncDeviceStates(self):
-        """Синхронизация состояний всех устройств с Modbus"""
-        # Синхронизация реле (регистр 1021) выполняется отдельным таймером _readRelay1021
-        # Здесь ничего не делаем, чтобы не дублировать
-        pass
+    def _bulkSync(self):
+        """
+        Групповая синхронизация: включенные одиночные регистры читаются одним заданием worker'а
+        (соседние адреса объединяются в один запрос), результаты раздаются существующим apply-методам.
+        Медленные регистры (_BULK_SYNC_SLOW) читаются по одному за проход по кругу.
+        Успешный ответ одновременно служит keep-alive.
+
+        Разрывы между адресами (1611..1651 и т.п.) намеренно не читаются одним диапазоном: устройство
+        отдает не больше max_chunk=10 регистров за фрейм, поэтому такой диапазон стоит столько же
+        фреймов (или больше), а чтение неописанных адресов в разрыве может вернуть exception response
+        и сорвать всю синхронизацию.
+        """
+        if not self._is_connected or self._modbus_client is None:
+            return
+        if self._syncing:
+            self._dirty_reads.add("sync")
+            return
+        enabled = self._bulk_sync_addresses
+        slow = self._bulk_sync_slow
+        selected = [address for address in enabled if address not in self._BULK_SYNC_SLOW]
+        # Один медленный регистр за проход: каждый обновляется раз в len(slow) проходов
+        for _ in range(len(slow)):
+            address = slow[0]
+            slow.rotate(-1)
+            if address in enabled:
+                selected.append(address)
+                break
+        addresses = tuple(sorted(selected))
+        if not addresses:
+            return
+
+        self._syncing = True
+        self._bulk_sync_pending = addresses
+        func = self._read_funcs.get(addresses)
+        if func is None:
+            # Набор адресов повторяется от прохода к проходу - partial строим один раз на набор
+            ranges = tuple((address, 1) for address in addresses)
+            func = self._read_funcs[addresses] = partial(self._modbus_client.read_input_registers_bulk, ranges)
+        self._enqueue_read("sync", func)
+
+    def _applyBulkSyncValue(self, value: object):
+        """Раздача результатов групповой синхронизации по apply-методам (GUI поток)"""
+        self._syncing = False
+        values = value if isinstance(value, dict) else {}
+        register_cache = self._register_cache
+        for address in self._bulk_sync_pending:
+            register_value = values.get(address)
+            if register_value is not None:
+                register_cache[address] = register_value
+            # apply-метод сам обрабатывает None
+            self._bulk_sync_table[address](register_value)
+        self._bulk_sync_pending = ()
     
     def _readExternalRelays(self):
         """Чтение регистра 1020 (External Relays) и отправка сигнала с бинарным представлением"""
         if not self._is_connected or self._modbus_client is None:
             return
-        client = self._modbus_client
-
-        def task():
+        func = self._read_funcs.get("1020")
+        if func is None:
             # Сначала пробуем holding (03), потом input (04) как fallback
-            value = client.read_holding_register(1020)
-            if value is None:
-                value = client.read_input_register(1020)
-            return value
+            func = self._read_funcs["1020"] = partial(_read_holding_then_input, self._modbus_client, 1020)
+        self._enqueue_read("1020", func)
+    
+    def _groupReadBusy(self, key: str) -> bool:
+        """
+        Проверка незавершенного группового чтения перед постановкой нового.
+
+        Пока чтение в работе, тики опроса пропускаются, а каждые GROUP_READ_STALL_TICKS пропусков
+        интервал опроса удваивается (до GROUP_READ_MAX_INTERVAL_MS) - при зависшей шине опрос затихает.
+        Если worker о чтении уже не знает (выброшено при переполнении очереди), флаг сбрасывается.
+        """
+        flag, timer, _ = self._group_read_polls[key]
+        if not getattr(self, flag):
+            return False
+        if not self._io_worker.isReadPending(key):
+            logger.debug("Групповое чтение %s выброшено из очереди, ставим заново", key)
+            setattr(self, flag, False)
+            return False
+        stalls = self._group_read_stalls.get(key, 0) + 1
+        self._group_read_stalls[key] = stalls
+        if stalls % GROUP_READ_STALL_TICKS == 0:
+            interval = min(timer.interval() * 2, GROUP_READ_MAX_INTERVAL_MS)
+            if interval != timer.interval():
+                timer.setInterval(interval)
+                logger.debug("Групповое чтение %s не завершено %s тиков, интервал опроса %s мс", key, stalls, interval)
+        return True
 
-        self._enqueue_read("1020", task)
+    def _readSingleRegister(self, address: int):
+        """
+        Чтение одного регистра через worker (read_register_<address>_direct клиента), результат
+        применяет apply-метод из _bulk_sync_table. Повторный запрос, пока чтение ждет в очереди,
+        worker отбрасывает сам
+        """
+        if not self._is_connected or self._modbus_client is None:
+            return
+        func = self._read_funcs.get(address)
+        if func is None:
+            func = self._read_funcs[address] = getattr(self._modbus_client, f"read_register_{address}_direct")
+        self._enqueue_read(str(address), func)
     
     def _readRelay1021(self):
         """Чтение регистра 1021 (реле) и обновление состояний всех реле"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1021:
-            return
-
-        self._reading_1021 = True
-        client = self._modbus_client
-        self._enqueue_read("1021", lambda: client.read_register_1021_direct())
+        self._readSingleRegister(1021)
     
     def _readValve1111(self):
         """Чтение регистра 1111 (клапаны X6-X12) и обновление состояний"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1111:
-            return
-
-        self._reading_1111 = True
-        client = self._modbus_client
-        self._enqueue_read("1111", lambda: client.read_register_1111_direct())
+        self._readSingleRegister(1111)
     
     def _readWaterChillerTemperature(self):
         """Чтение регистра 1511 (температура Water Chiller) и обновление label C"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1511:
-            return
-
-        self._reading_1511 = True
-        client = self._modbus_client
-        self._enqueue_read("1511", lambda: client.read_register_1511_direct())
+        self._readSingleRegister(1511)
     
-    def _autoUpdateWaterChillerSetpoint(self):
+    def _isRedundantSetpoint(self, name: str, value: float, reference: float, interacting: bool) -> bool:
         """
-        Автоматическое обновление setpoint из текущей температуры, если пользователь не взаимодействует с полем
-        Вызывается каждые 20 секунд
+        True, если пользователь продолжает взаимодействие с полем и value отличается от reference
+        меньше чем на _SETPOINT_EPS[name]. Без взаимодействия (например, после переподключения)
+        значение всегда применяется.
         """
-        if not self._is_connected:
-            return
-        
-        # Если пользователь не взаимодействовал с полем, обновляем setpoint из текущей температуры
-        if not self._water_chiller_setpoint_user_interaction:
-            # Не обновляем если текущая температура равна 0.0 или невалидная (устройство только подключено)
-            if self._water_chiller_temperature > 0.1 and abs(self._water_chiller_temperature - self._water_chiller_setpoint) > 0.1:  # Обновляем только если разница > 0.1°C и температура валидная
-                logger.info(f"Автообновление setpoint: {self._water_chiller_setpoint}°C -> {self._water_chiller_temperature}°C")
-                self._water_chiller_setpoint = self._water_chiller_temperature
-                self.waterChillerSetpointChanged.emit(self._water_chiller_temperature)
-        else:
-            # Сбрасываем флаг взаимодействия для следующего цикла
-            self._water_chiller_setpoint_user_interaction = False
-    
-    def _autoUpdateMagnetPSUSetpoint(self):
-        """
-        Автоматическое обновление setpoint для Magnet PSU
-        Вызывается каждые 20 секунд
-        Для Magnet PSU нет текущей температуры (есть только ток), поэтому просто сбрасываем флаг взаимодействия
-        """
-        if not self._is_connected:
-            return
-        
-        # Сбрасываем флаг взаимодействия для следующего цикла
-        self._magnet_psu_setpoint_user_interaction = False
+        return interacting and abs(value - reference) < self._SETPOINT_EPS[name]
     
-    def _autoUpdateLaserPSUSetpoint(self):
+    def _autoUpdateSetpoints(self):
         """
-        Автоматическое обновление setpoint для Laser PSU
-        Вызывается каждые 20 секунд
-        Для Laser PSU нет текущей температуры (есть только ток), поэтому просто сбрасываем флаг взаимодействия
+        Автоматическое обновление setpoint из текущих значений, если пользователь не взаимодействует с полем
+        Вызывается каждые 20 секунд; параметры полей — в self._auto_update_specs
         """
         if not self._is_connected:
             return
         
-        # Сбрасываем флаг взаимодействия для следующего цикла
-        self._laser_psu_setpoint_user_interaction = False
+        for current_attr, setpoint_attr, flag_attr, signal_name, threshold, min_valid in self._auto_update_specs:
+            if getattr(self, flag_attr):
+                # Сбрасываем флаг взаимодействия для следующего цикла
+                setattr(self, flag_attr, False)
+                continue
+            if current_attr is None:
+                continue
+            current = getattr(self, current_attr)
+            setpoint = getattr(self, setpoint_attr)
+            # Не обновляем если текущее значение невалидное (устройство только подключено)
+            if current > min_valid and abs(current - setpoint) > threshold:
+                logger.info("Автообновление %s: %s -> %s", setpoint_attr, setpoint, current)
+                setattr(self, setpoint_attr, current)
+                getattr(self, signal_name).emit(current)
     
     @Slot(float, result=bool)
     def setSeopCellSetpointValue(self, temperature: float) -> bool:
@@ -2493,16 +3076,14 @@ class ModbusManager(QObject):
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint SEOP Cell: {temperature}°C (было {self._seop_cell_setpoint}°C)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Пока пользователь взаимодействует с полем, микроизменения не эмитируем
+        if self._isRedundantSetpoint('seop_cell', temperature, self._seop_cell_setpoint, self._seop_cell_setpoint_user_interaction):
+            return True
+        logger.debug("Обновление внутреннего значения setpoint SEOP Cell: %s°C (было %s°C)", temperature, self._seop_cell_setpoint)
         self._seop_cell_setpoint = temperature
         self.seopCellSetpointChanged.emit(temperature)
-        logger.info(f"✅ Внутреннее значение setpoint SEOP Cell обновлено: {self._seop_cell_setpoint}°C")
         # Отмечаем, что пользователь взаимодействует с полем
         self._seop_cell_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._seop_cell_setpoint_auto_update_timer.stop()
-        self._seop_cell_setpoint_auto_update_timer.start()
         return True
     
     @Slot(float, result=bool)
@@ -2516,7 +3097,6 @@ class ModbusManager(QObject):
         Returns:
             True если успешно, False в противном случае
         """
-        logger.info(f"🔵 setSeopCellTemperature вызван с температурой: {temperature}°C")
         
         # Обновляем статус (даже без подключения)
         self._updateActionStatus(f"set seop cell to {temperature:.2f}")
@@ -2525,33 +3105,28 @@ class ModbusManager(QObject):
             logger.warning("Попытка установки температуры SEOP Cell без подключения")
             return False
         
+        # Повторная отправка того же значения во время взаимодействия (дребезг слайдера) не нужна
+        if self._isRedundantSetpoint('seop_cell', temperature, self._last_sent_setpoints.get('seop_cell', math.inf), self._seop_cell_setpoint_user_interaction):
+            return True
+        
         # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
         # Это нужно для того, чтобы стрелки работали с актуальным значением
         # Всегда обновляем и эмитируем сигнал, даже если значение не изменилось
         # Это гарантирует обновление UI при нажатии на стрелки
-        logger.info(f"🔵 Обновление _seop_cell_setpoint: {self._seop_cell_setpoint}°C -> {temperature}°C")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Обновление _seop_cell_setpoint: %s°C -> %s°C", self._seop_cell_setpoint, temperature)
         self._seop_cell_setpoint = temperature
-        # Отправляем сигнал для обновления UI (setpoint)
-        logger.info(f"🔵 Эмитируем сигнал seopCellSetpointChanged: {temperature}°C")
         self.seopCellSetpointChanged.emit(temperature)
         
         # Преобразуем температуру в значение для регистра (умножаем на 100)
         # Например, 23.0°C -> 2300
-        register_value = int(temperature * 100)
+        register_value = round(temperature * 100)
         
-        logger.info(f"Установка температуры SEOP Cell: {temperature}°C (регистр 1421 = {register_value})")
+        logger.info("Установка температуры SEOP Cell: %.2f°C (регистр 1421 = %d)", temperature, register_value)
         
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1421_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура SEOP Cell успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру SEOP Cell: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1421", task, {"temperature": temperature})
+        task = partial(_write_temperature_setpoint, self._modbus_client.write_register_1421_direct, "SEOP Cell", register_value, temperature)
+        self._enqueue_write("1421", task, {"temperature": temperature}, coalesce=True)
+        self._last_sent_setpoints['seop_cell'] = temperature
         return True
     
     @Slot(result=bool)
@@ -2559,14 +3134,12 @@ class ModbusManager(QObject):
         """Увеличение заданной температуры SEOP Cell на 1°C"""
         if not self._is_connected:
             return False
-        logger.debug(f"Увеличение температуры SEOP Cell: текущее значение = {self._seop_cell_setpoint}°C")
-        new_temp = self._seop_cell_setpoint + 1.0
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
+        current = self._seop_cell_setpoint
+        new_temp = current + 1.0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Увеличение температуры SEOP Cell: %s°C -> %s°C", current, new_temp)
         # Отмечаем, что пользователь взаимодействует с полем
         self._seop_cell_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._seop_cell_setpoint_auto_update_timer.stop()
-        self._seop_cell_setpoint_auto_update_timer.start()
         return self.setSeopCellTemperature(new_temp)
     
     @Slot(result=bool)
@@ -2574,94 +3147,28 @@ class ModbusManager(QObject):
         """Уменьшение заданной температуры SEOP Cell на 1°C"""
         if not self._is_connected:
             return False
-        logger.debug(f"Уменьшение температуры SEOP Cell: текущее значение = {self._seop_cell_setpoint}°C")
-        new_temp = self._seop_cell_setpoint - 1.0
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
+        current = self._seop_cell_setpoint
+        new_temp = current - 1.0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Уменьшение температуры SEOP Cell: %s°C -> %s°C", current, new_temp)
         # Отмечаем, что пользователь взаимодействует с полем
         self._seop_cell_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._seop_cell_setpoint_auto_update_timer.stop()
-        self._seop_cell_setpoint_auto_update_timer.start()
         return self.setSeopCellTemperature(new_temp)
     
-    def _autoUpdateSeopCellSetpoint(self):
-        """
-        Автоматическое обновление setpoint из текущей температуры, если пользователь не взаимодействует с полем
-        Вызывается каждые 20 секунд
-        """
-        if not self._is_connected:
-            return
-        
-        # Если пользователь не взаимодействовал с полем, обновляем setpoint из текущей температуры
-        if not self._seop_cell_setpoint_user_interaction:
-            # Не обновляем если текущая температура равна 0.0 или невалидная (устройство только подключено)
-            if self._seop_cell_temperature > 0.1 and abs(self._seop_cell_temperature - self._seop_cell_setpoint) > 0.1:  # Обновляем только если разница > 0.1°C и температура валидная
-                logger.info(f"Автообновление setpoint SEOP Cell: {self._seop_cell_setpoint}°C -> {self._seop_cell_temperature}°C")
-                self._seop_cell_setpoint = self._seop_cell_temperature
-                self.seopCellSetpointChanged.emit(self._seop_cell_temperature)
-        else:
-            # Сбрасываем флаг взаимодействия для следующего цикла
-            self._seop_cell_setpoint_user_interaction = False
-    
-    def _autoUpdatePIDControllerSetpoint(self):
-        """
-        Автоматическое обновление setpoint PID Controller из текущей температуры, если пользователь не взаимодействует с полем
-        Вызывается каждые 20 секунд
-        """
-        if not self._is_connected:
-            return
-        
-        # Если пользователь не взаимодействовал с полем, обновляем setpoint из текущей температуры
-        if not self._pid_controller_setpoint_user_interaction:
-            # Не обновляем если текущая температура равна 0.0 или невалидная (устройство только подключено)
-            if self._pid_controller_temperature > 0.1 and abs(self._pid_controller_temperature - self._pid_controller_setpoint) > 0.1:  # Обновляем только если разница > 0.1°C и температура валидная
-                logger.info(f"Автообновление setpoint PID Controller: {self._pid_controller_setpoint}°C -> {self._pid_controller_temperature}°C")
-                self._pid_controller_setpoint = self._pid_controller_temperature
-                self.pidControllerSetpointChanged.emit(self._pid_controller_temperature)
-        else:
-            # Сбрасываем флаг взаимодействия для следующего цикла
-            self._pid_controller_setpoint_user_interaction = False
-    
-    def _autoUpdateXenonSetpoint(self):
-        """Автоматическое обновление setpoint Xenon из устройства (если пользователь не взаимодействует с полем)"""
-        if not self._xenon_setpoint_user_interaction:
-            # Пользователь не взаимодействует с полем - можно обновить из устройства
-            logger.debug("Автообновление setpoint Xenon из устройства")
-            # Чтение будет выполнено через таймер _alicats_timer
-        else:
-            # Пользователь взаимодействует с полем - не обновляем
-            logger.debug("Автообновление setpoint Xenon пропущено (пользователь взаимодействует с полем)")
-        # Сбрасываем флаг взаимодействия пользователя
-        self._xenon_setpoint_user_interaction = False
-    
-    def _autoUpdateN2Setpoint(self):
-        """Автоматическое обновление setpoint N2 из устройства (если пользователь не взаимодействует с полем)"""
-        if not self._n2_setpoint_user_interaction:
-            # Пользователь не взаимодействует с полем - можно обновить из устройства
-            logger.debug("Автообновление setpoint N2 из устройства")
-            # Чтение будет выполнено через таймер _alicats_timer
-        else:
-            # Пользователь взаимодействует с полем - не обновляем
-            logger.debug("Автообновление setpoint N2 пропущено (пользователь взаимодействует с полем)")
-        # Сбрасываем флаг взаимодействия пользователя
-        self._n2_setpoint_user_interaction = False
-    
     @Slot(float, result=bool)
     def setXenonSetpointValue(self, pressure: float) -> bool:
         """
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint Xenon: {pressure} Torr (было {self._xenon_setpoint} Torr)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Пока пользователь взаимодействует с полем, микроизменения не эмитируем
+        if self._isRedundantSetpoint('xenon', pressure, self._xenon_setpoint, self._xenon_setpoint_user_interaction):
+            return True
+        logger.debug("Обновление внутреннего значения setpoint Xenon: %s Torr (было %s Torr)", pressure, self._xenon_setpoint)
         self._xenon_setpoint = pressure
         self.xenonSetpointChanged.emit(pressure)
-        logger.info(f"✅ Внутреннее значение setpoint Xenon обновлено: {self._xenon_setpoint} Torr")
         # Отмечаем, что пользователь взаимодействует с полем
         self._xenon_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._xenon_setpoint_auto_update_timer.stop()
-        self._xenon_setpoint_auto_update_timer.start()
         return True
     
     @Slot(float, result=bool)
@@ -2677,7 +3184,6 @@ class ModbusManager(QObject):
         """
         # Логируем действие
         self._addLog(f"Xenon Pressure: {pressure} Torr")
-        logger.info(f"🔵 setXenonPressure вызван с давлением: {pressure} Torr")
         
         # Обновляем статус (даже без подключения)
         self._updateActionStatus(f"set xenon to {pressure:.2f}")
@@ -2686,105 +3192,66 @@ class ModbusManager(QObject):
             logger.warning("Попытка установки давления Xenon без подключения")
             return False
         
+        # Повторная отправка того же значения во время взаимодействия (дребезг слайдера) не нужна
+        if self._isRedundantSetpoint('xenon', pressure, self._last_sent_setpoints.get('xenon', math.inf), self._xenon_setpoint_user_interaction):
+            return True
+        
         # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
         # Это нужно для того, чтобы стрелки работали с актуальным значением
         # Всегда обновляем и эмитируем сигнал, даже если значение не изменилось
         # Это гарантирует обновление UI при нажатии на стрелки
-        logger.info(f"🔵 Обновление _xenon_setpoint: {self._xenon_setpoint} Torr -> {pressure} Torr")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Обновление _xenon_setpoint: %s Torr -> %s Torr", self._xenon_setpoint, pressure)
         self._xenon_setpoint = pressure
-        # Отправляем сигнал для обновления UI (setpoint)
-        logger.info(f"🔵 Эмитируем сигнал xenonSetpointChanged: {pressure} Torr")
         self.xenonSetpointChanged.emit(pressure)
         
         # Преобразуем давление в значение для регистра (умножаем на 100)
         # Например, 23.00 Torr -> 2300
-        register_value = int(pressure * 100)
+        register_value = round(pressure * 100)
         
-        logger.info(f"Установка давления Xenon: {pressure} Torr (регистр 1621 = {register_value})")
+        logger.info("Установка давления Xenon: %.2f Torr (регистр 1621 = %d)", pressure, register_value)
         
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1621_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданное давление Xenon успешно установлено: {pressure} Torr")
-            else:
-                logger.error(f"❌ Не удалось установить заданное давление Xenon: {pressure} Torr")
-            return bool(result)
-
-        self._enqueue_write("1621", task, {"pressure": pressure})
+        task = partial(_write_pressure_setpoint, self._modbus_client.write_register_1621_direct, "Xenon", register_value, pressure)
+        self._enqueue_write("1621", task, {"pressure": pressure}, coalesce=True)
+        self._last_sent_setpoints['xenon'] = pressure
         return True
     
-    def _autoUpdateXenonSetpoint(self):
-        """
-        Автоматическое обновление setpoint из текущего давления, если пользователь не взаимодействует с полем
-        Вызывается каждые 20 секунд
-        """
-        if not self._is_connected:
-            return
-        
-        # Если пользователь не взаимодействовал с полем, обновляем setpoint из текущего давления
-        if not self._xenon_setpoint_user_interaction:
-            # Не обновляем если текущее давление равно 0.0 или невалидное (устройство только подключено)
-            if self._xenon_pressure > 0.01 and abs(self._xenon_pressure - self._xenon_setpoint) > 0.01:  # Обновляем только если разница > 0.01 Torr и давление валидное
-                logger.info(f"Автообновление setpoint Xenon: {self._xenon_setpoint} Torr -> {self._xenon_pressure} Torr")
-                self._xenon_setpoint = self._xenon_pressure
-                self.xenonSetpointChanged.emit(self._xenon_pressure)
-        else:
-            # Сбрасываем флаг взаимодействия для следующего цикла
-            self._xenon_setpoint_user_interaction = False
-    
-    def _autoUpdateN2Setpoint(self):
-        """
-        Автоматическое обновление setpoint из текущего давления, если пользователь не взаимодействует с полем
-        Вызывается каждые 20 секунд
-        """
-        if not self._is_connected:
-            return
-        
-        # Если пользователь не взаимодействовал с полем, обновляем setpoint из текущего давления
-        if not self._n2_setpoint_user_interaction:
-            # Не обновляем если текущее давление равно 0.0 или невалидное (устройство только подключено)
-            if self._n2_pressure > 0.01 and abs(self._n2_pressure - self._n2_setpoint) > 0.01:  # Обновляем только если разница > 0.01 Torr и давление валидное
-                logger.info(f"Автообновление setpoint N2: {self._n2_setpoint} Torr -> {self._n2_pressure} Torr")
-                self._n2_setpoint = self._n2_pressure
-                self.n2SetpointChanged.emit(self._n2_pressure)
-        else:
-            # Сбрасываем флаг взаимодействия для следующего цикла
-            self._n2_setpoint_user_interaction = False
-    
     @Slot(float, result=bool)
     def setN2SetpointValue(self, pressure: float) -> bool:
         """
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint N2: {pressure} Torr (было {self._n2_setpoint} Torr)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Тот же setpoint повторно не эмитируем (лишнее обновление QML), но взаимодействие отмечаем
+        if abs(pressure - self._n2_setpoint) < 1e-6:
+            self._n2_setpoint_user_interaction = True
+            return True
+        # Пока пользователь взаимодействует с полем, микроизменения не эмитируем
+        if self._isRedundantSetpoint('n2', pressure, self._n2_setpoint, self._n2_setpoint_user_interaction):
+            return True
+        logger.debug("Обновление внутреннего значения setpoint N2: %s Torr (было %s Torr)", pressure, self._n2_setpoint)
         self._n2_setpoint = pressure
         self.n2SetpointChanged.emit(pressure)
-        logger.info(f"✅ Внутреннее значение setpoint N2 обновлено: {self._n2_setpoint} Torr")
         # Отмечаем, что пользователь взаимодействует с полем
         self._n2_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._n2_setpoint_auto_update_timer.stop()
-        self._n2_setpoint_auto_update_timer.start()
         return True
     
     @Slot(float, result=bool)
-    def setN2Pressure(self, pressure: float) -> bool:
+    def setN2Pressure(self, pressure: float, user_initiated: bool = False) -> bool:
         """
         Установка давления N2 в регистр 1661
         
         Args:
             pressure: Давление в Torr (например, 23.00)
+            user_initiated: True - шаг стрелками: отмечает взаимодействие пользователя с полем
         
         Returns:
             True если успешно, False в противном случае
         """
+        if user_initiated:
+            self._n2_setpoint_user_interaction = True
         # Логируем действие
         self._addLog(f"N2 Pressure: {pressure} Torr")
-        logger.info(f"🔵 setN2Pressure вызван с давлением: {pressure} Torr")
         
         # Обновляем статус (даже без подключения)
         self._updateActionStatus(f"set n2 to {pressure:.2f}")
@@ -2793,27 +3260,24 @@ class ModbusManager(QObject):
             logger.warning("Попытка установки давления N2 без подключения")
             return False
         
+        # Повторная отправка того же значения во время взаимодействия (дребезг слайдера) не нужна
+        if self._isRedundantSetpoint('n2', pressure, self._last_sent_setpoints.get('n2', math.inf), self._n2_setpoint_user_interaction):
+            return True
+        
         # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
-        logger.info(f"🔵 Обновление _n2_setpoint: {self._n2_setpoint} Torr -> {pressure} Torr")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Обновление _n2_setpoint: %s Torr -> %s Torr", self._n2_setpoint, pressure)
         self._n2_setpoint = pressure
         self.n2SetpointChanged.emit(pressure)
         
         # Преобразуем давление в значение для регистра (умножаем на 100)
-        register_value = int(pressure * 100)
+        register_value = round(pressure * 100)
         
-        logger.info(f"Установка давления N2: {pressure} Torr (регистр 1661 = {register_value})")
+        logger.info("Установка давления N2: %.2f Torr (регистр 1661 = %d)", pressure, register_value)
         
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1661_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданное давление N2 успешно установлено: {pressure} Torr")
-            else:
-                logger.error(f"❌ Не удалось установить заданное давление N2: {pressure} Torr")
-            return bool(result)
-
-        self._enqueue_write("1661", task, {"pressure": pressure})
+        task = partial(_write_pressure_setpoint, self._modbus_client.write_register_1661_direct, "N2", register_value, pressure)
+        self._enqueue_write("1661", task, {"pressure": pressure}, coalesce=True)
+        self._last_sent_setpoints['n2'] = pressure
         return True
     
     @Slot(result=bool)
@@ -2821,97 +3285,46 @@ class ModbusManager(QObject):
         """Увеличение заданного давления N2 на 0.01 Torr"""
         if not self._is_connected:
             return False
-        logger.debug(f"Увеличение давления N2: текущее значение = {self._n2_setpoint} Torr")
-        new_pressure = self._n2_setpoint + 0.01
-        logger.debug(f"Новое значение после увеличения: {new_pressure} Torr")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._n2_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._n2_setpoint_auto_update_timer.stop()
-        self._n2_setpoint_auto_update_timer.start()
-        return self.setN2Pressure(new_pressure)
+        return self.setN2Pressure(self._n2_setpoint + 0.01, user_initiated=True)
     
     @Slot(result=bool)
     def decreaseN2Pressure(self) -> bool:
         """Уменьшение заданного давления N2 на 0.01 Torr"""
         if not self._is_connected:
             return False
-        logger.debug(f"Уменьшение давления N2: текущее значение = {self._n2_setpoint} Torr")
-        new_pressure = self._n2_setpoint - 0.01
-        logger.debug(f"Новое значение после уменьшения: {new_pressure} Torr")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._n2_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._n2_setpoint_auto_update_timer.stop()
-        self._n2_setpoint_auto_update_timer.start()
-        return self.setN2Pressure(new_pressure)
+        return self.setN2Pressure(self._n2_setpoint - 0.01, user_initiated=True)
     
     def _readSeopCellTemperature(self):
         """Чтение регистра 1411 (температура SEOP Cell) и обновление label C"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1411:
-            return
-
-        self._reading_1411 = True
-        client = self._modbus_client
-        self._enqueue_read("1411", lambda: client.read_register_1411_direct())
+        self._readSingleRegister(1411)
     
     def _readMagnetPSUCurrent(self):
         """Чтение регистра 1341 (ток Magnet PSU) и обновление label A"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1341:
-            return
-
-        self._reading_1341 = True
-        client = self._modbus_client
-        self._enqueue_read("1341", lambda: client.read_register_1341_direct())
+        self._readSingleRegister(1341)
     
     def _readLaserPSUCurrent(self):
         """Чтение регистра 1251 (ток Laser PSU) и обновление label A"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1251:
-            return
-
-        self._reading_1251 = True
-        client = self._modbus_client
-        self._enqueue_read("1251", lambda: client.read_register_1251_direct())
+        self._readSingleRegister(1251)
     
     def _readXenonPressure(self):
-        """Чтение регистра 1611 (давление Xenon) и обновление label Torr"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1611:
-            return
-
-        self._reading_1611 = True
-        client = self._modbus_client
-        self._enqueue_read("1611", lambda: client.read_register_1611_direct())
+        """Чтение регистра 1611 (давление Xenon) и обновление label Torr"""
+        self._readSingleRegister(1611)
     
     def _readN2Pressure(self):
         """Чтение регистра 1651 (давление N2) и обновление label Torr"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1651:
-            return
-
-        self._reading_1651 = True
-        client = self._modbus_client
-        self._enqueue_read("1651", lambda: client.read_register_1651_direct())
+        self._readSingleRegister(1651)
     
     def _readVacuumPressure(self):
         """Чтение регистра 1701 (давление Vacuum) и обновление label Torr"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1701:
-            return
-
-        self._reading_1701 = True
-        client = self._modbus_client
-        self._enqueue_read("1701", lambda: client.read_register_1701_direct())
+        self._readSingleRegister(1701)
     
     def _readFan1131(self):
         """Чтение регистра 1131 (fans) и обновление состояний всех вентиляторов"""
-        if not self._is_connected or self._modbus_client is None or self._reading_1131:
-            return
-
-        self._reading_1131 = True
-        client = self._modbus_client
-        self._enqueue_read("1131", lambda: client.read_register_1131_direct())
+        self._readSingleRegister(1131)
     
     def _readPowerSupply(self):
         """Чтение регистров Power Supply (Laser PSU и Magnet PSU)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_power_supply:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("power_supply"):
             return
 
         self._reading_power_supply = True
@@ -2919,7 +3332,6 @@ class ModbusManager(QObject):
         
         def task():
             """Чтение всех регистров Power Supply"""
-            import struct
             # Laser PSU: Voltage Value (1211), Voltage Setpoint (1221), Current Value (1231), Current Setpoint (1241), On/Off (1251)
             # Magnet PSU: Voltage Value (1301), Voltage Setpoint (1311), Current Value (1321), Current Setpoint (1331), On/Off (1341)
             # Читаем по 2 регистра для float значений (Voltage и Current)
@@ -2939,24 +3351,10 @@ class ModbusManager(QObject):
             def _registers_to_float(reg1: int, reg2: int) -> float:
                 """Декодируем float из двух uint16 (порядок байт: ABCD)"""
                 try:
-                    byte1 = (reg1 >> 8) & 0xFF
-                    byte2 = reg1 & 0xFF
-                    byte3 = (reg2 >> 8) & 0xFF
-                    byte4 = reg2 & 0xFF
-                    # Попробуем разные варианты порядка байт
-                    variants = [
-                        bytes([byte1, byte2, byte3, byte4]),  # ABCD
-                        bytes([byte2, byte1, byte4, byte3]),  # BADC
-                        bytes([byte3, byte4, byte1, byte2]),  # CDAB
-                        bytes([byte4, byte3, byte2, byte1]),  # DCBA
-                    ]
-                    for bb in variants:
-                        try:
-                            val = float(struct.unpack(">f", bb)[0])
-                            if val != 0.0 and -1000.0 < val < 1000.0:  # Разумный диапазон для напряжения/тока
-                                return val
-                        except:
-                            continue
+                    # Попробуем разные варианты порядка байт (ABCD, BADC, CDAB, DCBA)
+                    for _, val in _float_byte_order_variants(reg1, reg2):
+                        if val != 0.0 and -1000.0 < val < 1000.0:  # Разумный диапазон для напряжения/тока
+                            return val
                     # Если ничего не подошло, пробуем просто разделить на 100 (как для температуры)
                     return float((reg1 << 16 | reg2) / 100.0) if (reg1 << 16 | reg2) != 0 else 0.0
                 except Exception:
@@ -2994,7 +3392,7 @@ class ModbusManager(QObject):
     
     def _readPIDController(self):
         """Чтение регистров PID Controller (1411 - температура, 1421 - setpoint, 1431 - on/off)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_pid_controller:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("pid_controller"):
             return
 
         self._reading_pid_controller = True
@@ -3025,7 +3423,7 @@ class ModbusManager(QObject):
     
     def _readWaterChiller(self):
         """Чтение регистров Water Chiller (1511 - inlet temp, 1521 - outlet temp, 1531 - setpoint, 1541 - on/off)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_water_chiller:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("water_chiller"):
             return
 
         self._reading_water_chiller = True
@@ -3061,7 +3459,7 @@ class ModbusManager(QObject):
     
     def _readAlicats(self):
         """Чтение регистров Alicats (1611 - Xenon value, 1621 - Xenon setpoint, 1651 - N2 value, 1661 - N2 setpoint)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_alicats:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("alicats"):
             return
 
         self._reading_alicats = True
@@ -3099,7 +3497,7 @@ class ModbusManager(QObject):
         """Чтение регистра Vacuum Controller (1701 - давление в mTorr)"""
         # Проверяем только флаг чтения и наличие клиента, но не подключение
         # Поле должно отображаться всегда, даже если устройство не подключено
-        if self._modbus_client is None or self._reading_vacuum_controller:
+        if self._modbus_client is None or self._groupReadBusy("vacuum_controller"):
             return
         
         # Если устройство не подключено, не пытаемся читать, но таймер продолжает работать
@@ -3108,12 +3506,12 @@ class ModbusManager(QObject):
             return
 
         self._reading_vacuum_controller = True
-        client = self._modbus_client
+        read = self._modbus_client.read_register_1701_direct
         
         def task():
             """Чтение регистра Vacuum Controller"""
             # Регистр 1701 - давление Vacuum (уже в mTorr)
-            value = client.read_register_1701_direct()
+            value = read()
             
             result = {}
             if value is not None:
@@ -3127,7 +3525,7 @@ class ModbusManager(QObject):
     
     def _readLaser(self):
         """Чтение регистров Laser (1811 - Beam on/off, 1821 - MPD uA, 1831 - Output Power, 1841 - Temp)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_laser:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("laser"):
             return
 
         self._reading_laser = True
@@ -3163,7 +3561,7 @@ class ModbusManager(QObject):
     
     def _readSEOPParameters(self):
         """Чтение регистров SEOP Parameters (3011-3181)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_seop_parameters:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("seop_parameters"):
             return
 
         self._reading_seop_parameters = True
@@ -3240,11 +3638,11 @@ class ModbusManager(QObject):
             
             return result
         
-        self._enqueue_read("seop_parameters", task)
+        self._enqueue_read("seop_parameters", task, PRIORITY_BACKGROUND)
     
     def _readCalculatedParameters(self):
         """Чтение регистров Calculated Parameters (4011-4101)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_calculated_parameters:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("calculated_parameters"):
             return
 
         self._reading_calculated_parameters = True
@@ -3298,7 +3696,7 @@ class ModbusManager(QObject):
             
             return result
         
-        self._enqueue_read("calculated_parameters", task)
+        self._enqueue_read("calculated_parameters", task, PRIORITY_BACKGROUND)
     
     def _applyCalculatedParametersValue(self, value: object):
         """Применение результатов чтения Calculated Parameters (4011-4101)"""
@@ -3311,58 +3709,68 @@ class ModbusManager(QObject):
         
         if 'electron_polarization' in value:
             val = float(value['electron_polarization'])
-            self._calculated_electron_polarization = val
-            self.calculatedElectronPolarizationChanged.emit(val)
-            logger.debug(f"Calculated Electron Polarization: {val}%")
+            if self._calculated_electron_polarization != val:
+                self._calculated_electron_polarization = val
+                self.calculatedElectronPolarizationChanged.emit(val)
+                logger.debug(f"Calculated Electron Polarization: {val}%")
         if 'xe_polarization' in value:
             val = float(value['xe_polarization'])
-            self._calculated_xe_polarization = val
-            self.calculatedXePolarizationChanged.emit(val)
-            logger.debug(f"Calculated 129Xe Polarization: {val}%")
+            if self._calculated_xe_polarization != val:
+                self._calculated_xe_polarization = val
+                self.calculatedXePolarizationChanged.emit(val)
+                logger.debug(f"Calculated 129Xe Polarization: {val}%")
         if 'buildup_rate' in value:
             val = float(value['buildup_rate'])
-            self._calculated_buildup_rate = val
-            self.calculatedBuildupRateChanged.emit(val)
-            logger.debug(f"Calculated Buildup Rate: {val} 1/min")
+            if self._calculated_buildup_rate != val:
+                self._calculated_buildup_rate = val
+                self.calculatedBuildupRateChanged.emit(val)
+                logger.debug(f"Calculated Buildup Rate: {val} 1/min")
         if 'electron_polarization_error' in value:
             val = float(value['electron_polarization_error'])
-            self._calculated_electron_polarization_error = val
-            self.calculatedElectronPolarizationErrorChanged.emit(val)
-            logger.debug(f"Calculated Electron Polarization Error: {val}%")
+            if self._calculated_electron_polarization_error != val:
+                self._calculated_electron_polarization_error = val
+                self.calculatedElectronPolarizationErrorChanged.emit(val)
+                logger.debug(f"Calculated Electron Polarization Error: {val}%")
         if 'xe_polarization_error' in value:
             val = float(value['xe_polarization_error'])
-            self._calculated_xe_polarization_error = val
-            self.calculatedXePolarizationErrorChanged.emit(val)
-            logger.debug(f"Calculated 129Xe Polarization Error: {val}%")
+            if self._calculated_xe_polarization_error != val:
+                self._calculated_xe_polarization_error = val
+                self.calculatedXePolarizationErrorChanged.emit(val)
+                logger.debug(f"Calculated 129Xe Polarization Error: {val}%")
         if 'buildup_rate_error' in value:
             val = float(value['buildup_rate_error'])
-            self._calculated_buildup_rate_error = val
-            self.calculatedBuildupRateErrorChanged.emit(val)
-            logger.debug(f"Calculated Buildup Rate Error: {val} 1/min")
+            if self._calculated_buildup_rate_error != val:
+                self._calculated_buildup_rate_error = val
+                self.calculatedBuildupRateErrorChanged.emit(val)
+                logger.debug(f"Calculated Buildup Rate Error: {val} 1/min")
         if 'fitted_xe_polarization_max' in value:
             val = float(value['fitted_xe_polarization_max'])
-            self._calculated_fitted_xe_polarization_max = val
-            self.calculatedFittedXePolarizationMaxChanged.emit(val)
-            logger.debug(f"Calculated Fitted 129Xe Polarization Max: {val}%")
+            if self._calculated_fitted_xe_polarization_max != val:
+                self._calculated_fitted_xe_polarization_max = val
+                self.calculatedFittedXePolarizationMaxChanged.emit(val)
+                logger.debug(f"Calculated Fitted 129Xe Polarization Max: {val}%")
         if 'fitted_xe_polarization_max_error' in value:
             val = float(value['fitted_xe_polarization_max_error'])
-            self._calculated_fitted_xe_polarization_max_error = val
-            self.calculatedFittedXePolarizationMaxErrorChanged.emit(val)
-            logger.debug(f"Calculated Fitted 129Xe Polarization Max Error: {val}%")
+            if self._calculated_fitted_xe_polarization_max_error != val:
+                self._calculated_fitted_xe_polarization_max_error = val
+                self.calculatedFittedXePolarizationMaxErrorChanged.emit(val)
+                logger.debug(f"Calculated Fitted 129Xe Polarization Max Error: {val}%")
         if 'hp_xe_t1' in value:
             val = float(value['hp_xe_t1'])
-            self._calculated_hp_xe_t1 = val
-            self.calculatedHPXeT1Changed.emit(val)
-            logger.debug(f"Calculated HP 129Xe T1: {val} min")
+            if self._calculated_hp_xe_t1 != val:
+                self._calculated_hp_xe_t1 = val
+                self.calculatedHPXeT1Changed.emit(val)
+                logger.debug(f"Calculated HP 129Xe T1: {val} min")
         if 'hp_xe_t1_error' in value:
             val = float(value['hp_xe_t1_error'])
-            self._calculated_hp_xe_t1_error = val
-            self.calculatedHPXeT1ErrorChanged.emit(val)
-            logger.debug(f"Calculated HP 129Xe T1 Error: {val} min")
+            if self._calculated_hp_xe_t1_error != val:
+                self._calculated_hp_xe_t1_error = val
+                self.calculatedHPXeT1ErrorChanged.emit(val)
+                logger.debug(f"Calculated HP 129Xe T1 Error: {val} min")
     
     def _readMeasuredParameters(self):
         """Чтение регистров Measured Parameters (5011-5081)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_measured_parameters:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("measured_parameters"):
             return
 
         self._reading_measured_parameters = True
@@ -3409,7 +3817,7 @@ class ModbusManager(QObject):
             
             return result
         
-        self._enqueue_read("measured_parameters", task)
+        self._enqueue_read("measured_parameters", task, PRIORITY_BACKGROUND)
     
     def _applyMeasuredParametersValue(self, value: object):
         """Применение результатов чтения Measured Parameters (5011-5081)"""
@@ -3422,53 +3830,56 @@ class ModbusManager(QObject):
         
         if 'current_ir_signal' in value:
             val = float(value['current_ir_signal'])
-            self._measured_current_ir_signal = val
-            self.measuredCurrentIRSignalChanged.emit(val)
-            logger.debug(f"Measured Current IR Signal: {val}")
+            if self._measured_current_ir_signal != val:
+                self._measured_current_ir_signal = val
+                self.measuredCurrentIRSignalChanged.emit(val)
+                logger.debug(f"Measured Current IR Signal: {val}")
         if 'cold_cell_ir_signal' in value:
             val = float(value['cold_cell_ir_signal'])
-            if not self._measured_cold_cell_ir_signal_user_interaction:
+            if not self._measured_cold_cell_ir_signal_user_interaction and self._measured_cold_cell_ir_signal != val:
                 self._measured_cold_cell_ir_signal = val
                 self.measuredColdCellIRSignalChanged.emit(val)
                 logger.debug(f"Measured Cold Cell IR Signal: {val}")
         if 'hot_cell_ir_signal' in value:
             val = float(value['hot_cell_ir_signal'])
-            if not self._measured_hot_cell_ir_signal_user_interaction:
+            if not self._measured_hot_cell_ir_signal_user_interaction and self._measured_hot_cell_ir_signal != val:
                 self._measured_hot_cell_ir_signal = val
                 self.measuredHotCellIRSignalChanged.emit(val)
                 logger.debug(f"Measured Hot Cell IR Signal: {val}")
         if 'water_1h_nmr_reference_signal' in value:
             val = float(value['water_1h_nmr_reference_signal'])
-            if not self._measured_water_1h_nmr_reference_signal_user_interaction:
+            if not self._measured_water_1h_nmr_reference_signal_user_interaction and self._measured_water_1h_nmr_reference_signal != val:
                 self._measured_water_1h_nmr_reference_signal = val
                 self.measuredWater1HNMRReferenceSignalChanged.emit(val)
                 logger.debug(f"Measured Water 1H NMR Reference Signal: {val}")
         if 'water_t2' in value:
             val = float(value['water_t2'])
-            if not self._measured_water_t2_user_interaction:
+            if not self._measured_water_t2_user_interaction and self._measured_water_t2 != val:
                 self._measured_water_t2 = val
                 self.measuredWaterT2Changed.emit(val)
                 logger.debug(f"Measured Water T2: {val} ms")
         if 'hp_129xe_nmr_signal' in value:
             val = float(value['hp_129xe_nmr_signal'])
-            self._measured_hp_129xe_nmr_signal = val
-            self.measuredHP129XeNMRSignalChanged.emit(val)
-            logger.debug(f"Measured HP 129Xe NMR Signal: {val}")
+            if self._measured_hp_129xe_nmr_signal != val:
+                self._measured_hp_129xe_nmr_signal = val
+                self.measuredHP129XeNMRSignalChanged.emit(val)
+                logger.debug(f"Measured HP 129Xe NMR Signal: {val}")
         if 'hp_129xe_t2' in value:
             val = float(value['hp_129xe_t2'])
-            if not self._measured_hp_129xe_t2_user_interaction:
+            if not self._measured_hp_129xe_t2_user_interaction and self._measured_hp_129xe_t2 != val:
                 self._measured_hp_129xe_t2 = val
                 self.measuredHP129XeT2Changed.emit(val)
                 logger.debug(f"Measured HP 129Xe T2: {val} ms")
         if 't2_correction_factor' in value:
             val = float(value['t2_correction_factor'])
-            self._measured_t2_correction_factor = val
-            self.measuredT2CorrectionFactorChanged.emit(val)
-            logger.debug(f"Measured T2* correction factor: {val}")
+            if self._measured_t2_correction_factor != val:
+                self._measured_t2_correction_factor = val
+                self.measuredT2CorrectionFactorChanged.emit(val)
+                logger.debug(f"Measured T2* correction factor: {val}")
     
     def _readAdditionalParameters(self):
         """Чтение регистров Additional Parameters (6011-6201)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_additional_parameters:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("additional_parameters"):
             return
 
         self._reading_additional_parameters = True
@@ -3563,7 +3974,7 @@ class ModbusManager(QObject):
             
             return result
         
-        self._enqueue_read("additional_parameters", task)
+        self._enqueue_read("additional_parameters", task, PRIORITY_BACKGROUND)
     
     def _applyAdditionalParametersValue(self, value: object):
         """Применение результатов чтения Additional Parameters (6011-6201)"""
@@ -3576,128 +3987,128 @@ class ModbusManager(QObject):
         
         if 'magnet_psu_current_proton_nmr' in value:
             val = float(value['magnet_psu_current_proton_nmr'])
-            if not self._additional_magnet_psu_current_proton_nmr_user_interaction:
+            if not self._additional_magnet_psu_current_proton_nmr_user_interaction and self._additional_magnet_psu_current_proton_nmr != val:
                 self._additional_magnet_psu_current_proton_nmr = val
                 self.additionalMagnetPSUCurrentProtonNMRChanged.emit(val)
                 logger.debug(f"Additional Magnet PSU current for proton NMR: {val} A")
         if 'magnet_psu_current_129xe_nmr' in value:
             val = float(value['magnet_psu_current_129xe_nmr'])
-            if not self._additional_magnet_psu_current_129xe_nmr_user_interaction:
+            if not self._additional_magnet_psu_current_129xe_nmr_user_interaction and self._additional_magnet_psu_current_129xe_nmr != val:
                 self._additional_magnet_psu_current_129xe_nmr = val
                 self.additionalMagnetPSUCurrent129XeNMRChanged.emit(val)
                 logger.debug(f"Additional Magnet PSU current for 129Xe NMR: {val} A")
         if 'operational_laser_psu_current' in value:
             val = float(value['operational_laser_psu_current'])
-            if not self._additional_operational_laser_psu_current_user_interaction:
+            if not self._additional_operational_laser_psu_current_user_interaction and self._additional_operational_laser_psu_current != val:
                 self._additional_operational_laser_psu_current = val
                 self.additionalOperationalLaserPSUCurrentChanged.emit(val)
                 logger.debug(f"Additional Operational Laser PSU current: {val} A")
         if 'rf_pulse_duration' in value:
             val = float(value['rf_pulse_duration'])
-            if not self._additional_rf_pulse_duration_user_interaction:
+            if not self._additional_rf_pulse_duration_user_interaction and self._additional_rf_pulse_duration != val:
                 self._additional_rf_pulse_duration = val
                 self.additionalRFPulseDurationChanged.emit(val)
                 logger.debug(f"Additional RF pulse duration: {val}")
         if 'resonance_frequency' in value:
             val = float(value['resonance_frequency'])
-            if not self._additional_resonance_frequency_user_interaction:
+            if not self._additional_resonance_frequency_user_interaction and self._additional_resonance_frequency != val:
                 self._additional_resonance_frequency = val
                 self.additionalResonanceFrequencyChanged.emit(val)
                 logger.debug(f"Additional Resonance frequency: {val} kHz")
         if 'proton_rf_pulse_power' in value:
             val = float(value['proton_rf_pulse_power'])
-            if not self._additional_proton_rf_pulse_power_user_interaction:
+            if not self._additional_proton_rf_pulse_power_user_interaction and self._additional_proton_rf_pulse_power != val:
                 self._additional_proton_rf_pulse_power = val
                 self.additionalProtonRFPulsePowerChanged.emit(val)
                 logger.debug(f"Additional Proton RF pulse power: {val}%")
         if 'hp_129xe_rf_pulse_power' in value:
             val = float(value['hp_129xe_rf_pulse_power'])
-            if not self._additional_hp_129xe_rf_pulse_power_user_interaction:
+            if not self._additional_hp_129xe_rf_pulse_power_user_interaction and self._additional_hp_129xe_rf_pulse_power != val:
                 self._additional_hp_129xe_rf_pulse_power = val
                 self.additionalHP129XeRFPulsePowerChanged.emit(val)
                 logger.debug(f"Additional HP 129Xe RF pulse power: {val}%")
         if 'step_size_b0_sweep_hp_129xe' in value:
             val = float(value['step_size_b0_sweep_hp_129xe'])
-            if not self._additional_step_size_b0_sweep_hp_129xe_user_interaction:
+            if not self._additional_step_size_b0_sweep_hp_129xe_user_interaction and self._additional_step_size_b0_sweep_hp_129xe != val:
                 self._additional_step_size_b0_sweep_hp_129xe = val
                 self.additionalStepSizeB0SweepHP129XeChanged.emit(val)
                 logger.debug(f"Additional Step size during B0 field sweep for HP 129Xe: {val} A")
         if 'step_size_b0_sweep_protons' in value:
             val = float(value['step_size_b0_sweep_protons'])
-            if not self._additional_step_size_b0_sweep_protons_user_interaction:
+            if not self._additional_step_size_b0_sweep_protons_user_interaction and self._additional_step_size_b0_sweep_protons != val:
                 self._additional_step_size_b0_sweep_protons = val
                 self.additionalStepSizeB0SweepProtonsChanged.emit(val)
                 logger.debug(f"Additional Step size during B0 field sweep for protons: {val} A")
         if 'xe_alicats_pressure' in value:
             val = float(value['xe_alicats_pressure'])
-            if not self._additional_xe_alicats_pressure_user_interaction:
+            if not self._additional_xe_alicats_pressure_user_interaction and self._additional_xe_alicats_pressure != val:
                 self._additional_xe_alicats_pressure = val
                 self.additionalXeAlicatsPressureChanged.emit(val)
                 logger.debug(f"Additional Xe ALICATS pressure: {val} Torr")
         if 'nitrogen_alicats_pressure' in value:
             val = float(value['nitrogen_alicats_pressure'])
-            if not self._additional_nitrogen_alicats_pressure_user_interaction:
+            if not self._additional_nitrogen_alicats_pressure_user_interaction and self._additional_nitrogen_alicats_pressure != val:
                 self._additional_nitrogen_alicats_pressure = val
                 self.additionalNitrogenAlicatsPressureChanged.emit(val)
                 logger.debug(f"Additional Nitrogen ALICATS pressure: {val} Torr")
         if 'chiller_temp_setpoint' in value:
             val = float(value['chiller_temp_setpoint'])
-            if not self._additional_chiller_temp_setpoint_user_interaction:
+            if not self._additional_chiller_temp_setpoint_user_interaction and self._additional_chiller_temp_setpoint != val:
                 self._additional_chiller_temp_setpoint = val
                 self.additionalChillerTempSetpointChanged.emit(val)
                 logger.debug(f"Additional Chiller Temp setpoint: {val}")
         if 'seop_resonance_frequency' in value:
             val = float(value['seop_resonance_frequency'])
-            if not self._additional_seop_resonance_frequency_user_interaction:
+            if not self._additional_seop_resonance_frequency_user_interaction and self._additional_seop_resonance_frequency != val:
                 self._additional_seop_resonance_frequency = val
                 self.additionalSEOPResonanceFrequencyChanged.emit(val)
                 logger.debug(f"Additional SEOP Resonance Frequency: {val} nm")
         if 'seop_resonance_frequency_tolerance' in value:
             val = float(value['seop_resonance_frequency_tolerance'])
-            if not self._additional_seop_resonance_frequency_tolerance_user_interaction:
+            if not self._additional_seop_resonance_frequency_tolerance_user_interaction and self._additional_seop_resonance_frequency_tolerance != val:
                 self._additional_seop_resonance_frequency_tolerance = val
                 self.additionalSEOPResonanceFrequencyToleranceChanged.emit(val)
                 logger.debug(f"Additional SEOP Resonance Frequency Tolerance: {val}")
         if 'ir_spectrometer_number_of_scans' in value:
             val = float(value['ir_spectrometer_number_of_scans'])
-            if not self._additional_ir_spectrometer_number_of_scans_user_interaction:
+            if not self._additional_ir_spectrometer_number_of_scans_user_interaction and self._additional_ir_spectrometer_number_of_scans != val:
                 self._additional_ir_spectrometer_number_of_scans = val
                 self.additionalIRSpectrometerNumberOfScansChanged.emit(val)
                 logger.debug(f"Additional IR spectrometer number of scans: {val}")
         if 'ir_spectrometer_exposure_duration' in value:
             val = float(value['ir_spectrometer_exposure_duration'])
-            if not self._additional_ir_spectrometer_exposure_duration_user_interaction:
+            if not self._additional_ir_spectrometer_exposure_duration_user_interaction and self._additional_ir_spectrometer_exposure_duration != val:
                 self._additional_ir_spectrometer_exposure_duration = val
                 self.additionalIRSpectrometerExposureDurationChanged.emit(val)
                 logger.debug(f"Additional IR spectrometer exposure duration: {val} ms")
         if 'h1_reference_n_scans' in value:
             val = float(value['h1_reference_n_scans'])
-            if not self._additional_1h_reference_n_scans_user_interaction:
+            if not self._additional_1h_reference_n_scans_user_interaction and self._additional_1h_reference_n_scans != val:
                 self._additional_1h_reference_n_scans = val
                 self.additional1HReferenceNScansChanged.emit(val)
                 logger.debug(f"Additional 1H Reference N Scans: {val}")
         if 'h1_current_sweep_n_scans' in value:
             val = float(value['h1_current_sweep_n_scans'])
-            if not self._additional_1h_current_sweep_n_scans_user_interaction:
+            if not self._additional_1h_current_sweep_n_scans_user_interaction and self._additional_1h_current_sweep_n_scans != val:
                 self._additional_1h_current_sweep_n_scans = val
                 self.additional1HCurrentSweepNScansChanged.emit(val)
                 logger.debug(f"Additional 1H Current Sweep N Scans: {val}")
         if 'baseline_correction_min_frequency' in value:
             val = float(value['baseline_correction_min_frequency'])
-            if not self._additional_baseline_correction_min_frequency_user_interaction:
+            if not self._additional_baseline_correction_min_frequency_user_interaction and self._additional_baseline_correction_min_frequency != val:
                 self._additional_baseline_correction_min_frequency = val
                 self.additionalBaselineCorrectionMinFrequencyChanged.emit(val)
                 logger.debug(f"Additional Baseline correction min frequency: {val} kHz")
         if 'baseline_correction_max_frequency' in value:
             val = float(value['baseline_correction_max_frequency'])
-            if not self._additional_baseline_correction_max_frequency_user_interaction:
+            if not self._additional_baseline_correction_max_frequency_user_interaction and self._additional_baseline_correction_max_frequency != val:
                 self._additional_baseline_correction_max_frequency = val
                 self.additionalBaselineCorrectionMaxFrequencyChanged.emit(val)
                 logger.debug(f"Additional Baseline correction max frequency: {val} kHz")
     
     def _readManualModeSettings(self):
         """Чтение регистров Manual mode settings (6301-6381)"""
-        if not self._is_connected or self._modbus_client is None or self._reading_manual_mode_settings:
+        if not self._is_connected or self._modbus_client is None or self._groupReadBusy("manual_mode_settings"):
             return
 
         self._reading_manual_mode_settings = True
@@ -3747,7 +4158,7 @@ class ModbusManager(QObject):
             
             return result
         
-        self._enqueue_read("manual_mode_settings", task)
+        self._enqueue_read("manual_mode_settings", task, PRIORITY_BACKGROUND)
     
     def _applyManualModeSettingsValue(self, value: object):
         """Применение результатов чтения Manual mode settings (6301-6381)"""
@@ -3760,55 +4171,55 @@ class ModbusManager(QObject):
         
         if 'rf_pulse_frequency' in value:
             val = float(value['rf_pulse_frequency'])
-            if not self._manual_mode_rf_pulse_frequency_user_interaction:
+            if not self._manual_mode_rf_pulse_frequency_user_interaction and self._manual_mode_rf_pulse_frequency != val:
                 self._manual_mode_rf_pulse_frequency = val
                 self.manualModeRFPulseFrequencyChanged.emit(val)
                 logger.debug(f"Manual mode RF pulse frequency: {val} kHz")
         if 'rf_pulse_power' in value:
             val = float(value['rf_pulse_power'])
-            if not self._manual_mode_rf_pulse_power_user_interaction:
+            if not self._manual_mode_rf_pulse_power_user_interaction and self._manual_mode_rf_pulse_power != val:
                 self._manual_mode_rf_pulse_power = val
                 self.manualModeRFPulsePowerChanged.emit(val)
                 logger.debug(f"Manual mode RF pulse power: {val}%")
         if 'rf_pulse_duration' in value:
             val = float(value['rf_pulse_duration'])
-            if not self._manual_mode_rf_pulse_duration_user_interaction:
+            if not self._manual_mode_rf_pulse_duration_user_interaction and self._manual_mode_rf_pulse_duration != val:
                 self._manual_mode_rf_pulse_duration = val
                 self.manualModeRFPulseDurationChanged.emit(val)
                 logger.debug(f"Manual mode RF pulse duration: {val} T/2")
         if 'pre_acquisition' in value:
             val = float(value['pre_acquisition'])
-            if not self._manual_mode_pre_acquisition_user_interaction:
+            if not self._manual_mode_pre_acquisition_user_interaction and self._manual_mode_pre_acquisition != val:
                 self._manual_mode_pre_acquisition = val
                 self.manualModePreAcquisitionChanged.emit(val)
                 logger.debug(f"Manual mode Pre acquisition: {val} ms")
         if 'nmr_gain' in value:
             val = float(value['nmr_gain'])
-            if not self._manual_mode_nmr_gain_user_interaction:
+            if not self._manual_mode_nmr_gain_user_interaction and self._manual_mode_nmr_gain != val:
                 self._manual_mode_nmr_gain = val
                 self.manualModeNMRGainChanged.emit(val)
                 logger.debug(f"Manual mode NMR gain: {val} dB")
         if 'nmr_number_of_scans' in value:
             val = float(value['nmr_number_of_scans'])
-            if not self._manual_mode_nmr_number_of_scans_user_interaction:
+            if not self._manual_mode_nmr_number_of_scans_user_interaction and self._manual_mode_nmr_number_of_scans != val:
                 self._manual_mode_nmr_number_of_scans = val
                 self.manualModeNMRNumberOfScansChanged.emit(val)
                 logger.debug(f"Manual mode NMR number of scans: {val}")
         if 'nmr_recovery' in value:
             val = float(value['nmr_recovery'])
-            if not self._manual_mode_nmr_recovery_user_interaction:
+            if not self._manual_mode_nmr_recovery_user_interaction and self._manual_mode_nmr_recovery != val:
                 self._manual_mode_nmr_recovery = val
                 self.manualModeNMRRecoveryChanged.emit(val)
                 logger.debug(f"Manual mode NMR recovery: {val} ms")
         if 'center_frequency' in value:
             val = float(value['center_frequency'])
-            if not self._manual_mode_center_frequency_user_interaction:
+            if not self._manual_mode_center_frequency_user_interaction and self._manual_mode_center_frequency != val:
                 self._manual_mode_center_frequency = val
                 self.manualModeCenterFrequencyChanged.emit(val)
                 logger.debug(f"Manual mode Center frequency: {val} kHz")
         if 'frequency_span' in value:
             val = float(value['frequency_span'])
-            if not self._manual_mode_frequency_span_user_interaction:
+            if not self._manual_mode_frequency_span_user_interaction and self._manual_mode_frequency_span != val:
                 self._manual_mode_frequency_span = val
                 self.manualModeFrequencySpanChanged.emit(val)
                 logger.debug(f"Manual mode Frequency span: {val} kHz")
@@ -3825,9 +4236,9 @@ class ModbusManager(QObject):
         self._measured_cold_cell_ir_signal_user_interaction = True
         self.measuredColdCellIRSignalChanged.emit(value)
         register_value = int(value)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(5021, register_value)
+            result = write(5021, register_value)
             return bool(result)
         self._enqueue_write("measured_cold_cell_ir_signal", task, {"value": value})
         return True
@@ -3853,9 +4264,9 @@ class ModbusManager(QObject):
         self._measured_hot_cell_ir_signal_user_interaction = True
         self.measuredHotCellIRSignalChanged.emit(value)
         register_value = int(value)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(5031, register_value)
+            result = write(5031, register_value)
             return bool(result)
         self._enqueue_write("measured_hot_cell_ir_signal", task, {"value": value})
         return True
@@ -3881,9 +4292,9 @@ class ModbusManager(QObject):
         self._measured_water_1h_nmr_reference_signal_user_interaction = True
         self.measuredWater1HNMRReferenceSignalChanged.emit(value)
         register_value = int(value)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(5041, register_value)
+            result = write(5041, register_value)
             return bool(result)
         self._enqueue_write("measured_water_1h_nmr_reference_signal", task, {"value": value})
         return True
@@ -3908,10 +4319,10 @@ class ModbusManager(QObject):
         self._measured_water_t2 = value_ms
         self._measured_water_t2_user_interaction = True
         self.measuredWaterT2Changed.emit(value_ms)
-        register_value = int(value_ms * 100)
-        client = self._modbus_client
+        register_value = round(value_ms * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(5051, register_value)
+            result = write(5051, register_value)
             return bool(result)
         self._enqueue_write("measured_water_t2", task, {"value_ms": value_ms})
         return True
@@ -3936,10 +4347,10 @@ class ModbusManager(QObject):
         self._measured_hp_129xe_t2 = value_ms
         self._measured_hp_129xe_t2_user_interaction = True
         self.measuredHP129XeT2Changed.emit(value_ms)
-        register_value = int(value_ms * 100)
-        client = self._modbus_client
+        register_value = round(value_ms * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(5071, register_value)
+            result = write(5071, register_value)
             return bool(result)
         self._enqueue_write("measured_hp_129xe_t2", task, {"value_ms": value_ms})
         return True
@@ -4006,10 +4417,10 @@ class ModbusManager(QObject):
         self._additional_magnet_psu_current_proton_nmr = current_a
         self._additional_magnet_psu_current_proton_nmr_user_interaction = True
         self.additionalMagnetPSUCurrentProtonNMRChanged.emit(current_a)
-        register_value = int(current_a * 100)
-        client = self._modbus_client
+        register_value = round(current_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6011, register_value)
+            result = write(6011, register_value)
             return bool(result)
         self._enqueue_write("additional_magnet_psu_current_proton_nmr", task, {"current_a": current_a})
         return True
@@ -4034,10 +4445,10 @@ class ModbusManager(QObject):
         self._additional_magnet_psu_current_129xe_nmr = current_a
         self._additional_magnet_psu_current_129xe_nmr_user_interaction = True
         self.additionalMagnetPSUCurrent129XeNMRChanged.emit(current_a)
-        register_value = int(current_a * 100)
-        client = self._modbus_client
+        register_value = round(current_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6021, register_value)
+            result = write(6021, register_value)
             return bool(result)
         self._enqueue_write("additional_magnet_psu_current_129xe_nmr", task, {"current_a": current_a})
         return True
@@ -4062,10 +4473,10 @@ class ModbusManager(QObject):
         self._additional_operational_laser_psu_current = current_a
         self._additional_operational_laser_psu_current_user_interaction = True
         self.additionalOperationalLaserPSUCurrentChanged.emit(current_a)
-        register_value = int(current_a * 100)
-        client = self._modbus_client
+        register_value = round(current_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6031, register_value)
+            result = write(6031, register_value)
             return bool(result)
         self._enqueue_write("additional_operational_laser_psu_current", task, {"current_a": current_a})
         return True
@@ -4091,9 +4502,9 @@ class ModbusManager(QObject):
         self._additional_rf_pulse_duration_user_interaction = True
         self.additionalRFPulseDurationChanged.emit(duration)
         register_value = int(duration)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6041, register_value)
+            result = write(6041, register_value)
             return bool(result)
         self._enqueue_write("additional_rf_pulse_duration", task, {"duration": duration})
         return True
@@ -4118,10 +4529,10 @@ class ModbusManager(QObject):
         self._additional_resonance_frequency = frequency_khz
         self._additional_resonance_frequency_user_interaction = True
         self.additionalResonanceFrequencyChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6051, register_value)
+            result = write(6051, register_value)
             return bool(result)
         self._enqueue_write("additional_resonance_frequency", task, {"frequency_khz": frequency_khz})
         return True
@@ -4146,10 +4557,10 @@ class ModbusManager(QObject):
         self._additional_proton_rf_pulse_power = power_percent
         self._additional_proton_rf_pulse_power_user_interaction = True
         self.additionalProtonRFPulsePowerChanged.emit(power_percent)
-        register_value = int(power_percent * 100)
-        client = self._modbus_client
+        register_value = round(power_percent * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6061, register_value)
+            result = write(6061, register_value)
             return bool(result)
         self._enqueue_write("additional_proton_rf_pulse_power", task, {"power_percent": power_percent})
         return True
@@ -4174,10 +4585,10 @@ class ModbusManager(QObject):
         self._additional_hp_129xe_rf_pulse_power = power_percent
         self._additional_hp_129xe_rf_pulse_power_user_interaction = True
         self.additionalHP129XeRFPulsePowerChanged.emit(power_percent)
-        register_value = int(power_percent * 100)
-        client = self._modbus_client
+        register_value = round(power_percent * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6071, register_value)
+            result = write(6071, register_value)
             return bool(result)
         self._enqueue_write("additional_hp_129xe_rf_pulse_power", task, {"power_percent": power_percent})
         return True
@@ -4202,10 +4613,10 @@ class ModbusManager(QObject):
         self._additional_step_size_b0_sweep_hp_129xe = step_size_a
         self._additional_step_size_b0_sweep_hp_129xe_user_interaction = True
         self.additionalStepSizeB0SweepHP129XeChanged.emit(step_size_a)
-        register_value = int(step_size_a * 100)
-        client = self._modbus_client
+        register_value = round(step_size_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6081, register_value)
+            result = write(6081, register_value)
             return bool(result)
         self._enqueue_write("additional_step_size_b0_sweep_hp_129xe", task, {"step_size_a": step_size_a})
         return True
@@ -4230,10 +4641,10 @@ class ModbusManager(QObject):
         self._additional_step_size_b0_sweep_protons = step_size_a
         self._additional_step_size_b0_sweep_protons_user_interaction = True
         self.additionalStepSizeB0SweepProtonsChanged.emit(step_size_a)
-        register_value = int(step_size_a * 100)
-        client = self._modbus_client
+        register_value = round(step_size_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6091, register_value)
+            result = write(6091, register_value)
             return bool(result)
         self._enqueue_write("additional_step_size_b0_sweep_protons", task, {"step_size_a": step_size_a})
         return True
@@ -4258,10 +4669,10 @@ class ModbusManager(QObject):
         self._additional_xe_alicats_pressure = pressure_torr
         self._additional_xe_alicats_pressure_user_interaction = True
         self.additionalXeAlicatsPressureChanged.emit(pressure_torr)
-        register_value = int(pressure_torr * 100)
-        client = self._modbus_client
+        register_value = round(pressure_torr * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6101, register_value)
+            result = write(6101, register_value)
             return bool(result)
         self._enqueue_write("additional_xe_alicats_pressure", task, {"pressure_torr": pressure_torr})
         return True
@@ -4286,10 +4697,10 @@ class ModbusManager(QObject):
         self._additional_nitrogen_alicats_pressure = pressure_torr
         self._additional_nitrogen_alicats_pressure_user_interaction = True
         self.additionalNitrogenAlicatsPressureChanged.emit(pressure_torr)
-        register_value = int(pressure_torr * 100)
-        client = self._modbus_client
+        register_value = round(pressure_torr * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6111, register_value)
+            result = write(6111, register_value)
             return bool(result)
         self._enqueue_write("additional_nitrogen_alicats_pressure", task, {"pressure_torr": pressure_torr})
         return True
@@ -4315,9 +4726,9 @@ class ModbusManager(QObject):
         self._additional_chiller_temp_setpoint_user_interaction = True
         self.additionalChillerTempSetpointChanged.emit(setpoint)
         register_value = int(setpoint)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6121, register_value)
+            result = write(6121, register_value)
             return bool(result)
         self._enqueue_write("additional_chiller_temp_setpoint", task, {"setpoint": setpoint})
         return True
@@ -4342,10 +4753,10 @@ class ModbusManager(QObject):
         self._additional_seop_resonance_frequency = frequency_nm
         self._additional_seop_resonance_frequency_user_interaction = True
         self.additionalSEOPResonanceFrequencyChanged.emit(frequency_nm)
-        register_value = int(frequency_nm * 100)
-        client = self._modbus_client
+        register_value = round(frequency_nm * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6131, register_value)
+            result = write(6131, register_value)
             return bool(result)
         self._enqueue_write("additional_seop_resonance_frequency", task, {"frequency_nm": frequency_nm})
         return True
@@ -4371,9 +4782,9 @@ class ModbusManager(QObject):
         self._additional_seop_resonance_frequency_tolerance_user_interaction = True
         self.additionalSEOPResonanceFrequencyToleranceChanged.emit(tolerance)
         register_value = int(tolerance)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6141, register_value)
+            result = write(6141, register_value)
             return bool(result)
         self._enqueue_write("additional_seop_resonance_frequency_tolerance", task, {"tolerance": tolerance})
         return True
@@ -4399,9 +4810,9 @@ class ModbusManager(QObject):
         self._additional_ir_spectrometer_number_of_scans_user_interaction = True
         self.additionalIRSpectrometerNumberOfScansChanged.emit(num_scans)
         register_value = int(num_scans)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6151, register_value)
+            result = write(6151, register_value)
             return bool(result)
         self._enqueue_write("additional_ir_spectrometer_number_of_scans", task, {"num_scans": num_scans})
         return True
@@ -4426,10 +4837,10 @@ class ModbusManager(QObject):
         self._additional_ir_spectrometer_exposure_duration = duration_ms
         self._additional_ir_spectrometer_exposure_duration_user_interaction = True
         self.additionalIRSpectrometerExposureDurationChanged.emit(duration_ms)
-        register_value = int(duration_ms * 100)
-        client = self._modbus_client
+        register_value = round(duration_ms * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6161, register_value)
+            result = write(6161, register_value)
             return bool(result)
         self._enqueue_write("additional_ir_spectrometer_exposure_duration", task, {"duration_ms": duration_ms})
         return True
@@ -4455,9 +4866,9 @@ class ModbusManager(QObject):
         self._additional_1h_reference_n_scans_user_interaction = True
         self.additional1HReferenceNScansChanged.emit(num_scans)
         register_value = int(num_scans)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6171, register_value)
+            result = write(6171, register_value)
             return bool(result)
         self._enqueue_write("additional_1h_reference_n_scans", task, {"num_scans": num_scans})
         return True
@@ -4483,9 +4894,9 @@ class ModbusManager(QObject):
         self._additional_1h_current_sweep_n_scans_user_interaction = True
         self.additional1HCurrentSweepNScansChanged.emit(num_scans)
         register_value = int(num_scans)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6181, register_value)
+            result = write(6181, register_value)
             return bool(result)
         self._enqueue_write("additional_1h_current_sweep_n_scans", task, {"num_scans": num_scans})
         return True
@@ -4510,10 +4921,10 @@ class ModbusManager(QObject):
         self._additional_baseline_correction_min_frequency = frequency_khz
         self._additional_baseline_correction_min_frequency_user_interaction = True
         self.additionalBaselineCorrectionMinFrequencyChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6191, register_value)
+            result = write(6191, register_value)
             return bool(result)
         self._enqueue_write("additional_baseline_correction_min_frequency", task, {"frequency_khz": frequency_khz})
         return True
@@ -4538,10 +4949,10 @@ class ModbusManager(QObject):
         self._additional_baseline_correction_max_frequency = frequency_khz
         self._additional_baseline_correction_max_frequency_user_interaction = True
         self.additionalBaselineCorrectionMaxFrequencyChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6201, register_value)
+            result = write(6201, register_value)
             return bool(result)
         self._enqueue_write("additional_baseline_correction_max_frequency", task, {"frequency_khz": frequency_khz})
         return True
@@ -4728,10 +5139,10 @@ class ModbusManager(QObject):
         self._manual_mode_rf_pulse_frequency = frequency_khz
         self._manual_mode_rf_pulse_frequency_user_interaction = True
         self.manualModeRFPulseFrequencyChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6301, register_value)
+            result = write(6301, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_rf_pulse_frequency", task, {"frequency_khz": frequency_khz})
         return True
@@ -4756,10 +5167,10 @@ class ModbusManager(QObject):
         self._manual_mode_rf_pulse_power = power_percent
         self._manual_mode_rf_pulse_power_user_interaction = True
         self.manualModeRFPulsePowerChanged.emit(power_percent)
-        register_value = int(power_percent * 100)
-        client = self._modbus_client
+        register_value = round(power_percent * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6311, register_value)
+            result = write(6311, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_rf_pulse_power", task, {"power_percent": power_percent})
         return True
@@ -4784,10 +5195,10 @@ class ModbusManager(QObject):
         self._manual_mode_rf_pulse_duration = duration_t2
         self._manual_mode_rf_pulse_duration_user_interaction = True
         self.manualModeRFPulseDurationChanged.emit(duration_t2)
-        register_value = int(duration_t2 * 100)
-        client = self._modbus_client
+        register_value = round(duration_t2 * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6321, register_value)
+            result = write(6321, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_rf_pulse_duration", task, {"duration_t2": duration_t2})
         return True
@@ -4812,10 +5223,10 @@ class ModbusManager(QObject):
         self._manual_mode_pre_acquisition = duration_ms
         self._manual_mode_pre_acquisition_user_interaction = True
         self.manualModePreAcquisitionChanged.emit(duration_ms)
-        register_value = int(duration_ms * 100)
-        client = self._modbus_client
+        register_value = round(duration_ms * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6331, register_value)
+            result = write(6331, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_pre_acquisition", task, {"duration_ms": duration_ms})
         return True
@@ -4840,10 +5251,10 @@ class ModbusManager(QObject):
         self._manual_mode_nmr_gain = gain_db
         self._manual_mode_nmr_gain_user_interaction = True
         self.manualModeNMRGainChanged.emit(gain_db)
-        register_value = int(gain_db * 100)
-        client = self._modbus_client
+        register_value = round(gain_db * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6341, register_value)
+            result = write(6341, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_nmr_gain", task, {"gain_db": gain_db})
         return True
@@ -4869,9 +5280,9 @@ class ModbusManager(QObject):
         self._manual_mode_nmr_number_of_scans_user_interaction = True
         self.manualModeNMRNumberOfScansChanged.emit(num_scans)
         register_value = int(num_scans)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6351, register_value)
+            result = write(6351, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_nmr_number_of_scans", task, {"num_scans": num_scans})
         return True
@@ -4896,10 +5307,10 @@ class ModbusManager(QObject):
         self._manual_mode_nmr_recovery = duration_ms
         self._manual_mode_nmr_recovery_user_interaction = True
         self.manualModeNMRRecoveryChanged.emit(duration_ms)
-        register_value = int(duration_ms * 100)
-        client = self._modbus_client
+        register_value = round(duration_ms * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6361, register_value)
+            result = write(6361, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_nmr_recovery", task, {"duration_ms": duration_ms})
         return True
@@ -4924,10 +5335,10 @@ class ModbusManager(QObject):
         self._manual_mode_center_frequency = frequency_khz
         self._manual_mode_center_frequency_user_interaction = True
         self.manualModeCenterFrequencyChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6371, register_value)
+            result = write(6371, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_center_frequency", task, {"frequency_khz": frequency_khz})
         return True
@@ -4952,10 +5363,10 @@ class ModbusManager(QObject):
         self._manual_mode_frequency_span = frequency_khz
         self._manual_mode_frequency_span_user_interaction = True
         self.manualModeFrequencySpanChanged.emit(frequency_khz)
-        register_value = int(frequency_khz * 100)
-        client = self._modbus_client
+        register_value = round(frequency_khz * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(6381, register_value)
+            result = write(6381, register_value)
             return bool(result)
         self._enqueue_write("manual_mode_frequency_span", task, {"frequency_khz": frequency_khz})
         return True
@@ -5055,79 +5466,51 @@ class ModbusManager(QObject):
         Returns:
             True если успешно, False в противном случае
         """
-        logger.info(f"⚡ setFan вызван: fanIndex={fanIndex}, state={state} - МГНОВЕННОЕ обновление UI")
-        # Маппинг fanIndex (из QML) -> бит в регистре 1131
-        fan_bit_mapping = {
-            0: 0,   # inlet fan 1 (button4) -> бит 0 (бит 1 считая с 1)
-            1: 1,   # inlet fan 2 (button3) -> бит 1 (бит 2 считая с 1)
-            2: 2,   # inlet fan 3 (button2) -> бит 2 (бит 3 считая с 1)
-            3: 3,   # inlet fan 4 (button7) -> бит 3 (бит 4 считая с 1)
-            6: 4,   # opcell fan 1 (button10) -> бит 4 (бит 5 считая с 1)
-            7: 5,   # opcell fan 2 (button9) -> бит 5 (бит 6 считая с 1)
-            8: 6,   # opcell fan 3 (button8) -> бит 6 (бит 7 считая с 1)
-            9: 7,   # opcell fan 4 (button13) -> бит 7 (бит 8 считая с 1)
-            4: 8,   # outlet fan 1 (button6) -> бит 8 (бит 9 считая с 1)
-            5: 9,   # outlet fan 2 (button5) -> бит 9 (бит 10 считая с 1)
-        }
-        
-        # Маппинг fanIndex -> название вентилятора для статуса
-        fan_name_mapping = {
-            0: "inlet fan 1",
-            1: "inlet fan 2",
-            2: "inlet fan 3",
-            3: "inlet fan 4",
-            4: "outlet fan 1",
-            5: "outlet fan 2",
-            6: "opcell fan 1",
-            7: "opcell fan 2",
-            8: "opcell fan 3",
-            9: "opcell fan 4",
-            10: "laser fan"
-        }
+        logger.debug("⚡ setFan: fanIndex=%s, state=%s", fanIndex, state)
         
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
         # Это обеспечивает мгновенную реакцию кнопок даже при подключенном устройстве
-        if fanIndex == 10:
+        if fanIndex == _LASER_FAN_INDEX:
             # Laser fan использует бит 15 (считая с 0), что соответствует биту 16 (считая с 1)
-            logger.info(f"Установка Laser Fan (бит 15): {state}")
+            logger.debug("Установка Laser Fan (бит 15): %s", state)
             # Обновляем статус
-            self._updateActionStatus(f"set {fan_name_mapping[10]}")
+            self._updateActionStatus(_FAN_STATUS_TEXT[_LASER_FAN_INDEX])
             # Логируем действие
-            self._addLog(f"{fan_name_mapping[10]}: {'ON' if state else 'OFF'}")
+            self._addLog(f"{_FAN_NAME_MAPPING[_LASER_FAN_INDEX]}: {'ON' if state else 'OFF'}")
             # Сразу обновляем буфер и UI для мгновенной реакции (оптимистичное обновление)
-            self._fan_states[10] = state
-            self.fanStateChanged.emit(10, state)
+            self._fans.states[_LASER_FAN_INDEX] = state
+            self.fanStateChanged.emit(_LASER_FAN_INDEX, state)
             # Устанавливаем флаг оптимистичного обновления (игнорируем чтение регистра в течение 500мс)
-            import time
-            self._fan_optimistic_updates[10] = time.time()
+            self._fans.optimistic_deadline[_LASER_FAN_INDEX] = time.monotonic() + _FanSubsystem.OPTIMISTIC_WINDOW_S
+            self._fans.last_bits = None
             # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
             if self._is_connected and self._modbus_client is not None:
                 self._setLaserFanAsync(state)
             return True  # Возвращаем True сразу, так как UI уже обновлен
-        elif fanIndex in fan_bit_mapping:
-            fan_bit = fan_bit_mapping[fanIndex]
-            logger.info(f"Установка вентилятора {fanIndex} (бит {fan_bit}): {state}")
+        elif fanIndex in _FAN_BIT_MAPPING:
+            fan_bit = _FAN_BIT_MAPPING[fanIndex]
+            logger.debug("Установка вентилятора %s (бит %s): %s", fanIndex, fan_bit, state)
             # Обновляем статус с правильным названием
-            if fanIndex in fan_name_mapping:
-                self._updateActionStatus(f"set {fan_name_mapping[fanIndex]}")
+            if fanIndex in _FAN_NAME_MAPPING:
+                self._updateActionStatus(_FAN_STATUS_TEXT[fanIndex])
                 # Логируем действие
-                self._addLog(f"{fan_name_mapping[fanIndex]}: {'ON' if state else 'OFF'}")
+                self._addLog(f"{_FAN_NAME_MAPPING[fanIndex]}: {'ON' if state else 'OFF'}")
             else:
                 self._updateActionStatus(f"set fan {fanIndex + 1}")
                 # Логируем действие
                 self._addLog(f"Fan {fanIndex + 1}: {'ON' if state else 'OFF'}")
             # Сразу обновляем буфер и UI для мгновенной реакции (оптимистичное обновление)
-            self._fan_states[fanIndex] = state
+            self._fans.states[fanIndex] = state
             self.fanStateChanged.emit(fanIndex, state)
             # Устанавливаем флаг оптимистичного обновления (игнорируем чтение регистра в течение 500мс)
-            import time
-            self._fan_optimistic_updates[fanIndex] = time.time()
+            self._fans.optimistic_deadline[fanIndex] = time.monotonic() + _FanSubsystem.OPTIMISTIC_WINDOW_S
+            self._fans.last_bits = None
             # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
             if self._is_connected and self._modbus_client is not None:
                 self._setFanAsync(fanIndex, fan_bit, state)
             return True  # Возвращаем True сразу, так как UI уже обновлен
         else:
-            logger.error(f"Неизвестный индекс вентилятора: {fanIndex}")
+            logger.error("Неизвестный индекс вентилятора: %s", fanIndex)
             return False
     
     # Очередь задач Modbus из GUI-потока удалена:
@@ -5135,66 +5518,82 @@ class ModbusManager(QObject):
     
     def _setFanAsync(self, fanIndex: int, fan_bit: int, state: bool):
         """Асинхронная установка состояния вентилятора (не блокирует UI)"""
-        client = self._modbus_client
-
-        def task() -> bool:
-            try:
-                result = client.set_fan_1131(fan_bit, state)
-                if result:
-                    logger.info(f"✅ Вентилятор {fanIndex} успешно {'включен' if state else 'выключен'}")
-                else:
-                    logger.error(f"❌ Не удалось {'включить' if state else 'выключить'} вентилятор {fanIndex}")
-                return bool(result)
-            except Exception as e:
-                logger.error(f"Ошибка при асинхронной установке вентилятора {fanIndex}: {e}", exc_info=True)
-                return False
-
-        self._enqueue_write("fan1131", task, {"fanIndex": fanIndex, "state": state})
+        self._queueFanBit(fan_bit, state)
     
     def _setLaserFanAsync(self, state: bool):
         """Асинхронная установка состояния Laser Fan (не блокирует UI)"""
-        client = self._modbus_client
+        self._queueFanBit(_LASER_FAN_BIT, state)
+    
+    def _queueFanBit(self, fan_bit: int, state: bool):
+        """
+        Поставить изменение бита регистра 1131 в очередь. Пока задача записи 1131 ждет в очереди,
+        новые изменения добавляются в нее же: несколько нажатий дают одно чтение-модификацию-запись.
+        """
+        with self._pending_fan_lock:
+            task_queued = bool(self._pending_fan_bits)
+            self._pending_fan_bits[fan_bit] = state
+        if task_queued:
+            return
+        set_fans = self._modbus_client.set_fans_1131
 
         def task() -> bool:
+            with self._pending_fan_lock:
+                bits = self._pending_fan_bits
+                self._pending_fan_bits = {}
+            if not bits:
+                return True
             try:
-                # laser fan: bit 15
-                result = client.set_fan_1131(15, state)
+                result = set_fans(bits)
                 if result:
-                    logger.info(f"✅ Laser Fan успешно {'включен' if state else 'выключен'}")
+                    logger.info("✅ Вентиляторы (регистр 1131) успешно установлены: %s", bits)
                 else:
-                    logger.error(f"❌ Не удалось {'включить' if state else 'выключить'} Laser Fan")
+                    logger.error("❌ Не удалось установить вентиляторы (регистр 1131): %s", bits)
                 return bool(result)
             except Exception as e:
-                logger.error(f"Ошибка при асинхронной установке Laser Fan: {e}", exc_info=True)
+                logger.error("Ошибка при асинхронной установке вентиляторов %s: %s", bits, e, exc_info=True)
                 return False
 
-        self._enqueue_write("laser_fan", task, {"state": state})
+        self._enqueue_write("fan1131", task, {"bits": self._pending_fan_bits})
     
     def _setRelayAsync(self, relay_num: int, state: bool, name: str):
-        """Асинхронная установка состояния реле (не блокирует UI)"""
-        client = self._modbus_client
+        """
+        Асинхронная установка состояния реле (не блокирует UI). Пока задача записи 1021 ждет в очереди,
+        новые переключения добавляются в нее же: несколько реле подряд дают одно чтение-модификацию-запись.
+        """
+        with self._pending_relay_lock:
+            task_queued = bool(self._pending_relay_bits)
+            self._pending_relay_bits[relay_num] = (state, name)
+        if task_queued:
+            return
+        set_relays = self._modbus_client.set_relays_1021
 
         def task() -> bool:
+            with self._pending_relay_lock:
+                pending = self._pending_relay_bits
+                self._pending_relay_bits = {}
+            if not pending:
+                return True
             try:
-                result = client.set_relay_1021(relay_num, state)
-                if result:
-                    logger.info(f"✅ {name} успешно {'включен' if state else 'выключен'}")
-                else:
-                    logger.error(f"❌ Не удалось {'включить' if state else 'выключить'} {name}")
+                result = set_relays({num: relay_state for num, (relay_state, _) in pending.items()})
+                for relay_state, relay_name in pending.values():
+                    if result:
+                        logger.info("✅ %s успешно %s", relay_name, 'включен' if relay_state else 'выключен')
+                    else:
+                        logger.error("❌ Не удалось %s %s", 'включить' if relay_state else 'выключить', relay_name)
                 return bool(result)
             except Exception as e:
-                logger.error(f"Ошибка при асинхронной установке {name}: {e}", exc_info=True)
+                logger.error("Ошибка при асинхронной установке реле %s: %s", pending, e, exc_info=True)
                 return False
 
-        self._enqueue_write(f"relay:{relay_num}", task, {"relay": relay_num, "state": state, "name": name})
+        self._enqueue_write("relay1021", task, {"relays": self._pending_relay_bits})
     
     def _setValveAsync(self, valveIndex: int, valve_bit: int, state: bool):
         """Асинхронная установка состояния клапана (не блокирует UI)"""
-        client = self._modbus_client
+        set_valve = self._modbus_client.set_valve_1111
 
         def task() -> bool:
             try:
-                result = client.set_valve_1111(valve_bit, state)
+                result = set_valve(valve_bit, state)
                 if result:
                     logger.info(f"✅ Клапан {valveIndex} (бит {valve_bit}) успешно {'открыт' if state else 'закрыт'}")
                 else:
@@ -5204,7 +5603,7 @@ class ModbusManager(QObject):
                 logger.error(f"Ошибка при асинхронной установке клапана {valveIndex}: {e}", exc_info=True)
                 return False
 
-        self._enqueue_write(f"valve:{valveIndex}", task, {"valveIndex": valveIndex, "state": state})
+        self._enqueue_write(f"valve:{valveIndex}", task, {"valveIndex": valveIndex, "state": state}, coalesce=True)
     
     @Slot(float, result=bool)
     def setWaterChillerSetpointValue(self, temperature: float) -> bool:
@@ -5212,96 +5611,76 @@ class ModbusManager(QObject):
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint: {temperature}°C (было {self._water_chiller_setpoint}°C)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Тот же setpoint повторно не эмитируем (лишнее обновление QML), но взаимодействие отмечаем
+        if abs(temperature - self._water_chiller_setpoint) < 1e-6:
+            self._water_chiller_setpoint_user_interaction = True
+            return True
+        # Пока пользователь взаимодействует с полем, микроизменения не эмитируем
+        if self._isRedundantSetpoint('water_chiller', temperature, self._water_chiller_setpoint, self._water_chiller_setpoint_user_interaction):
+            return True
+        logger.debug("Обновление внутреннего значения setpoint Water Chiller: %s°C (было %s°C)", temperature, self._water_chiller_setpoint)
         self._water_chiller_setpoint = temperature
         self.waterChillerSetpointChanged.emit(temperature)
-        logger.info(f"✅ Внутреннее значение setpoint обновлено: {self._water_chiller_setpoint}°C")
         # Отмечаем, что пользователь взаимодействует с полем
         self._water_chiller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._water_chiller_setpoint_auto_update_timer.stop()
-        self._water_chiller_setpoint_auto_update_timer.start()
         return True
     
-    @Slot(float, result=bool)
-    def setWaterChillerTemperature(self, temperature: float) -> bool:
+    def _setTemperatureSetpoint(self, name: str, temperature: float, register_value: Optional[int] = None) -> bool:
         """
-        Установка температуры Water Chiller в регистр 1531
-        
-        Args:
-            temperature: Температура в градусах Цельсия (например, 23.0)
-        
-        Returns:
-            True если успешно, False в противном случае
+        Установка setpoint температуры по таблице self._temperature_setpoint_specs:
+        setpoint и UI обновляются сразу, запись (температура x100) уходит в регистр отложенно.
+        register_value - уже известное значение регистра (шаг стрелок), тогда temperature не пересчитывается.
         """
-        logger.info(f"🔵 setWaterChillerTemperature вызван с температурой: {temperature}°C")
+        label, register, setpoint_attr, flag_attr, signal, _ = self._temperature_setpoint_specs[name]
+        logger.debug("🔵 set %s: %s°C", label, temperature)
         
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set water chiller to {temperature:.2f}")
+        self._updateActionStatus(f"set {label.lower()} to {temperature:.2f}")
         
         if not self._is_connected or self._modbus_client is None:
-            logger.warning("Попытка установки температуры Water Chiller без подключения")
+            logger.warning("Попытка установки температуры %s без подключения", label)
             return False
         
-        # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
-        # Это нужно для того, чтобы стрелки работали с актуальным значением
-        # Всегда обновляем и эмитируем сигнал, даже если значение не изменилось
-        # Это гарантирует обновление UI при нажатии на стрелки
-        logger.info(f"🔵 Обновление _water_chiller_setpoint: {self._water_chiller_setpoint}°C -> {temperature}°C")
-        self._water_chiller_setpoint = temperature
-        # Отправляем сигнал для обновления UI (setpoint)
-        logger.info(f"🔵 Эмитируем сигнал waterChillerSetpointChanged: {temperature}°C")
-        self.waterChillerSetpointChanged.emit(temperature)
+        # Преобразуем температуру в значение для регистра (умножаем на 100), например 23.0°C -> 2300;
+        # setpoint храним в разрешении регистра, чтобы шаги стрелок не накапливали ошибку float
+        if register_value is None:
+            register_value = round(temperature * 100)
+        temperature = register_value / 100
         
-        # Преобразуем температуру в значение для регистра (умножаем на 100)
-        # Например, 23.0°C -> 2300
-        register_value = int(temperature * 100)
+        # Повторная отправка того же значения во время взаимодействия (дребезг слайдера) не нужна
+        if name in self._SETPOINT_EPS and self._isRedundantSetpoint(name, temperature, self._last_sent_setpoints.get(name, math.inf), getattr(self, flag_attr)):
+            return True
         
-        logger.info(f"Установка температуры Water Chiller: {temperature}°C (регистр 1531 = {register_value})")
+        # Обновляем внутреннее значение setpoint сразу (до отправки на устройство); UI - только при изменении
+        current = getattr(self, setpoint_attr)
+        if temperature != current:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Обновление %s: %s°C -> %s°C", setpoint_attr, current, temperature)
+            setattr(self, setpoint_attr, temperature)
+            signal.emit(temperature)
         
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1531_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура Water Chiller успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру Water Chiller: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1531", task, {"temperature": temperature})
+        logger.info("Установка температуры %s: %.2f°C (регистр %d = %d)", label, temperature, register, register_value)
+        
+        write = partial(self._modbus_client.write_register_direct, register)
+        task = partial(_write_temperature_setpoint, write, label, register_value, temperature)
+        self._enqueueDebouncedWrite(str(register), task, {"temperature": temperature})
+        self._last_sent_setpoints[name] = temperature
         return True
     
-    @Slot(result=bool)
-    def increaseWaterChillerTemperature(self) -> bool:
-        """Увеличение заданной температуры Water Chiller на 1°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Увеличение температуры: текущее значение = {self._water_chiller_setpoint}°C")
-        new_temp = self._water_chiller_setpoint + 1.0
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._water_chiller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._water_chiller_setpoint_auto_update_timer.stop()
-        self._water_chiller_setpoint_auto_update_timer.start()
-        return self.setWaterChillerTemperature(new_temp)
-    
-    @Slot(result=bool)
-    def decreaseWaterChillerTemperature(self) -> bool:
-        """Уменьшение заданной температуры Water Chiller на 1°C"""
+    def _stepTemperatureSetpoint(self, name: str, direction: int) -> bool:
+        """Шаг стрелки для setpoint температуры: direction = +1 / -1, шаг из self._temperature_setpoint_specs"""
         if not self._is_connected:
             return False
-        logger.debug(f"Уменьшение температуры: текущее значение = {self._water_chiller_setpoint}°C")
-        new_temp = self._water_chiller_setpoint - 1.0
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
+        label, _, setpoint_attr, flag_attr, _, step = self._temperature_setpoint_specs[name]
+        current = getattr(self, setpoint_attr)
+        # Шаг считаем в единицах регистра (0.01°C) целыми числами: повторные шаги не накапливают ошибку float
+        register_value = round(current * 100) + direction * step
+        new_temp = register_value / 100
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Изменение температуры %s: %s°C -> %s°C", label, current, new_temp)
         # Отмечаем, что пользователь взаимодействует с полем
-        self._water_chiller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._water_chiller_setpoint_auto_update_timer.stop()
-        self._water_chiller_setpoint_auto_update_timer.start()
-        return self.setWaterChillerTemperature(new_temp)
+        setattr(self, flag_attr, True)
+        return self._setTemperatureSetpoint(name, new_temp, register_value)
     
     @Slot(float, result=bool)
     def setMagnetPSUSetpointValue(self, temperature: float) -> bool:
@@ -5309,90 +5688,33 @@ class ModbusManager(QObject):
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint Magnet PSU: {temperature}°C (было {self._magnet_psu_setpoint}°C)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Приводим к разрешению регистра (0.01°C): шаги стрелок не накапливают ошибку float
+        temperature = round(temperature * 100) / 100
+        # Тот же setpoint повторно не эмитируем (лишнее обновление QML), но взаимодействие отмечаем
+        if temperature == self._magnet_psu_setpoint:
+            self._magnet_psu_setpoint_user_interaction = True
+            return True
+        logger.debug("Обновление внутреннего значения setpoint Magnet PSU: %s°C (было %s°C)", temperature, self._magnet_psu_setpoint)
         self._magnet_psu_setpoint = temperature
         self.magnetPSUSetpointChanged.emit(temperature)
-        logger.info(f"✅ Внутреннее значение setpoint Magnet PSU обновлено: {self._magnet_psu_setpoint}°C")
         # Отмечаем, что пользователь взаимодействует с полем
         self._magnet_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._magnet_psu_setpoint_auto_update_timer.stop()
-        self._magnet_psu_setpoint_auto_update_timer.start()
         return True
     
     @Slot(float, result=bool)
     def setMagnetPSUTemperature(self, temperature: float) -> bool:
-        """
-        Установка температуры Magnet PSU в регистр 1331
-        
-        Args:
-            temperature: Температура в градусах Цельсия (например, 23.0)
-        
-        Returns:
-            True если успешно, False в противном случае
-        """
-        logger.info(f"🔵 setMagnetPSUTemperature вызван с температурой: {temperature}°C")
-        
-        # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set magnet psu to {temperature:.2f}")
-        
-        if not self._is_connected or self._modbus_client is None:
-            logger.warning("Попытка установки температуры Magnet PSU без подключения")
-            return False
-        
-        # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
-        logger.info(f"🔵 Обновление _magnet_psu_setpoint: {self._magnet_psu_setpoint}°C -> {temperature}°C")
-        self._magnet_psu_setpoint = temperature
-        self.magnetPSUSetpointChanged.emit(temperature)
-        
-        # Преобразуем температуру в значение для регистра (умножаем на 100)
-        register_value = int(temperature * 100)
-        
-        logger.info(f"Установка температуры Magnet PSU: {temperature}°C (регистр 1331 = {register_value})")
-        
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1331_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура Magnet PSU успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру Magnet PSU: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1331", task, {"temperature": temperature})
-        return True
+        """Установка температуры Magnet PSU в регистр 1331"""
+        return self._setTemperatureSetpoint('magnet_psu', temperature)
     
     @Slot(result=bool)
     def increaseMagnetPSUTemperature(self) -> bool:
         """Увеличение заданной температуры Magnet PSU на 1°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Увеличение температуры Magnet PSU: текущее значение = {self._magnet_psu_setpoint}°C")
-        new_temp = self._magnet_psu_setpoint + 1.0
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._magnet_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._magnet_psu_setpoint_auto_update_timer.stop()
-        self._magnet_psu_setpoint_auto_update_timer.start()
-        return self.setMagnetPSUTemperature(new_temp)
+        return self._stepTemperatureSetpoint('magnet_psu', 1)
     
     @Slot(result=bool)
     def decreaseMagnetPSUTemperature(self) -> bool:
         """Уменьшение заданной температуры Magnet PSU на 1°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Уменьшение температуры Magnet PSU: текущее значение = {self._magnet_psu_setpoint}°C")
-        new_temp = self._magnet_psu_setpoint - 1.0
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._magnet_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._magnet_psu_setpoint_auto_update_timer.stop()
-        self._magnet_psu_setpoint_auto_update_timer.start()
-        return self.setMagnetPSUTemperature(new_temp)
+        return self._stepTemperatureSetpoint('magnet_psu', -1)
     
     @Slot(float, result=bool)
     def setLaserPSUSetpointValue(self, temperature: float) -> bool:
@@ -5400,116 +5722,52 @@ class ModbusManager(QObject):
         Обновление внутреннего значения setpoint без отправки на устройство
         Используется для синхронизации при вводе с клавиатуры
         """
-        logger.info(f"Обновление внутреннего значения setpoint Laser PSU: {temperature}°C (было {self._laser_psu_setpoint}°C)")
-        # Всегда обновляем, даже если значение не изменилось (для надежности)
+        # Приводим к разрешению регистра (0.01°C): шаги стрелок не накапливают ошибку float
+        temperature = round(temperature * 100) / 100
+        # Тот же setpoint повторно не эмитируем (лишнее обновление QML), но взаимодействие отмечаем
+        if temperature == self._laser_psu_setpoint:
+            self._laser_psu_setpoint_user_interaction = True
+            return True
+        logger.debug("Обновление внутреннего значения setpoint Laser PSU: %s°C (было %s°C)", temperature, self._laser_psu_setpoint)
         self._laser_psu_setpoint = temperature
         self.laserPSUSetpointChanged.emit(temperature)
-        logger.info(f"✅ Внутреннее значение setpoint Laser PSU обновлено: {self._laser_psu_setpoint}°C")
         # Отмечаем, что пользователь взаимодействует с полем
         self._laser_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления (начнет отсчет заново с 20 секунд)
-        self._laser_psu_setpoint_auto_update_timer.stop()
-        self._laser_psu_setpoint_auto_update_timer.start()
         return True
     
     @Slot(float, result=bool)
     def setLaserPSUTemperature(self, temperature: float) -> bool:
-        """
-        Установка температуры Laser PSU в регистр 1241
-        
-        Args:
-            temperature: Температура в градусах Цельсия (например, 23.0)
-        
-        Returns:
-            True если успешно, False в противном случае
-        """
-        logger.info(f"🔵 setLaserPSUTemperature вызван с температурой: {temperature}°C")
-        
-        # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set laser psu to {temperature:.2f}")
-        
-        if not self._is_connected or self._modbus_client is None:
-            logger.warning("Попытка установки температуры Laser PSU без подключения")
-            return False
-        
-        # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
-        logger.info(f"🔵 Обновление _laser_psu_setpoint: {self._laser_psu_setpoint}°C -> {temperature}°C")
-        self._laser_psu_setpoint = temperature
-        self.laserPSUSetpointChanged.emit(temperature)
-        
-        # Преобразуем температуру в значение для регистра (умножаем на 100)
-        register_value = int(temperature * 100)
-        
-        logger.info(f"Установка температуры Laser PSU: {temperature}°C (регистр 1241 = {register_value})")
-        
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1241_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура Laser PSU успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру Laser PSU: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1241", task, {"temperature": temperature})
-        return True
+        """Установка температуры Laser PSU в регистр 1241"""
+        return self._setTemperatureSetpoint('laser_psu', temperature)
     
     @Slot(result=bool)
     def increaseLaserPSUTemperature(self) -> bool:
         """Увеличение заданной температуры Laser PSU на 0.01°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Увеличение температуры Laser PSU: текущее значение = {self._laser_psu_setpoint}°C")
-        new_temp = self._laser_psu_setpoint + 0.01
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._laser_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._laser_psu_setpoint_auto_update_timer.stop()
-        self._laser_psu_setpoint_auto_update_timer.start()
-        return self.setLaserPSUTemperature(new_temp)
+        return self._stepTemperatureSetpoint('laser_psu', 1)
     
     @Slot(result=bool)
     def decreaseLaserPSUTemperature(self) -> bool:
         """Уменьшение заданной температуры Laser PSU на 0.01°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Уменьшение температуры Laser PSU: текущее значение = {self._laser_psu_setpoint}°C")
-        new_temp = self._laser_psu_setpoint - 0.01
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._laser_psu_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._laser_psu_setpoint_auto_update_timer.stop()
-        self._laser_psu_setpoint_auto_update_timer.start()
-        return self.setLaserPSUTemperature(new_temp)
+        return self._stepTemperatureSetpoint('laser_psu', -1)
     
     @Slot(result=int)
     def getExternalRelays(self) -> int:
         """Получение значения регистра 1020 (External Relays) - НЕ БЛОКИРУЕТ UI"""
-        # Возвращаем кэшированное значение из буфера, чтобы не блокировать UI
-        if 1020 in self._register_cache:
-            return self._register_cache[1020] & 0xFF  # Возвращаем только младший байт
-        # Если значения нет в кэше, возвращаем 0 немедленно
-        # Реальные значения будут обновляться через таймеры чтения
-        return 0
+        # Возвращаем кэшированное значение из буфера (только младший байт), чтобы не блокировать UI.
+        # Если значения нет в кэше - 0; реальные значения будут обновляться через таймеры чтения
+        return self._register_cache.get(1020, 0) & 0xFF
     
     @Slot(result=str)
     def getExternalRelaysBinary(self) -> str:
         """Получение бинарного представления регистра 1020 (External Relays)"""
-        value = self.getExternalRelays()
-        return format(value & 0xFF, '08b')  # 8 бит в бинарном виде
+        return _BIN8[self._register_cache.get(1020, 0) & 0xFF]  # 8 бит в бинарном виде
     
     @Slot(int, result=int)
     def readRegister(self, address: int):
         """Чтение регистра (для использования из QML) - НЕ БЛОКИРУЕТ UI"""
-        # Возвращаем кэшированное значение из буфера, чтобы не блокировать UI
-        if address in self._register_cache:
-            return self._register_cache[address]
-        # Если значения нет в кэше, возвращаем 0 немедленно
-        # Реальные значения будут обновляться через таймеры чтения
-        return 0
+        # Возвращаем кэшированное значение из буфера, чтобы не блокировать UI.
+        # Если значения нет в кэше - 0; реальные значения будут обновляться через таймеры чтения
+        return self._register_cache.get(address, 0)
     
     @Slot(int, int, result=bool)
     def writeRegister(self, address: int, value: int) -> bool:
@@ -5521,15 +5779,16 @@ class ModbusManager(QObject):
         # Оптимистично обновляем кэш, чтобы UI не ждал ответ
         self._register_cache[address] = value
 
-        client = self._modbus_client
+        write = self._modbus_client.write_register
 
         def task() -> bool:
-            result = client.write_register(address, value)
+            result = write(address, value)
             if not result:
                 logger.warning(f"⚠️ Запись в регистр {address} не удалась (value={value}).")
             return bool(result)
 
-        # Неблокирующая отправка в worker; возвращаем True если задача поставлена
+        # Неблокирующая отправка в worker; возвращаем True если задача поставлена,
+        # результат записи придет сигналом registerWriteCompleted
         self._enqueue_write(f"write:{address}", task, {"address": address, "value": value})
         return True
     
@@ -5539,11 +5798,12 @@ class ModbusManager(QObject):
     def setLaserPSU(self, state: bool) -> bool:
         """Управление Laser PSU через регистр 1021 (реле 3, бит 2)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 3")
+        self._updateActionStatus("set 3")
         # Логируем действие
         self._addLog(f"Laser PSU: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['laser_psu'] = state
+        self._relays.states['laser_psu'] = state
+        self._relays.last_bits = None
         self.laserPSUStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5554,11 +5814,12 @@ class ModbusManager(QObject):
     def setMagnetPSU(self, state: bool) -> bool:
         """Управление Magnet PSU через регистр 1021 (реле 2, бит 1)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 2")
+        self._updateActionStatus("set 2")
         # Логируем действие
         self._addLog(f"Magnet PSU: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['magnet_psu'] = state
+        self._relays.states['magnet_psu'] = state
+        self._relays.last_bits = None
         self.magnetPSUStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5569,11 +5830,12 @@ class ModbusManager(QObject):
     def setPIDController(self, state: bool) -> bool:
         """Управление PID Controller через регистр 1021 (реле 6, бит 5)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 6")
+        self._updateActionStatus("set 6")
         # Логируем действие
         self._addLog(f"PID Controller: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['pid_controller'] = state
+        self._relays.states['pid_controller'] = state
+        self._relays.last_bits = None
         self.pidControllerStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5584,11 +5846,12 @@ class ModbusManager(QObject):
     def setWaterChiller(self, state: bool) -> bool:
         """Управление Water Chiller через регистр 1021 (реле 1, бит 0)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 1")
+        self._updateActionStatus("set 1")
         # Логируем действие
         self._addLog(f"Water Chiller: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['water_chiller'] = state
+        self._relays.states['water_chiller'] = state
+        self._relays.last_bits = None
         self.waterChillerStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5616,11 +5879,12 @@ class ModbusManager(QObject):
     def setVacuumPump(self, state: bool) -> bool:
         """Управление Vacuum Pump через регистр 1021 (реле 4, бит 3)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 4")
+        self._updateActionStatus("set 4")
         # Логируем действие
         self._addLog(f"Vacuum Pump: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['vacuum_pump'] = state
+        self._relays.states['vacuum_pump'] = state
+        self._relays.last_bits = None
         self.vacuumPumpStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5631,11 +5895,12 @@ class ModbusManager(QObject):
     def setVacuumGauge(self, state: bool) -> bool:
         """Управление Vacuum Gauge через регистр 1021 (реле 5, бит 4)"""
         # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set 5")
+        self._updateActionStatus("set 5")
         # Логируем действие
         self._addLog(f"Vacuum Gauge: {'ON' if state else 'OFF'}")
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
-        self._relay_states['vacuum_gauge'] = state
+        self._relays.states['vacuum_gauge'] = state
+        self._relays.last_bits = None
         self.vacuumGaugeStateChanged.emit(state)
         # Затем отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if self._is_connected and self._modbus_client is not None:
@@ -5652,59 +5917,31 @@ class ModbusManager(QObject):
             valveIndex: Индекс клапана (5=X6, 6=X7, 7=X8, 8=X9, 9=X10, 10=X11, 11=X12)
             state: True - открыть, False - закрыть
         """
-        if valveIndex < 5 or valveIndex > 11:
-            logger.warning(f"setValve: valveIndex {valveIndex} не поддерживается для регистра 1111 (поддерживаются 5-11)")
+        status_text = _VALVE_STATUS_TEXT.get(valveIndex)
+        if status_text is None:
+            logger.warning("setValve: valveIndex %s не поддерживается для регистра 1111 (поддерживаются 5-11)", valveIndex)
             return False
         
         # Обновляем статус (даже без подключения)
         valve_number = valveIndex - 4  # valveIndex 5 -> X6, valveIndex 6 -> X7, и т.д.
-        self._updateActionStatus(f"set X{valve_number}")
+        self._updateActionStatus(status_text)
         # Логируем действие
         self._addLog(f"Valve X{valve_number}: {'OPEN' if state else 'CLOSED'}")
         
         # ВСЕГДА обновляем UI мгновенно (оптимистичное обновление) ДО проверки подключения
         # Это обеспечивает мгновенную реакцию кнопок даже при подключенном устройстве
-        self._valve_states[valveIndex] = state
+        self._valves.states[valveIndex] = state
+        self._valves.last_bits = None
         self.valveStateChanged.emit(valveIndex, state)
         
         # Отправляем команду на устройство асинхронно через очередь задач (только если подключено)
         if not self._is_connected or self._modbus_client is None:
             return True  # Возвращаем True сразу, так как UI уже обновлен
         
-        # Маппинг: valveIndex -> бит в регистре 1111
-        # X6 (valveIndex 5) -> бит 6
-        # X7 (valveIndex 6) -> бит 7
-        # X8 (valveIndex 7) -> бит 8
-        # X9 (valveIndex 8) -> бит 9
-        # X10 (valveIndex 9) -> бит 10
-        # X11 (valveIndex 10) -> бит 11
-        # X12 (valveIndex 11) -> бит 12
-        
-        # Преобразуем valveIndex в бит в регистре 1111
-        # Если кнопка 9 (valveIndex 8) включает бит 8, значит биты нумеруются с 0
-        # valveIndex 5 (X6) -> бит 5, но пользователь сказал "6,7,8,9,10,11,12 это наши кнопки"
-        # Возможно, биты нумеруются с 1, и нужно valve_bit = valveIndex + 1?
-        # Но тогда valveIndex 8 -> бит 9, а включается бит 8
-        
-        # Попробуем: если кнопка 9 (valveIndex 8) включает бит 8, значит valve_bit = valveIndex
-        # Но тогда кнопка 6 (valveIndex 5) будет бит 5, а не 6
-        
-        # Может быть проблема в том, что биты нумеруются с 0, и кнопка 6 соответствует биту 5?
-        # Но пользователь сказал "6,7,8,9,10,11,12 это наши кнопки", что может означать биты 5-11 (нумерация с 0)
-        # Или биты 6-12 (нумерация с 1)?
-        
-        # Если кнопка 9 (valveIndex 8) включает бит 8, значит используется valveIndex напрямую
-        # valve_bit = valveIndex
-        # Тогда кнопка 6 (valveIndex 5) будет бит 5, что соответствует биту 6 при нумерации с 1
-        # Но в коде мы используем биты с нумерацией с 0, значит бит 5 = 6-й бит
-        
-        # Попробуем: valve_bit = valveIndex (биты нумеруются с 0)
+        # valveIndex -> бит в регистре 1111 (нумерация бит с 0): X6 (valveIndex 5) -> бит 5, ..., X12 (valveIndex 11) -> бит 11
         valve_bit = valveIndex
         
-        # Сразу обновляем буфер и UI для мгновенной реакции (оптимистичное обновление)
-        self._valve_states[valveIndex] = state
-        self.valveStateChanged.emit(valveIndex, state)
-        # Затем отправляем команду на устройство асинхронно через очередь задач
+        # Отправляем команду на устройство асинхронно через очередь задач
         self._setValveAsync(valveIndex, valve_bit, state)
         return True  # Возвращаем True сразу, так как UI уже обновлен
     
@@ -5718,11 +5955,11 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         # Преобразуем напряжение в значение для регистра (умножаем на 100)
-        register_value = int(voltage * 100)
-        client = self._modbus_client
+        register_value = round(voltage * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1221_direct в modbus_client.py
-            result = client.write_holding_register(1221, register_value)
+            result = write(1221, register_value)
             return bool(result)
         self._enqueue_write("1221", task, {"voltage": voltage})
         return True
@@ -5736,10 +5973,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         # Преобразуем ток в значение для регистра (умножаем на 100)
-        register_value = int(current * 100)
-        client = self._modbus_client
+        register_value = round(current * 100)
+        write = self._modbus_client.write_register_1241_direct
         def task() -> bool:
-            result = client.write_register_1241_direct(register_value)
+            result = write(register_value)
             return bool(result)
         self._enqueue_write("1241", task, {"current": current})
         return True
@@ -5753,10 +5990,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         register_value = 1 if state else 0
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1251_direct в modbus_client.py
-            result = client.write_holding_register(1251, register_value)
+            result = write(1251, register_value)
             return bool(result)
         self._enqueue_write("1251", task, {"state": state})
         # Обновляем UI сразу
@@ -5772,11 +6009,11 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         # Преобразуем напряжение в значение для регистра (умножаем на 100)
-        register_value = int(voltage * 100)
-        client = self._modbus_client
+        register_value = round(voltage * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1311_direct в modbus_client.py
-            result = client.write_holding_register(1311, register_value)
+            result = write(1311, register_value)
             return bool(result)
         self._enqueue_write("1311", task, {"voltage": voltage})
         return True
@@ -5790,10 +6027,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         # Преобразуем ток в значение для регистра (умножаем на 100)
-        register_value = int(current * 100)
-        client = self._modbus_client
+        register_value = round(current * 100)
+        write = self._modbus_client.write_register_1331_direct
         def task() -> bool:
-            result = client.write_register_1331_direct(register_value)
+            result = write(register_value)
             return bool(result)
         self._enqueue_write("1331", task, {"current": current})
         return True
@@ -5807,10 +6044,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         register_value = 1 if state else 0
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1341_direct в modbus_client.py
-            result = client.write_holding_register(1341, register_value)
+            result = write(1341, register_value)
             return bool(result)
         self._enqueue_write("1341", task, {"state": state})
         # Обновляем UI сразу
@@ -5849,21 +6086,12 @@ class ModbusManager(QObject):
         
         # Преобразуем температуру в значение для регистра (умножаем на 100)
         # Например, 23.0°C -> 2300
-        register_value = int(temperature * 100)
+        register_value = round(temperature * 100)
         
         logger.info(f"Установка температуры PID Controller: {temperature}°C (регистр 1421 = {register_value})")
         
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1421_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура PID Controller успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру PID Controller: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1421_pid", task, {"temperature": temperature})
+        task = partial(_write_temperature_setpoint, self._modbus_client.write_register_1421_direct, "PID Controller", register_value, temperature)
+        self._enqueue_write("1421_pid", task, {"temperature": temperature}, coalesce=True)
         return True
     
     @Slot(result=bool)
@@ -5871,14 +6099,12 @@ class ModbusManager(QObject):
         """Увеличение заданной температуры PID Controller на 1°C"""
         if not self._is_connected:
             return False
-        logger.debug(f"Увеличение температуры PID Controller: текущее значение = {self._pid_controller_setpoint}°C")
-        new_temp = self._pid_controller_setpoint + 1.0
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
+        current = self._pid_controller_setpoint
+        new_temp = current + 1.0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Увеличение температуры PID Controller: %s°C -> %s°C", current, new_temp)
         # Отмечаем, что пользователь взаимодействует с полем
         self._pid_controller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._pid_controller_setpoint_auto_update_timer.stop()
-        self._pid_controller_setpoint_auto_update_timer.start()
         return self.setPIDControllerTemperature(new_temp)
     
     @Slot(result=bool)
@@ -5886,14 +6112,12 @@ class ModbusManager(QObject):
         """Уменьшение заданной температуры PID Controller на 1°C"""
         if not self._is_connected:
             return False
-        logger.debug(f"Уменьшение температуры PID Controller: текущее значение = {self._pid_controller_setpoint}°C")
-        new_temp = self._pid_controller_setpoint - 1.0
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
+        current = self._pid_controller_setpoint
+        new_temp = current - 1.0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Уменьшение температуры PID Controller: %s°C -> %s°C", current, new_temp)
         # Отмечаем, что пользователь взаимодействует с полем
         self._pid_controller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._pid_controller_setpoint_auto_update_timer.stop()
-        self._pid_controller_setpoint_auto_update_timer.start()
         return self.setPIDControllerTemperature(new_temp)
     
     @Slot(bool, result=bool)
@@ -5905,10 +6129,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         register_value = 1 if state else 0
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1431_direct в modbus_client.py
-            result = client.write_holding_register(1431, register_value)
+            result = write(1431, register_value)
             return bool(result)
         self._enqueue_write("1431", task, {"state": state})
         # Обновляем UI сразу
@@ -5919,81 +6143,20 @@ class ModbusManager(QObject):
     # ===== Water Chiller методы записи =====
     @Slot(float, result=bool)
     def setWaterChillerTemperature(self, temperature: float) -> bool:
-        """
-        Установка заданной температуры Water Chiller в регистр 1531
-        
-        Args:
-            temperature: Температура в градусах Цельсия (например, 23.0)
-        
-        Returns:
-            True если успешно, False в противном случае
-        """
+        """Установка заданной температуры Water Chiller в регистр 1531"""
         # Логируем действие
         self._addLog(f"Water Chiller Temperature: {temperature}°C")
-        logger.info(f"🔵 setWaterChillerTemperature вызван с температурой: {temperature}°C")
-        
-        # Обновляем статус (даже без подключения)
-        self._updateActionStatus(f"set water chiller to {temperature:.2f}")
-        
-        if not self._is_connected or self._modbus_client is None:
-            logger.warning("Попытка установки температуры Water Chiller без подключения")
-            return False
-        
-        # Обновляем внутреннее значение setpoint сразу (до отправки на устройство)
-        logger.info(f"🔵 Обновление _water_chiller_setpoint: {self._water_chiller_setpoint}°C -> {temperature}°C")
-        self._water_chiller_setpoint = temperature
-        # Отправляем сигнал для обновления UI (setpoint)
-        logger.info(f"🔵 Эмитируем сигнал waterChillerSetpointChanged: {temperature}°C")
-        self.waterChillerSetpointChanged.emit(temperature)
-        
-        # Преобразуем температуру в значение для регистра (умножаем на 100)
-        # Например, 23.0°C -> 2300
-        register_value = int(temperature * 100)
-        
-        logger.info(f"Установка температуры Water Chiller: {temperature}°C (регистр 1531 = {register_value})")
-        
-        client = self._modbus_client
-
-        def task() -> bool:
-            result = client.write_register_1531_direct(register_value)
-            if result:
-                logger.info(f"✅ Заданная температура Water Chiller успешно установлена: {temperature}°C")
-            else:
-                logger.error(f"❌ Не удалось установить заданную температуру Water Chiller: {temperature}°C")
-            return bool(result)
-
-        self._enqueue_write("1531", task, {"temperature": temperature})
-        return True
+        return self._setTemperatureSetpoint('water_chiller', temperature)
     
     @Slot(result=bool)
     def increaseWaterChillerTemperature(self) -> bool:
         """Увеличение заданной температуры Water Chiller на 1°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Увеличение температуры Water Chiller: текущее значение = {self._water_chiller_setpoint}°C")
-        new_temp = self._water_chiller_setpoint + 1.0
-        logger.debug(f"Новое значение после увеличения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._water_chiller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._water_chiller_setpoint_auto_update_timer.stop()
-        self._water_chiller_setpoint_auto_update_timer.start()
-        return self.setWaterChillerTemperature(new_temp)
+        return self._stepTemperatureSetpoint('water_chiller', 1)
     
     @Slot(result=bool)
     def decreaseWaterChillerTemperature(self) -> bool:
         """Уменьшение заданной температуры Water Chiller на 1°C"""
-        if not self._is_connected:
-            return False
-        logger.debug(f"Уменьшение температуры Water Chiller: текущее значение = {self._water_chiller_setpoint}°C")
-        new_temp = self._water_chiller_setpoint - 1.0
-        logger.debug(f"Новое значение после уменьшения: {new_temp}°C")
-        # Отмечаем, что пользователь взаимодействует с полем
-        self._water_chiller_setpoint_user_interaction = True
-        # Перезапускаем таймер автообновления
-        self._water_chiller_setpoint_auto_update_timer.stop()
-        self._water_chiller_setpoint_auto_update_timer.start()
-        return self.setWaterChillerTemperature(new_temp)
+        return self._stepTemperatureSetpoint('water_chiller', -1)
     
     @Slot(bool, result=bool)
     def setLaserBeam(self, state: bool) -> bool:
@@ -6009,10 +6172,10 @@ class ModbusManager(QObject):
         self.laserBeamStateChanged.emit(state)
         
         register_value = 1 if state else 0
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         
         def task() -> bool:
-            result = client.write_holding_register(1811, register_value)
+            result = write(1811, register_value)
             if not result:
                 logger.warning(f"⚠️ Запись Laser Beam в регистр 1811 не удалась (value={register_value}).")
             return bool(result)
@@ -6029,10 +6192,10 @@ class ModbusManager(QObject):
         self._seop_laser_max_temp = temperature
         self._seop_laser_max_temp_user_interaction = True
         self.seopLaserMaxTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3011, register_value)
+            result = write(3011, register_value)
             return bool(result)
         self._enqueue_write("seop_laser_max_temp", task, {"temperature": temperature})
         return True
@@ -6055,10 +6218,10 @@ class ModbusManager(QObject):
         self._seop_laser_min_temp = temperature
         self._seop_laser_min_temp_user_interaction = True
         self.seopLaserMinTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3021, register_value)
+            result = write(3021, register_value)
             return bool(result)
         self._enqueue_write("seop_laser_min_temp", task, {"temperature": temperature})
         return True
@@ -6081,10 +6244,10 @@ class ModbusManager(QObject):
         self._seop_cell_max_temp = temperature
         self._seop_cell_max_temp_user_interaction = True
         self.seopCellMaxTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3031, register_value)
+            result = write(3031, register_value)
             return bool(result)
         self._enqueue_write("seop_cell_max_temp", task, {"temperature": temperature})
         return True
@@ -6107,10 +6270,10 @@ class ModbusManager(QObject):
         self._seop_cell_min_temp = temperature
         self._seop_cell_min_temp_user_interaction = True
         self.seopCellMinTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3041, register_value)
+            result = write(3041, register_value)
             return bool(result)
         self._enqueue_write("seop_cell_min_temp", task, {"temperature": temperature})
         return True
@@ -6133,10 +6296,10 @@ class ModbusManager(QObject):
         self._seop_ramp_temp = temperature
         self._seop_ramp_temp_user_interaction = True
         self.seopRampTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3051, register_value)
+            result = write(3051, register_value)
             return bool(result)
         self._enqueue_write("seop_ramp_temp", task, {"temperature": temperature})
         return True
@@ -6159,10 +6322,10 @@ class ModbusManager(QObject):
         self._seop_temp = temperature
         self._seop_temp_user_interaction = True
         self.seopTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3061, register_value)
+            result = write(3061, register_value)
             return bool(result)
         self._enqueue_write("seop_temp", task, {"temperature": temperature})
         return True
@@ -6185,10 +6348,10 @@ class ModbusManager(QObject):
         self._seop_cell_refill_temp = temperature
         self._seop_cell_refill_temp_user_interaction = True
         self.seopCellRefillTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3071, register_value)
+            result = write(3071, register_value)
             return bool(result)
         self._enqueue_write("seop_cell_refill_temp", task, {"temperature": temperature})
         return True
@@ -6212,9 +6375,9 @@ class ModbusManager(QObject):
         self._seop_loop_time_user_interaction = True
         self.seopLoopTimeChanged.emit(time_seconds)
         register_value = int(time_seconds)  # Время в секундах - целое число
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3081, register_value)
+            result = write(3081, register_value)
             return bool(result)
         self._enqueue_write("seop_loop_time", task, {"time_seconds": time_seconds})
         return True
@@ -6304,9 +6467,9 @@ class ModbusManager(QObject):
         self._seop_process_duration_user_interaction = True
         self.seopProcessDurationChanged.emit(duration_seconds)
         register_value = int(duration_seconds)  # В секундах - целое число
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3091, register_value)
+            result = write(3091, register_value)
             return bool(result)
         self._enqueue_write("seop_process_duration", task, {"duration_seconds": duration_seconds})
         return True
@@ -6329,10 +6492,10 @@ class ModbusManager(QObject):
         self._seop_laser_max_output_power = power_w
         self._seop_laser_max_output_power_user_interaction = True
         self.seopLaserMaxOutputPowerChanged.emit(power_w)
-        register_value = int(power_w * 100)
-        client = self._modbus_client
+        register_value = round(power_w * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3101, register_value)
+            result = write(3101, register_value)
             return bool(result)
         self._enqueue_write("seop_laser_max_output_power", task, {"power_w": power_w})
         return True
@@ -6355,10 +6518,10 @@ class ModbusManager(QObject):
         self._seop_laser_psu_max_current = current_a
         self._seop_laser_psu_max_current_user_interaction = True
         self.seopLaserPSUMaxCurrentChanged.emit(current_a)
-        register_value = int(current_a * 100)
-        client = self._modbus_client
+        register_value = round(current_a * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3111, register_value)
+            result = write(3111, register_value)
             return bool(result)
         self._enqueue_write("seop_laser_psu_max_current", task, {"current_a": current_a})
         return True
@@ -6381,10 +6544,10 @@ class ModbusManager(QObject):
         self._seop_water_chiller_max_temp = temperature
         self._seop_water_chiller_max_temp_user_interaction = True
         self.seopWaterChillerMaxTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3121, register_value)
+            result = write(3121, register_value)
             return bool(result)
         self._enqueue_write("seop_water_chiller_max_temp", task, {"temperature": temperature})
         return True
@@ -6407,10 +6570,10 @@ class ModbusManager(QObject):
         self._seop_water_chiller_min_temp = temperature
         self._seop_water_chiller_min_temp_user_interaction = True
         self.seopWaterChillerMinTempChanged.emit(temperature)
-        register_value = int(temperature * 100)
-        client = self._modbus_client
+        register_value = round(temperature * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3131, register_value)
+            result = write(3131, register_value)
             return bool(result)
         self._enqueue_write("seop_water_chiller_min_temp", task, {"temperature": temperature})
         return True
@@ -6434,9 +6597,9 @@ class ModbusManager(QObject):
         self._seop_xe_concentration_user_interaction = True
         self.seopXeConcentrationChanged.emit(concentration_mmol)
         register_value = int(concentration_mmol)  # Уже в mMol, целое число
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3141, register_value)
+            result = write(3141, register_value)
             return bool(result)
         self._enqueue_write("seop_xe_concentration", task, {"concentration_mmol": concentration_mmol})
         return True
@@ -6459,10 +6622,10 @@ class ModbusManager(QObject):
         self._seop_water_proton_concentration = concentration_mol
         self._seop_water_proton_concentration_user_interaction = True
         self.seopWaterProtonConcentrationChanged.emit(concentration_mol)
-        register_value = int(concentration_mol * 100)
-        client = self._modbus_client
+        register_value = round(concentration_mol * 100)
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3151, register_value)
+            result = write(3151, register_value)
             return bool(result)
         self._enqueue_write("seop_water_proton_concentration", task, {"concentration_mol": concentration_mol})
         return True
@@ -6543,9 +6706,9 @@ class ModbusManager(QObject):
         self._seop_cell_number_user_interaction = True
         self.seopCellNumberChanged.emit(cell_number)
         register_value = int(cell_number)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3171, register_value)
+            result = write(3171, register_value)
             return bool(result)
         self._enqueue_write("seop_cell_number", task, {"cell_number": cell_number})
         return True
@@ -6569,9 +6732,9 @@ class ModbusManager(QObject):
         self._seop_refill_cycle_user_interaction = True
         self.seopRefillCycleChanged.emit(refill_cycle)
         register_value = int(refill_cycle)
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
-            result = client.write_holding_register(3181, register_value)
+            result = write(3181, register_value)
             return bool(result)
         self._enqueue_write("seop_refill_cycle", task, {"refill_cycle": refill_cycle})
         return True
@@ -6620,10 +6783,10 @@ class ModbusManager(QObject):
         if not self._is_connected or self._modbus_client is None:
             return False
         register_value = 1 if state else 0
-        client = self._modbus_client
+        write = self._modbus_client.write_holding_register
         def task() -> bool:
             # TODO: добавить метод write_register_1541_direct в modbus_client.py
-            result = client.write_holding_register(1541, register_value)
+            result = write(1541, register_value)
             return bool(result)
         self._enqueue_write("1541", task, {"state": state})
         # Обновляем UI сразу